@@ -1,5 +1,14 @@
 import os
-from flask import Flask, render_template, jsonify, send_from_directory
+import click
+from flask import Flask, render_template, jsonify, send_from_directory, request
+
+from config import Config
+from application.db import init_db, get_db
+from application.jobs import fetch_jobs_page, page_args
+from application.matching import init_matching, get_match_index, match_jobs
+from application.migrations import migrate
+from application.search import search_args, search_jobs
+from application.semantic import SemanticUnavailable, get_semantic, init_semantic
 
 def create_app():
     base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -7,6 +16,30 @@ def create_app():
     app = Flask(__name__,
                 template_folder=os.path.join(base_dir, 'templates'),
                 static_folder=os.path.join(base_dir, 'static'))
+    app.config.from_object(Config)
+    db = init_db(app)
+    init_matching(app, db)
+    init_semantic(app, db)
+
+    from application.pages import bp as pages_bp
+    app.register_blueprint(pages_bp, url_prefix='/jobs')
+
+    @app.cli.command('migrate')
+    def migrate_command():
+        """Apply pending schema migrations"""
+        applied = migrate(get_db().engine, log=click.echo)
+        if not applied:
+            click.echo("Schema is up to date")
+
+    @app.cli.command('index-jobs')
+    @click.option('--batch-size', default=10000, show_default=True, help='Jobs embedded per batch')
+    def index_jobs_command(batch_size):
+        """Embed jobs added since the last run into the semantic index"""
+        try:
+            added = get_semantic().sync(batch_size, log=click.echo)
+        except SemanticUnavailable as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Indexed {added} new jobs" if added else "Semantic index is up to date")
 
     @app.route('/')
     def home():
@@ -15,7 +48,60 @@ def create_app():
 
     @app.route('/api/jobs')
     def get_jobs():
-        return jsonify({'jobs': []})
+        # ?q= is a ranked full-text search; otherwise the /jobs/ board's keyset listing
+        if request.args.get('q', '').strip():
+            q, page, limit, match = search_args(request.args)
+            with get_db().connection() as conn:
+                return jsonify(search_jobs(conn, q, page, limit, match))
+
+        cursor, limit, filters = page_args(request.args)
+        with get_db().connection() as conn:
+            jobs, next_cursor = fetch_jobs_page(conn, cursor, limit, **filters)
+        return jsonify({'jobs': jobs, 'next_cursor': next_cursor, 'limit': limit})
+    
+    @app.route('/api/jobs/match', methods=['POST'])
+    def match():
+        # Server-side ranking of every job against a parsed resume
+        payload = request.get_json(silent=True) or {}
+        resume_data = payload.get('resume_data') or {}
+        if not resume_data.get('skills') and not resume_data.get('category'):
+            return jsonify({'error': 'resume_data with skills or category is required'}), 400
+        try:
+            limit = int(payload.get('limit', 20))
+        except (TypeError, ValueError):
+            limit = 20
+        return jsonify(match_jobs(get_match_index(), resume_data, payload.get('q') or '', limit))
+
+    @app.route('/api/jobs/semantic-match', methods=['POST'])
+    def semantic_match():
+        # Nearest jobs by meaning (FAISS); 503 until the index is built
+        payload = request.get_json(silent=True) or {}
+        resume_data = payload.get('resume_data') or {}
+        if not resume_data.get('skills') and not resume_data.get('category'):
+            return jsonify({'error': 'resume_data with skills or category is required'}), 400
+        try:
+            limit = int(payload.get('limit', 20))
+        except (TypeError, ValueError):
+            limit = 20
+        try:
+            return jsonify(get_semantic().match(
+                resume_data, payload.get('q') or '', limit,
+                company=payload.get('company'), location=payload.get('location')
+            ))
+        except SemanticUnavailable as e:
+            return jsonify({'error': str(e)}), 503
+
+    @app.route('/api/jobs/semantic/stats')
+    def semantic_stats():
+        return jsonify(get_semantic().stats())
+
+    @app.route('/api/jobs/match/stats')
+    def match_stats():
+        return jsonify(get_match_index().stats())
+
+    @app.route('/api/db/stats')
+    def db_stats():
+        return jsonify(get_db().pool_stats())
     
     @app.route('/style.css')
     def serve_style():
@@ -0,0 +1,125 @@
+"""
+Shared, size-bounded MySQL connection pool for the job board.
+
+The pages used to open a new mysql.connector connection for every request and
+close it after one query, so connection setup dominated latency and a burst
+of viewers could exhaust the server's connection limit. init_db attaches one
+SQLAlchemy engine per app, built from Config.SQLALCHEMY_DATABASE_URI, whose
+QueuePool pre-pings connections before handing them out and recycles them
+before the server's idle timeout. The engine is created on first use so the
+app still starts without database settings.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app
+from sqlalchemy import create_engine, event
+
+from common.metrics import LatencyStats
+
+
+class PoolStats:
+    """Checkout latency and contention counters for one engine's pool."""
+
+    def __init__(self, window=500):
+        self.checkout_latency = LatencyStats(window)
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.connects = 0
+        self.invalidated = 0
+
+    def attach(self, engine):
+        @event.listens_for(engine, 'connect')
+        def on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, 'invalidate')
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidated += 1
+
+    def record_checkout(self, seconds, waited):
+        self.checkout_latency.add(seconds)
+        with self._lock:
+            self.checkouts += 1
+            if waited:
+                self.waits += 1
+
+
+class Database:
+    """Lazily created engine plus its pool statistics."""
+
+    def __init__(self, config):
+        self.config = config
+        self.stats = PoolStats()
+        self._engine = None
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    engine = create_engine(
+                        self.config['SQLALCHEMY_DATABASE_URI'],
+                        pool_size=self.config['DB_POOL_SIZE'],
+                        max_overflow=self.config['DB_MAX_OVERFLOW'],
+                        pool_timeout=self.config['DB_POOL_TIMEOUT'],
+                        pool_recycle=self.config['DB_POOL_RECYCLE'],
+                        pool_pre_ping=True,
+                    )
+                    self.stats.attach(engine)
+                    self._engine = engine
+        return self._engine
+
+    @contextmanager
+    def connection(self):
+        """Check a pooled connection out for the duration of the block"""
+        engine = self.engine
+        pool = engine.pool
+        # Every pooled and overflow slot taken: this checkout will queue
+        waited = pool.checkedout() >= pool.size() + max(0, self.config['DB_MAX_OVERFLOW'])
+        started = time.perf_counter()
+        conn = engine.connect()
+        self.stats.record_checkout(time.perf_counter() - started, waited)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def dispose(self):
+        """Close every pooled connection (process shutdown)"""
+        if self._engine is not None:
+            self._engine.dispose()
+
+    def pool_stats(self):
+        stats = {
+            'checkouts': self.stats.checkouts,
+            'waits': self.stats.waits,
+            'connects': self.stats.connects,
+            'invalidated': self.stats.invalidated,
+            'checkout_ms': self.stats.checkout_latency.summary(),
+        }
+        if self._engine is not None:
+            pool = self._engine.pool
+            stats.update({
+                'size': pool.size(),
+                'in_use': pool.checkedout(),
+                'idle': pool.checkedin(),
+                'overflow': max(0, pool.overflow()),
+            })
+        return stats
+
+
+def init_db(app):
+    """Attach the shared Database to app (one pool per app)"""
+    db = Database(app.config)
+    app.extensions['db'] = db
+    return db
+
+
+def get_db():
+    return current_app.extensions['db']
@@ -1,36 +1,123 @@
+import argparse
+import os
+import sqlite3
+import time
+
 import pandas as pd
 import mysql.connector
-import os
 
-def insert_csv_to_mysql(csv_path):
-    df = pd.read_csv(csv_path)
+# CSV column -> (jobs column, default when the cell is empty)
+COLUMNS = [
+    ('Title', 'title', 'Unknown'),
+    ('Company', 'company', 'Unknown'),
+    ('Location', 'location', 'Unknown'),
+    ('Apply Link', 'apply_link', 'Not Available'),
+]
+APPLY_LINK_MAX = 1024
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    apply_link TEXT
+)
+"""
+
 
-    conn = mysql.connector.connect(
+def mysql_connection():
+    return mysql.connector.connect(
         host=os.getenv('DB_HOST'),
         user=os.getenv('DB_USER'),
         password=os.getenv('DB_PASSWORD'),
         database=os.getenv('DB_NAME'),
         port=int(os.getenv('DB_PORT'))
     )
+
+
+def sqlite_connection(path):
+    conn = sqlite3.connect(path)
+    conn.execute(SQLITE_SCHEMA)
+    return conn
+
+
+def iter_row_batches(csv_path, batch_size, chunk_size):
+    """Stream the CSV in pandas chunks and yield lists of INSERT tuples"""
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+        columns = []
+        for csv_name, _, default in COLUMNS:
+            values = chunk[csv_name] if csv_name in chunk else pd.Series(default, index=chunk.index)
+            columns.append(values.where(values != '', default))
+        rows = list(zip(*columns))
+        rows = [row[:-1] + (row[-1][:APPLY_LINK_MAX],) for row in rows]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+
+def bulk_import_csv(csv_path, conn, placeholder='%s', batch_size=1000, chunk_size=10000, verbose=True):
+    """Insert every CSV row into jobs with executemany, committing every batch.
+
+    mysql-connector rewrites executemany INSERTs into multi-row VALUES, and
+    sqlite3 runs them as one prepared statement, so a batch is a single round
+    trip either way. Returns row count, elapsed seconds and rows/sec.
+    """
+    names = ', '.join(column for _, column, _ in COLUMNS)
+    marks = ', '.join([placeholder] * len(COLUMNS))
+    sql = f"INSERT INTO jobs ({names}) VALUES ({marks})"
+
     cursor = conn.cursor()
+    total = 0
+    started = time.perf_counter()
+    try:
+        for batch in iter_row_batches(csv_path, batch_size, chunk_size):
+            cursor.executemany(sql, batch)
+            conn.commit()
+            total += len(batch)
+            if verbose:
+                elapsed = time.perf_counter() - started
+                print(f"Committed {total} rows ({total / elapsed:,.0f} rows/sec)")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        'rows': total,
+        'seconds': round(elapsed, 3),
+        'rows_per_sec': round(total / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def insert_csv_to_mysql(csv_path, batch_size=1000, chunk_size=10000):
+    conn = mysql_connection()
+    try:
+        return bulk_import_csv(csv_path, conn, '%s', batch_size, chunk_size)
+    finally:
+        conn.close()
+
+
+def insert_csv_to_sqlite(csv_path, db_path, batch_size=1000, chunk_size=10000):
+    conn = sqlite_connection(db_path)
+    try:
+        return bulk_import_csv(csv_path, conn, '?', batch_size, chunk_size)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bulk-import a job listings CSV into the jobs table")
+    parser.add_argument('csv_path')
+    parser.add_argument('--backend', choices=['mysql', 'sqlite'], default='mysql')
+    parser.add_argument('--sqlite-path', default='jobs.db')
+    parser.add_argument('--batch-size', type=int, default=1000, help="rows per INSERT batch and commit")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="CSV rows read per chunk")
+    args = parser.parse_args()
 
-    for _, row in df.iterrows():
-        apply_link = row.get('Apply Link', 'Not Available')
-        if len(apply_link) > 1024:
-            apply_link = apply_link[:1024]
-
-        cursor.execute("""
-    INSERT INTO jobs (title, company, location, apply_link)
-    VALUES (%s, %s, %s, %s)""",
-    (
-    row.get('Title', 'Unknown'),
-    row.get('Company', 'Unknown'),
-    row.get('Location', 'Unknown'),
-    row.get('Apply Link', 'Not Available')[:1024]
-    ))
-
-        print(f"Inserted: {row.get('Title', 'Unknown')} at {row.get('Company', 'Unknown')}")
-
-    conn.commit()
-    cursor.close()
-    conn.close()
+    if args.backend == 'sqlite':
+        result = insert_csv_to_sqlite(args.csv_path, args.sqlite_path, args.batch_size, args.chunk_size)
+    else:
+        result = insert_csv_to_mysql(args.csv_path, args.batch_size, args.chunk_size)
+    print(f"Imported {result['rows']} rows in {result['seconds']}s ({result['rows_per_sec']:,.0f} rows/sec)")
@@ -0,0 +1,64 @@
+"""
+Keyset-paginated job listing query shared by the HTML board and /api/jobs.
+
+Pages are cut by ``id > cursor ORDER BY id LIMIT n`` instead of loading the
+whole table (or using OFFSET, which still walks every skipped row), so each
+page costs the same index range scan however deep it is and however large the
+table grows. Optional filters: exact company and location, title prefix.
+"""
+from sqlalchemy import text
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+FILTERS = ('company', 'location', 'title')
+
+
+def _like_prefix(value):
+    # '!' is the escape character in both MySQL and SQLite when declared
+    escaped = value.replace('!', '!!').replace('%', '!%').replace('_', '!_')
+    return escaped + '%'
+
+
+def page_args(args):
+    """Cursor, page size and filters from request query parameters"""
+    try:
+        cursor = int(args.get('cursor')) if args.get('cursor') else None
+    except ValueError:
+        cursor = None
+    try:
+        limit = int(args.get('limit', PAGE_SIZE))
+    except ValueError:
+        limit = PAGE_SIZE
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    filters = {name: args.get(name, '').strip() for name in FILTERS}
+    return cursor, limit, {name: value for name, value in filters.items() if value}
+
+
+def fetch_jobs_page(conn, cursor=None, limit=PAGE_SIZE, company=None, location=None, title=None):
+    """One page of jobs after cursor; returns (jobs, next_cursor or None)"""
+    clauses = []
+    params = {'limit': limit + 1}
+    if cursor is not None:
+        clauses.append("id > :cursor")
+        params['cursor'] = cursor
+    if company:
+        clauses.append("company = :company")
+        params['company'] = company
+    if location:
+        clauses.append("location = :location")
+        params['location'] = location
+    if title:
+        clauses.append("title LIKE :title ESCAPE '!'")
+        params['title'] = _like_prefix(title)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    sql = text(
+        f"SELECT id, title, company, location, apply_link FROM jobs {where} ORDER BY id LIMIT :limit"
+    )
+    # One extra row tells us whether another page exists
+    jobs = [dict(row) for row in conn.execute(sql, params).mappings()]
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = jobs[-1]['id']
+    return jobs, next_cursor
@@ -1,14 +1,43 @@
 import os
-from fastapi import FastAPI
+import sys
+from pathlib import Path
+
+from fastapi import Body, FastAPI, Query
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
 
+# Run as `uvicorn main:app` from this directory: make the repo root importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+from application.db import Database
+from application.jobs import fetch_jobs_page, page_args
+from application.matching import MatchIndex, match_jobs
+from application.semantic import SemanticSearch, SemanticUnavailable
+from application.search import search_args, search_jobs
+
 def create_app():
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
     app = FastAPI()
+    config = {name: getattr(Config, name) for name in dir(Config) if name.isupper()}
+    db = Database(config)
+    match_index = MatchIndex(config, db)
+    semantic = SemanticSearch(config, db)
+
+    @app.on_event("startup")
+    def map_semantic_index():
+        try:
+            if semantic.index_path.exists():
+                semantic.load()
+        except SemanticUnavailable:
+            pass
+
+    @app.on_event("shutdown")
+    def close_db():
+        db.dispose()
 
     app.mount("/static", StaticFiles(directory=os.path.join(base_dir, "static")), name="static")
 
@@ -18,9 +47,62 @@ def create_app():
     async def home(request: Request):
         return templates.TemplateResponse("pages/index.html", {"request": request})
     
+    # Sync handlers: FastAPI runs them in its threadpool so the blocking
+    # database calls don't stall the event loop
     @app.get("/api/jobs")
-    async def get_jobs():
-        return JSONResponse({"jobs": []})
+    def get_jobs(request: Request, q: str = Query("")):
+        # ?q= is a ranked full-text search; otherwise the keyset listing
+        if q.strip():
+            q, page, limit, match = search_args(request.query_params)
+            with db.connection() as conn:
+                return JSONResponse(search_jobs(conn, q, page, limit, match))
+
+        cursor, limit, filters = page_args(request.query_params)
+        with db.connection() as conn:
+            jobs, next_cursor = fetch_jobs_page(conn, cursor, limit, **filters)
+        return JSONResponse({"jobs": jobs, "next_cursor": next_cursor, "limit": limit})
+
+    @app.post("/api/jobs/match")
+    def match(payload: dict = Body(...)):
+        # Server-side ranking of every job against a parsed resume
+        resume_data = payload.get("resume_data") or {}
+        if not resume_data.get("skills") and not resume_data.get("category"):
+            return JSONResponse({"error": "resume_data with skills or category is required"}, status_code=400)
+        try:
+            limit = int(payload.get("limit", 20))
+        except (TypeError, ValueError):
+            limit = 20
+        return JSONResponse(match_jobs(match_index, resume_data, payload.get("q") or "", limit))
+
+    @app.post("/api/jobs/semantic-match")
+    def semantic_match(payload: dict = Body(...)):
+        # Nearest jobs by meaning (FAISS); 503 until the index is built
+        resume_data = payload.get("resume_data") or {}
+        if not resume_data.get("skills") and not resume_data.get("category"):
+            return JSONResponse({"error": "resume_data with skills or category is required"}, status_code=400)
+        try:
+            limit = int(payload.get("limit", 20))
+        except (TypeError, ValueError):
+            limit = 20
+        try:
+            return JSONResponse(semantic.match(
+                resume_data, payload.get("q") or "", limit,
+                company=payload.get("company"), location=payload.get("location")
+            ))
+        except SemanticUnavailable as e:
+            return JSONResponse({"error": str(e)}, status_code=503)
+
+    @app.get("/api/jobs/semantic/stats")
+    def semantic_stats():
+        return JSONResponse(semantic.stats())
+
+    @app.get("/api/jobs/match/stats")
+    def match_stats():
+        return JSONResponse(match_index.stats())
+
+    @app.get("/api/db/stats")
+    def db_stats():
+        return JSONResponse(db.pool_stats())
 
     @app.get("/style.css")
     async def serve_style():
@@ -0,0 +1,124 @@
+"""
+Resume-to-job matching for the job board (POST /api/jobs/match).
+
+Jobs are read from the database once and vectorized into a
+common.job_matcher.JobMatcher held by the app's MatchIndex. Requests check the
+jobs table's (count, max id) at most every MATCH_REFRESH_SECONDS and rebuild
+the matcher only when that changes; scoring itself never touches the database.
+"""
+import logging
+import os
+import pickle
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import text
+
+from application.resume_parser import SKILL_MATCHER
+from common.job_matcher import JobMatcher
+from common.model_registry import restore_idf
+
+MAX_RESULTS = 100
+
+logger = logging.getLogger(__name__)
+
+
+def job_text(job):
+    return ' '.join(filter(None, (job['title'], job['company'], job['location'])))
+
+
+def resume_text(resume_data, q=''):
+    """Text a parsed resume is matched on: its role, skills and the search terms"""
+    parts = [resume_data.get('category') or '', ' '.join(resume_data.get('skills') or []), q]
+    return ' '.join(part for part in parts if part)
+
+
+def load_vectorizer(path):
+    """The categorization TF-IDF vectorizer, or None to fit one on the jobs"""
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return restore_idf(pickle.load(f))
+    return None
+
+
+class MatchIndex:
+    """The current JobMatcher plus the table version it was built from."""
+
+    def __init__(self, config, db):
+        self.config = config
+        self.db = db
+        self.matcher = None
+        self.version = None
+        self.checked_at = 0.0
+        self.builds = 0
+        self._vectorizer = None
+        self._lock = threading.Lock()
+
+    def _table_version(self, conn):
+        return tuple(conn.execute(text("SELECT COUNT(*), MAX(id) FROM jobs")).one())
+
+    def _build(self, conn, version):
+        if self._vectorizer is None:
+            self._vectorizer = load_vectorizer(self.config['MATCH_VECTORIZER_PATH'])
+        rows = conn.execute(text("SELECT id, title, company, location, apply_link FROM jobs ORDER BY id"))
+        jobs = [dict(row) for row in rows.mappings()]
+        matcher = JobMatcher(self._vectorizer, SKILL_MATCHER, self.config['MATCH_SKILL_WEIGHT'])
+        matcher.fit(jobs, job_text)
+        logger.info(f"Built job match index: {len(jobs)} jobs in {matcher.build_seconds * 1000:.0f} ms")
+        self.matcher, self.version = matcher, version
+        self.builds += 1
+
+    def current(self):
+        """The matcher for the jobs table as of at most MATCH_REFRESH_SECONDS ago"""
+        if self.matcher is not None and time.monotonic() - self.checked_at < self.config['MATCH_REFRESH_SECONDS']:
+            return self.matcher
+        with self._lock:
+            if self.matcher is None or time.monotonic() - self.checked_at >= self.config['MATCH_REFRESH_SECONDS']:
+                with self.db.connection() as conn:
+                    version = self._table_version(conn)
+                    if version != self.version:
+                        self._build(conn, version)
+                self.checked_at = time.monotonic()
+        return self.matcher
+
+    def stats(self):
+        matcher = self.matcher
+        return {
+            'jobs': len(matcher.jobs) if matcher else 0,
+            'features': matcher.matrix.shape[1] if matcher else 0,
+            'nnz': int(matcher.matrix.nnz) if matcher else 0,
+            'builds': self.builds,
+            'build_ms': round(matcher.build_seconds * 1000, 1) if matcher else None,
+        }
+
+
+def init_matching(app, db):
+    index = MatchIndex(app.config, db)
+    app.extensions['job_match'] = index
+    return index
+
+
+def get_match_index():
+    return current_app.extensions['job_match']
+
+
+def match_jobs(index, resume_data, q='', limit=20):
+    """Ranked jobs for a parsed resume, with scores and the skills they share"""
+    started = time.perf_counter()
+    matcher = index.current()
+    skills = resume_data.get('skills') or []
+    indices, scores = matcher.top_k(resume_text(resume_data, q), skills, max(1, min(limit, MAX_RESULTS)))
+
+    jobs = []
+    for i, score in zip(indices, scores):
+        job = dict(matcher.jobs[i])
+        job['score'] = round(float(score), 4)
+        job['match_percentage'] = round(float(score) * 100)
+        job['matched_skills'] = matcher.matched_skills(i, skills)
+        jobs.append(job)
+    return {
+        'jobs': jobs,
+        'total_jobs': len(matcher.jobs),
+        'took_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
@@ -0,0 +1,107 @@
+"""
+Versioned schema migrations for the job board database.
+
+Each migration has statements per dialect (MySQL in production, SQLite for
+local runs and benchmarks). Applied versions are recorded in
+schema_migrations, so ``migrate`` only runs what is new:
+
+    flask --app run migrate
+"""
+from sqlalchemy import text
+
+MIGRATIONS = [
+    (1, 'create jobs', {
+        'mysql': [
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                title VARCHAR(255),
+                company VARCHAR(255),
+                location VARCHAR(255),
+                apply_link VARCHAR(1024)
+            )""",
+        ],
+        'sqlite': [
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                apply_link TEXT
+            )""",
+        ],
+    }),
+    # Keyset pagination walks id; the filters seek on (column, id) so a
+    # filtered page is still an index range scan rather than a table scan
+    (2, 'job listing indexes', {
+        'mysql': [
+            "CREATE INDEX idx_jobs_company_id ON jobs (company(191), id)",
+            "CREATE INDEX idx_jobs_location_id ON jobs (location(191), id)",
+            "CREATE INDEX idx_jobs_title ON jobs (title(191))",
+        ],
+        'sqlite': [
+            "CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs (company, id)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_location_id ON jobs (location, id)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs (title)",
+        ],
+    }),
+    # Full-text search over title, company and location (application.search).
+    # SQLite keeps an external-content FTS5 table in step with jobs via triggers
+    # and backfills it from existing rows.
+    (3, 'job full-text search', {
+        'mysql': [
+            "ALTER TABLE jobs ADD FULLTEXT INDEX ft_jobs (title, company, location)",
+        ],
+        'sqlite': [
+            """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, location, content='jobs', content_rowid='id'
+            )""",
+            """CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts (rowid, title, company, location)
+                VALUES (new.id, new.title, new.company, new.location);
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location)
+                VALUES ('delete', old.id, old.title, old.company, old.location);
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location)
+                VALUES ('delete', old.id, old.title, old.company, old.location);
+                INSERT INTO jobs_fts (rowid, title, company, location)
+                VALUES (new.id, new.title, new.company, new.location);
+            END""",
+            "INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')",
+        ],
+    }),
+]
+
+
+def applied_versions(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version INTEGER PRIMARY KEY, name VARCHAR(255), applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    ))
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def migrate(engine, log=print):
+    """Apply every pending migration in order; returns the versions applied"""
+    dialect = engine.dialect.name
+    done = []
+    with engine.begin() as conn:
+        applied = applied_versions(conn)
+    for version, name, statements in MIGRATIONS:
+        if version in applied:
+            continue
+        if dialect not in statements:
+            raise RuntimeError(f"Migration {version} has no statements for {dialect}")
+        # MySQL DDL commits implicitly, so each migration gets its own transaction
+        with engine.begin() as conn:
+            for statement in statements[dialect]:
+                conn.execute(text(statement))
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {'version': version, 'name': name}
+            )
+        log(f"Applied migration {version}: {name}")
+        done.append(version)
+    return done
@@ -1,22 +1,13 @@
-from flask import Blueprint, render_template
-import mysql.connector
-from config import Config
-import os
+from flask import Blueprint, render_template, request
+
+from application.db import get_db
+from application.jobs import fetch_jobs_page, page_args
 
 bp = Blueprint('pages', __name__, template_folder='templates/pages')
 
 @bp.route('/')
 def home():
-    conn = mysql.connector.connect(
-        host=os.getenv('DB_HOST'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME'),
-        port=os.getenv('DB_PORT')
-    )
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM jobs")
-    jobs = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return render_template('jobs.html', jobs=jobs)
+    cursor, limit, filters = page_args(request.args)
+    with get_db().connection() as conn:
+        jobs, next_cursor = fetch_jobs_page(conn, cursor, limit, **filters)
+    return render_template('jobs.html', jobs=jobs, next_cursor=next_cursor, filters=filters, limit=limit)
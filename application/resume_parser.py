@@ -1,221 +1,246 @@
 
 import os
 import re
-import pdfplumber
-from PyPDF2 import PdfReader
+import sys
 try:
     from docx import Document
 except ImportError:
     Document = None
 
+# Shared engines live in the repository-level `common` package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.skill_matcher import SkillMatcher
+from common.parsed_document import as_document
+from common.pattern_bank import PatternBank
+from common.pdf_text import PdfTextExtractor
+
+# Comprehensive skills database with 200+ technologies
+SKILLS_DATABASE = {
+    # Programming Languages
+    'Python': ['python', 'py', 'python3'],
+    'JavaScript': ['javascript', 'js', 'jsx'],
+    'TypeScript': ['typescript', 'ts', 'tsx'],
+    'Java': ['java', 'j2ee'],
+    'C++': ['c++', 'cpp', 'c plus plus'],
+    'C#': ['c#', 'csharp', 'dotnet'],
+    'Go': ['golang', 'go'],
+    'Rust': ['rust', 'rustlang'],
+    'PHP': ['php', 'php7', 'php8'],
+    'Ruby': ['ruby', 'rails'],
+    'Swift': ['swift'],
+    'Kotlin': ['kotlin'],
+    'Scala': ['scala'],
+    'R': ['r programming', ' r '],
+    'MATLAB': ['matlab'],
+    'SQL': ['sql', 'tsql', 'pl/sql'],
+    'HTML': ['html', 'html5'],
+    'CSS': ['css', 'css3', 'scss', 'sass'],
+    'Bash': ['bash', 'shell', 'shellscript'],
+    'PowerShell': ['powershell'],
+    
+    # Frontend Frameworks
+    'React': ['react', 'reactjs', 'react.js'],
+    'Vue.js': ['vue', 'vuejs', 'vue.js'],
+    'Angular': ['angular', 'angularjs'],
+    'Next.js': ['next.js', 'nextjs', 'next'],
+    'Svelte': ['svelte'],
+    'Ember': ['ember', 'emberjs'],
+    'Backbone': ['backbone.js'],
+    'jQuery': ['jquery'],
+    'Bootstrap': ['bootstrap'],
+    'Tailwind': ['tailwind', 'tailwindcss'],
+    'Material-UI': ['material-ui', 'mui'],
+    
+    # Backend Frameworks
+    'Django': ['django'],
+    'Flask': ['flask'],
+    'FastAPI': ['fastapi'],
+    'Spring': ['spring', 'spring boot'],
+    'Spring Boot': ['spring boot', 'springboot'],
+    'Express.js': ['express', 'expressjs'],
+    'Node.js': ['node.js', 'nodejs', 'node'],
+    'Laravel': ['laravel'],
+    'Symfony': ['symfony'],
+    'ASP.NET': ['asp.net', 'asp', 'dotnet'],
+    'Ruby on Rails': ['rails', 'ruby on rails'],
+    'NestJS': ['nestjs', 'nest.js'],
+    'Fastify': ['fastify'],
+    'Koa': ['koa'],
+    'Tornado': ['tornado'],
+    'Bottle': ['bottle'],
+    'Pyramid': ['pyramid'],
+    
+    # Databases
+    'MongoDB': ['mongodb', 'mongo'],
+    'PostgreSQL': ['postgresql', 'postgres', 'psql'],
+    'MySQL': ['mysql', 'mariadb'],
+    'Redis': ['redis'],
+    'Cassandra': ['cassandra'],
+    'DynamoDB': ['dynamodb'],
+    'Firebase': ['firebase', 'firestore'],
+    'SQL Server': ['sql server', 'mssql', 'sqlserver'],
+    'Oracle': ['oracle database', 'oracle'],
+    'Elasticsearch': ['elasticsearch', 'elastic'],
+    'Neo4j': ['neo4j'],
+    'CouchDB': ['couchdb'],
+    'RethinkDB': ['rethinkdb'],
+    'Memcached': ['memcached'],
+    'Solr': ['solr'],
+    
+    # Cloud Platforms
+    'AWS': ['aws', 'amazon web services', 'amazon'],
+    'Azure': ['azure', 'microsoft azure'],
+    'Google Cloud': ['gcp', 'google cloud', 'google cloud platform'],
+    'DigitalOcean': ['digitalocean', 'digital ocean'],
+    'Heroku': ['heroku'],
+    'IBM Cloud': ['ibm cloud'],
+    'Oracle Cloud': ['oracle cloud'],
+    'Alibaba Cloud': ['alibaba cloud'],
+    
+    # DevOps & Infrastructure
+    'Docker': ['docker', 'dockerfile'],
+    'Kubernetes': ['kubernetes', 'k8s', 'k3s'],
+    'Jenkins': ['jenkins'],
+    'GitLab CI': ['gitlab ci', 'gitlab-ci'],
+    'GitHub Actions': ['github actions'],
+    'CircleCI': ['circleci'],
+    'Travis CI': ['travis ci'],
+    'Terraform': ['terraform'],
+    'Ansible': ['ansible'],
+    'Chef': ['chef'],
+    'Puppet': ['puppet'],
+    'Vagrant': ['vagrant'],
+    'nginx': ['nginx', 'ngninx'],
+    'Apache': ['apache', 'httpd'],
+    'IIS': ['iis', 'internet information services'],
+    
+    # Version Control
+    'Git': ['git'],
+    'GitHub': ['github', 'gh'],
+    'GitLab': ['gitlab'],
+    'Bitbucket': ['bitbucket'],
+    'SVN': ['subversion', 'svn'],
+    'Mercurial': ['mercurial', 'hg'],
+    
+    # AI/ML
+    'Machine Learning': ['machine learning', 'ml', 'ml/ai'],
+    'Deep Learning': ['deep learning', 'dl'],
+    'TensorFlow': ['tensorflow'],
+    'PyTorch': ['pytorch', 'torch'],
+    'Keras': ['keras'],
+    'Scikit-learn': ['scikit-learn', 'sklearn'],
+    'Pandas': ['pandas'],
+    'NumPy': ['numpy', 'np'],
+    'SciPy': ['scipy'],
+    'Matplotlib': ['matplotlib'],
+    'Seaborn': ['seaborn'],
+    'OpenCV': ['opencv', 'cv2'],
+    'NLP': ['nlp', 'natural language processing'],
+    'Computer Vision': ['computer vision', 'cv'],
+    'Hugging Face': ['hugging face', 'transformers'],
+    'XGBoost': ['xgboost'],
+    'LightGBM': ['lightgbm'],
+    'CatBoost': ['catboost'],
+    
+    # APIs & Protocols
+    'REST API': ['rest api', 'rest', 'restful'],
+    'GraphQL': ['graphql'],
+    'gRPC': ['grpc'],
+    'SOAP': ['soap'],
+    'WebSocket': ['websocket', 'ws'],
+    'OAuth': ['oauth', 'oauth2'],
+    'JWT': ['jwt', 'json web token'],
+    
+    # Testing
+    'Jest': ['jest'],
+    'Mocha': ['mocha'],
+    'Jasmine': ['jasmine'],
+    'Pytest': ['pytest'],
+    'unittest': ['unittest'],
+    'Selenium': ['selenium'],
+    'Cypress': ['cypress'],
+    'RSpec': ['rspec'],
+    'JUnit': ['junit'],
+    'TestNG': ['testng'],
+    
+    # Monitoring & Logging
+    'Prometheus': ['prometheus'],
+    'Grafana': ['grafana'],
+    'ELK Stack': ['elk stack', 'elk'],
+    'Splunk': ['splunk'],
+    'Datadog': ['datadog'],
+    'New Relic': ['new relic'],
+    'Sentry': ['sentry'],
+    'CloudWatch': ['cloudwatch'],
+    
+    # Message Queues
+    'RabbitMQ': ['rabbitmq', 'rabbit'],
+    'Kafka': ['kafka'],
+    'ActiveMQ': ['activemq'],
+    'AWS SQS': ['sqs', 'aws sqs'],
+    'AWS SNS': ['sns', 'aws sns'],
+    'Pub/Sub': ['pubsub', 'pub/sub'],
+    
+    # Other Tools
+    'Linux': ['linux', 'ubuntu', 'debian', 'centos', 'rhel'],
+    'Windows': ['windows', 'windows server'],
+    'macOS': ['macos', 'mac os'],
+    'Agile': ['agile'],
+    'Scrum': ['scrum'],
+    'Kanban': ['kanban'],
+    'JIRA': ['jira'],
+    'Confluence': ['confluence'],
+    'Slack': ['slack'],
+    'Docker Compose': ['docker compose', 'docker-compose'],
+    'Minikube': ['minikube'],
+    'Helm': ['helm'],
+    'ArgoCD': ['argocd'],
+    'REST': ['rest', 'restful api'],
+    'MicroServices': ['microservices', 'microservice'],
+    'CI/CD': ['ci/cd', 'cicd', 'continuous integration'],
+}
+
+# Compiled once at import; every alias is found in a single pass over the text
+SKILL_MATCHER = SkillMatcher(SKILLS_DATABASE)
+
+# Extraction regexes, compiled once with hit/time counters (see common/pattern_bank.py)
+PATTERNS = PatternBank()
+
+# Experience mentions with word boundaries, most specific first; the first
+# listed pattern found anywhere wins, in a single scan of the text. A number
+# is matched whole ((?<!\d)): tried from every digit of a long run, the rest
+# of a pattern was retried once per digit.
+EXPERIENCE_MATCHER = PATTERNS.first_of('experience', [
+    (r'(?<!\d)(\d+)\s*(?:months?|mo\.?)\s*(?:of\s+)?(?:experience|exp\.?|exp\b)', 'months'),
+    (r'(?<!\d)(\d+)\s*(?:years?|yrs?\.?)\s*(?:of\s+)?(?:experience|exp\.?|exp\b)', 'years'),
+    (r'experience\s*(?:[:\-]\s*)?(\d+)\s*(?:months?|mo\.?)', 'months'),
+    (r'experience\s*(?:[:\-]\s*)?(\d+)\s*(?:years?|yrs?\.?)', 'years'),
+    (r'(?<!\d)(\d+)\s*months?\s+of\s+(?:professional\s+)?experience', 'months'),
+    (r'(?<!\d)(\d+)\s*years?\s+of\s+(?:professional\s+)?experience', 'years'),
+    (r'exp\.?\s*(?:[:\-]\s*)?(\d+)\s*(?:months?|mo\.?)', 'months'),
+    (r'exp\.?\s*(?:[:\-]\s*)?(\d+)\s*(?:years?|yrs?\.?)', 'years'),
+], re.IGNORECASE, guard=r'(?=[\de])')  # every pattern starts with a number, 'experience' or 'exp'
+
+
+# pdfplumber's text first, PyPDF2's for any page it cannot read; long PDFs
+# are extracted page-parallel (see common/pdf_text.py)
+PDF_EXTRACTOR = PdfTextExtractor(backends=('pdfplumber', 'pypdf2'))
+
+
 class ResumeParser:
     def __init__(self):
-        # Comprehensive skills database with 200+ technologies
-        self.skills_database = {
-            # Programming Languages
-            'Python': ['python', 'py', 'python3'],
-            'JavaScript': ['javascript', 'js', 'jsx'],
-            'TypeScript': ['typescript', 'ts', 'tsx'],
-            'Java': ['java', 'j2ee'],
-            'C++': ['c++', 'cpp', 'c plus plus'],
-            'C#': ['c#', 'csharp', 'dotnet'],
-            'Go': ['golang', 'go'],
-            'Rust': ['rust', 'rustlang'],
-            'PHP': ['php', 'php7', 'php8'],
-            'Ruby': ['ruby', 'rails'],
-            'Swift': ['swift'],
-            'Kotlin': ['kotlin'],
-            'Scala': ['scala'],
-            'R': ['r programming', ' r '],
-            'MATLAB': ['matlab'],
-            'SQL': ['sql', 'tsql', 'pl/sql'],
-            'HTML': ['html', 'html5'],
-            'CSS': ['css', 'css3', 'scss', 'sass'],
-            'Bash': ['bash', 'shell', 'shellscript'],
-            'PowerShell': ['powershell'],
-            
-            # Frontend Frameworks
-            'React': ['react', 'reactjs', 'react.js'],
-            'Vue.js': ['vue', 'vuejs', 'vue.js'],
-            'Angular': ['angular', 'angularjs'],
-            'Next.js': ['next.js', 'nextjs', 'next'],
-            'Svelte': ['svelte'],
-            'Ember': ['ember', 'emberjs'],
-            'Backbone': ['backbone.js'],
-            'jQuery': ['jquery'],
-            'Bootstrap': ['bootstrap'],
-            'Tailwind': ['tailwind', 'tailwindcss'],
-            'Material-UI': ['material-ui', 'mui'],
-            
-            # Backend Frameworks
-            'Django': ['django'],
-            'Flask': ['flask'],
-            'FastAPI': ['fastapi'],
-            'Spring': ['spring', 'spring boot'],
-            'Spring Boot': ['spring boot', 'springboot'],
-            'Express.js': ['express', 'expressjs'],
-            'Node.js': ['node.js', 'nodejs', 'node'],
-            'Laravel': ['laravel'],
-            'Symfony': ['symfony'],
-            'ASP.NET': ['asp.net', 'asp', 'dotnet'],
-            'Ruby on Rails': ['rails', 'ruby on rails'],
-            'NestJS': ['nestjs', 'nest.js'],
-            'Fastify': ['fastify'],
-            'Koa': ['koa'],
-            'Tornado': ['tornado'],
-            'Bottle': ['bottle'],
-            'Pyramid': ['pyramid'],
-            
-            # Databases
-            'MongoDB': ['mongodb', 'mongo'],
-            'PostgreSQL': ['postgresql', 'postgres', 'psql'],
-            'MySQL': ['mysql', 'mariadb'],
-            'Redis': ['redis'],
-            'Cassandra': ['cassandra'],
-            'DynamoDB': ['dynamodb'],
-            'Firebase': ['firebase', 'firestore'],
-            'SQL Server': ['sql server', 'mssql', 'sqlserver'],
-            'Oracle': ['oracle database', 'oracle'],
-            'Elasticsearch': ['elasticsearch', 'elastic'],
-            'Neo4j': ['neo4j'],
-            'CouchDB': ['couchdb'],
-            'RethinkDB': ['rethinkdb'],
-            'Memcached': ['memcached'],
-            'Solr': ['solr'],
-            
-            # Cloud Platforms
-            'AWS': ['aws', 'amazon web services', 'amazon'],
-            'Azure': ['azure', 'microsoft azure'],
-            'Google Cloud': ['gcp', 'google cloud', 'google cloud platform'],
-            'DigitalOcean': ['digitalocean', 'digital ocean'],
-            'Heroku': ['heroku'],
-            'IBM Cloud': ['ibm cloud'],
-            'Oracle Cloud': ['oracle cloud'],
-            'Alibaba Cloud': ['alibaba cloud'],
-            
-            # DevOps & Infrastructure
-            'Docker': ['docker', 'dockerfile'],
-            'Kubernetes': ['kubernetes', 'k8s', 'k3s'],
-            'Jenkins': ['jenkins'],
-            'GitLab CI': ['gitlab ci', 'gitlab-ci'],
-            'GitHub Actions': ['github actions'],
-            'CircleCI': ['circleci'],
-            'Travis CI': ['travis ci'],
-            'Terraform': ['terraform'],
-            'Ansible': ['ansible'],
-            'Chef': ['chef'],
-            'Puppet': ['puppet'],
-            'Vagrant': ['vagrant'],
-            'nginx': ['nginx', 'ngninx'],
-            'Apache': ['apache', 'httpd'],
-            'IIS': ['iis', 'internet information services'],
-            
-            # Version Control
-            'Git': ['git'],
-            'GitHub': ['github', 'gh'],
-            'GitLab': ['gitlab'],
-            'Bitbucket': ['bitbucket'],
-            'SVN': ['subversion', 'svn'],
-            'Mercurial': ['mercurial', 'hg'],
-            
-            # AI/ML
-            'Machine Learning': ['machine learning', 'ml', 'ml/ai'],
-            'Deep Learning': ['deep learning', 'dl'],
-            'TensorFlow': ['tensorflow'],
-            'PyTorch': ['pytorch', 'torch'],
-            'Keras': ['keras'],
-            'Scikit-learn': ['scikit-learn', 'sklearn'],
-            'Pandas': ['pandas'],
-            'NumPy': ['numpy', 'np'],
-            'SciPy': ['scipy'],
-            'Matplotlib': ['matplotlib'],
-            'Seaborn': ['seaborn'],
-            'OpenCV': ['opencv', 'cv2'],
-            'NLP': ['nlp', 'natural language processing'],
-            'Computer Vision': ['computer vision', 'cv'],
-            'Hugging Face': ['hugging face', 'transformers'],
-            'XGBoost': ['xgboost'],
-            'LightGBM': ['lightgbm'],
-            'CatBoost': ['catboost'],
-            
-            # APIs & Protocols
-            'REST API': ['rest api', 'rest', 'restful'],
-            'GraphQL': ['graphql'],
-            'gRPC': ['grpc'],
-            'SOAP': ['soap'],
-            'WebSocket': ['websocket', 'ws'],
-            'OAuth': ['oauth', 'oauth2'],
-            'JWT': ['jwt', 'json web token'],
-            
-            # Testing
-            'Jest': ['jest'],
-            'Mocha': ['mocha'],
-            'Jasmine': ['jasmine'],
-            'Pytest': ['pytest'],
-            'unittest': ['unittest'],
-            'Selenium': ['selenium'],
-            'Cypress': ['cypress'],
-            'RSpec': ['rspec'],
-            'JUnit': ['junit'],
-            'TestNG': ['testng'],
-            
-            # Monitoring & Logging
-            'Prometheus': ['prometheus'],
-            'Grafana': ['grafana'],
-            'ELK Stack': ['elk stack', 'elk'],
-            'Splunk': ['splunk'],
-            'Datadog': ['datadog'],
-            'New Relic': ['new relic'],
-            'Sentry': ['sentry'],
-            'CloudWatch': ['cloudwatch'],
-            
-            # Message Queues
-            'RabbitMQ': ['rabbitmq', 'rabbit'],
-            'Kafka': ['kafka'],
-            'ActiveMQ': ['activemq'],
-            'AWS SQS': ['sqs', 'aws sqs'],
-            'AWS SNS': ['sns', 'aws sns'],
-            'Pub/Sub': ['pubsub', 'pub/sub'],
-            
-            # Other Tools
-            'Linux': ['linux', 'ubuntu', 'debian', 'centos', 'rhel'],
-            'Windows': ['windows', 'windows server'],
-            'macOS': ['macos', 'mac os'],
-            'Agile': ['agile'],
-            'Scrum': ['scrum'],
-            'Kanban': ['kanban'],
-            'JIRA': ['jira'],
-            'Confluence': ['confluence'],
-            'Slack': ['slack'],
-            'Docker Compose': ['docker compose', 'docker-compose'],
-            'Minikube': ['minikube'],
-            'Helm': ['helm'],
-            'ArgoCD': ['argocd'],
-            'REST': ['rest', 'restful api'],
-            'MicroServices': ['microservices', 'microservice'],
-            'CI/CD': ['ci/cd', 'cicd', 'continuous integration'],
-        }
+        self.skills_database = SKILLS_DATABASE
+        self.skill_matcher = SKILL_MATCHER
+        self.experience_matcher = EXPERIENCE_MATCHER
+        self.pdf_extractor = PDF_EXTRACTOR
     
     def extract_text_from_pdf(self, pdf_path):
-        """Extract text from PDF using pdfplumber"""
-        text = ""
+        """Extract text from PDF using pdfplumber, falling back to PyPDF2 per page"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    extracted = page.extract_text()
-                    if extracted:
-                        text += extracted + "\n"
+            return self.pdf_extractor.extract(pdf_path)
         except Exception as e:
-            print(f"Error extracting from pdfplumber: {e}")
-            # Fallback to PyPDF2
-            try:
-                with open(pdf_path, 'rb') as file:
-                    reader = PdfReader(file)
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
-            except:
-                pass
-        return text
+            print(f"Error extracting from PDF: {e}")
+            return ""
     
     def extract_text_from_docx(self, docx_path):
         """Extract text from DOCX file"""
@@ -250,46 +275,25 @@ class ResumeParser:
     
     def extract_skills(self, text):
         """Extract ALL skills from text"""
-        skills_found = set()
-        text_lower = text.lower()
-        
-        for skill, aliases in self.skills_database.items():
-            for alias in aliases:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(alias) + r'\b'
-                if re.search(pattern, text_lower):
-                    skills_found.add(skill)
-                    break
+        # Word-boundary match of every alias in one pass (see common/skill_matcher.py)
+        skills_found = self.skill_matcher.find(as_document(text).text)
         
         return sorted(list(skills_found))
     
     def extract_experience(self, text):
         """Extract experience - handles months and years accurately"""
-        text_lower = text.lower()
-        
-        # Patterns to match experience with word boundaries
-        patterns = [
-            (r'(\d+)\s*(?:months?|mo\.?)\s*(?:of\s+)?(?:experience|exp\.?|exp\b)', 'months'),
-            (r'(\d+)\s*(?:years?|yrs?\.?)\s*(?:of\s+)?(?:experience|exp\.?|exp\b)', 'years'),
-            (r'experience\s*[:\-]?\s*(\d+)\s*(?:months?|mo\.?)', 'months'),
-            (r'experience\s*[:\-]?\s*(\d+)\s*(?:years?|yrs?\.?)', 'years'),
-            (r'(\d+)\s*months?\s+of\s+(?:professional\s+)?experience', 'months'),
-            (r'(\d+)\s*years?\s+of\s+(?:professional\s+)?experience', 'years'),
-            (r'exp\.?\s*[:\-]?\s*(\d+)\s*(?:months?|mo\.?)', 'months'),
-            (r'exp\.?\s*[:\-]?\s*(\d+)\s*(?:years?|yrs?\.?)', 'years'),
-        ]
+        text_lower = as_document(text).lower
         
-        for pattern, unit in patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                value = matches[0]
-                return f"{value} {unit}"
+        hit = self.experience_matcher.search(text_lower)
+        if hit:
+            unit, _, (value,) = hit
+            return f"{value} {unit}"
         
         return "Not specified"
     
     def extract_name(self, text):
         """Extract name from resume"""
-        lines = text.split('\n')
+        lines = as_document(text).raw_lines
         for line in lines[:10]:
             line = line.strip()
             if line and 2 <= len(line) <= 50:
@@ -351,10 +355,11 @@ class ResumeParser:
                     'error': 'Could not extract sufficient text from file'
                 }
             
-            # Extract information
-            skills = self.extract_skills(text)
-            experience = self.extract_experience(text)
-            name = self.extract_name(text)
+            # Extract information; the extractors share the document's derived views
+            doc = as_document(text)
+            skills = self.extract_skills(doc)
+            experience = self.extract_experience(doc)
+            name = self.extract_name(doc)
             category = self.categorize_role(skills)
             
             return {
@@ -0,0 +1,120 @@
+"""
+Ranked full-text search over job title, company and location.
+
+MySQL uses the FULLTEXT index from migration 3; SQLite uses an external-content
+FTS5 table kept in sync by triggers and ranks with bm25, weighting title over
+company over location. Either way the query is answered from the index, not by
+scanning jobs. Every word must match (as a prefix); if nothing does, the search
+is retried matching any word. Results are paginated by page number since the
+order is by score rather than by id.
+"""
+import re
+import time
+
+from sqlalchemy import text
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_PAGE = 50  # ranked results past this depth are not worth an OFFSET scan
+MATCH_MODES = ('all', 'any')
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Every term must match (boolean mode) unless nothing does, then any term
+# (natural language mode); both rank by MySQL's relevance score
+MYSQL_SEARCH = """
+    SELECT id, title, company, location, apply_link,
+           MATCH (title, company, location) AGAINST (:q IN {mode}) AS score
+    FROM jobs
+    WHERE MATCH (title, company, location) AGAINST (:q IN {mode})
+    ORDER BY score DESC, id
+    LIMIT :limit OFFSET :offset
+"""
+
+# rank is bm25 weighted title > company > location (lower is better). Only the
+# requested page of rowids is joined back to jobs, not every match.
+SQLITE_SEARCH = """
+    SELECT jobs.id, jobs.title, jobs.company, jobs.location, jobs.apply_link,
+           -ranked.rank AS score
+    FROM (
+        SELECT rowid, rank FROM jobs_fts
+        WHERE jobs_fts MATCH :q AND rank MATCH 'bm25(10.0, 5.0, 2.0)'
+        ORDER BY rank
+        LIMIT :limit OFFSET :offset
+    ) AS ranked
+    JOIN jobs ON jobs.id = ranked.rowid
+    ORDER BY ranked.rank, jobs.id
+"""
+
+
+def _tokens(q):
+    return _TOKEN.findall(q)
+
+
+def fts5_query(q, match_all=True):
+    """Quote each token as a prefix term so user input can't inject FTS5 syntax"""
+    return (' ' if match_all else ' OR ').join(f'"{token}"*' for token in _tokens(q))
+
+
+def mysql_query(q, match_all=True):
+    """Boolean-mode '+tok*' terms when every token must match, else the plain words"""
+    if match_all:
+        return ' '.join(f'+{token}*' for token in _tokens(q))
+    return ' '.join(_tokens(q))
+
+
+def _search_sql(dialect, q, match_all):
+    if dialect == 'sqlite':
+        return SQLITE_SEARCH, fts5_query(q, match_all)
+    if dialect == 'mysql':
+        mode = 'BOOLEAN MODE' if match_all else 'NATURAL LANGUAGE MODE'
+        return MYSQL_SEARCH.format(mode=mode), mysql_query(q, match_all)
+    raise RuntimeError(f"Full-text search is not available for {dialect}")
+
+
+def search_args(args):
+    """Query, page, page size and match mode from request query parameters"""
+    q = (args.get('q') or '').strip()
+    match = args.get('match') if args.get('match') in MATCH_MODES else None
+    try:
+        page = int(args.get('page', 1))
+    except ValueError:
+        page = 1
+    try:
+        limit = int(args.get('limit', PAGE_SIZE))
+    except ValueError:
+        limit = PAGE_SIZE
+    return q, max(1, min(page, MAX_PAGE)), max(1, min(limit, MAX_PAGE_SIZE)), match
+
+
+def search_jobs(conn, q, page=1, limit=PAGE_SIZE, match=None):
+    """One page of jobs ranked by relevance to q.
+
+    match is 'all' or 'any'; left unset, 'any' is tried only when 'all' finds
+    nothing. The mode used is returned so later pages can pass it back.
+    """
+    started = time.perf_counter()
+    modes = [match] if match else (['all', 'any'] if len(_tokens(q)) > 1 else ['all'])
+
+    jobs = []
+    params = {'limit': limit + 1, 'offset': (page - 1) * limit}
+    for match in modes:
+        sql, query = _search_sql(conn.dialect.name, q, match == 'all')
+        if query:
+            jobs = [dict(row) for row in conn.execute(text(sql), dict(params, q=query)).mappings()]
+        if jobs:
+            break
+    has_more = len(jobs) > limit
+    jobs = jobs[:limit]
+    for job in jobs:
+        job['score'] = round(float(job['score']), 4)
+
+    return {
+        'query': q,
+        'match': match,
+        'jobs': jobs,
+        'page': page,
+        'limit': limit,
+        'next_page': page + 1 if has_more and page < MAX_PAGE else None,
+        'took_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
@@ -0,0 +1,192 @@
+"""
+Semantic resume-to-job search (POST /api/jobs/semantic-match).
+
+The FAISS index from common.semantic_index is opened memory-mapped when the
+app starts, if it has been built. ``flask index-jobs`` embeds only the jobs
+added since the last run (id > the index's max_id), merges them into the file
+and leaves every earlier embedding in the cache, so running it after each CSV
+import keeps the index current. Serving processes notice the rewritten file
+and map the new one on their next request.
+"""
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+from flask import current_app
+from sqlalchemy import bindparam, text
+
+from application.matching import job_text, resume_text
+from common import semantic_index
+from common.semantic_index import EmbeddingCache, JobEmbedder, SemanticJobIndex
+
+MAX_RESULTS = 100
+
+logger = logging.getLogger(__name__)
+
+JOBS_BY_ID = text(
+    "SELECT id, title, company, location, apply_link FROM jobs WHERE id IN :ids"
+).bindparams(bindparam('ids', expanding=True))
+
+
+class SemanticUnavailable(RuntimeError):
+    """faiss is missing or the index has not been built yet."""
+
+
+class SemanticSearch:
+    """Embedder, memory-mapped index and the queries around them for one app."""
+
+    def __init__(self, config, db):
+        self.config = config
+        self.db = db
+        self.queries = 0
+        self._embedder = None
+        self._index = None
+        self._loaded_mtime = None
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self):
+        return Path(self.config['SEMANTIC_INDEX_PATH'])
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            with self._lock:
+                if self._embedder is None:
+                    model = self.config['SEMANTIC_MODEL']
+                    cache = EmbeddingCache(self.config['SEMANTIC_CACHE_PATH'], model)
+                    self._embedder = JobEmbedder(
+                        model, self.config['SEMANTIC_BATCH_SIZE'], cache, self.config['SEMANTIC_THREADS']
+                    )
+        return self._embedder
+
+    def _open_index(self):
+        if semantic_index.faiss is None:
+            raise SemanticUnavailable("faiss is not installed (pip install faiss-cpu)")
+        meta_path = self.index_path.with_name(self.index_path.name + '.meta.json')
+        # The sidecar knows the dimension, so opening the index doesn't load the model
+        dim = json.loads(meta_path.read_text())['dim'] if meta_path.exists() else self.embedder.dim
+        return SemanticJobIndex(
+            self.index_path, dim, self.config['SEMANTIC_MODEL'], self.config['SEMANTIC_NPROBE']
+        )
+
+    def _mtime(self):
+        try:
+            return self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def load(self):
+        """Map the persisted index (startup, or after index-jobs rewrote it)"""
+        # Opened outside the lock: without a meta sidecar (first index-jobs
+        # run) it needs the embedder's dim, and the embedder takes the lock too
+        index = self._open_index() if self._index is None else None
+        with self._lock:
+            if self._index is None:
+                self._index = index
+            mtime = self._mtime()
+            if mtime is not None and mtime != self._loaded_mtime:
+                self._index.load()
+                self._loaded_mtime = mtime
+                logger.info(f"Mapped semantic index: {self._index.stats()}")
+            return self._index
+
+    def sync(self, batch_size=10000, log=print):
+        """Embed and index every job newer than the index; returns how many"""
+        index = self.load()
+        added = 0
+        after = index.max_id
+        while True:
+            with self.db.connection() as conn:
+                rows = conn.execute(
+                    text("SELECT id, title, company, location FROM jobs WHERE id > :after ORDER BY id LIMIT :limit"),
+                    {'after': after, 'limit': batch_size}
+                ).mappings().all()
+            if not rows:
+                break
+            vectors = self.embedder.embed([job_text(row) for row in rows])
+            index.add([row['id'] for row in rows], vectors)
+            added += len(rows)
+            after = rows[-1]['id']
+            log(f"Embedded {added} new jobs ({self.embedder.stats()['encode_per_sec']} texts/sec encoded)")
+        index.compact()
+        with self._lock:
+            self._loaded_mtime = self._mtime()
+        return added
+
+    def _filter_ids(self, conn, company=None, location=None):
+        clauses, params = [], {}
+        if company:
+            clauses.append("company = :company")
+            params['company'] = company
+        if location:
+            clauses.append("location = :location")
+            params['location'] = location
+        if not clauses:
+            return None
+        rows = conn.execute(text(f"SELECT id FROM jobs WHERE {' AND '.join(clauses)}"), params)
+        return [row[0] for row in rows]
+
+    def match(self, resume_data, q='', limit=20, company=None, location=None):
+        """Nearest jobs to a parsed resume, optionally within a company/location"""
+        started = time.perf_counter()
+        if not self.index_path.exists():
+            raise SemanticUnavailable("Semantic index has not been built; run `flask index-jobs`")
+        index = self.load()
+        if index.ntotal == 0:
+            raise SemanticUnavailable("Semantic index is empty; run `flask index-jobs`")
+        limit = max(1, min(limit, MAX_RESULTS))
+        query = self.embedder.embed([resume_text(resume_data, q)])
+        embedded = time.perf_counter()
+
+        with self.db.connection() as conn:
+            ids = self._filter_ids(conn, company, location)
+            if ids == []:
+                scores, found = [[]], [[]]
+            else:
+                scores, found = index.search(query, limit, ids)
+            searched = time.perf_counter()
+            hits = [(int(job_id), float(score)) for job_id, score in zip(found[0], scores[0]) if job_id >= 0]
+            rows = {}
+            if hits:
+                rows = {row['id']: dict(row) for row in
+                        conn.execute(JOBS_BY_ID, {'ids': [job_id for job_id, _ in hits]}).mappings()}
+
+        jobs = []
+        for job_id, score in hits:
+            job = rows.get(job_id)
+            if job is None:
+                continue  # deleted since it was indexed
+            job['score'] = round(score, 4)
+            job['match_percentage'] = max(0, round(score * 100))
+            jobs.append(job)
+        self.queries += 1
+        return {
+            'jobs': jobs,
+            'total_jobs': index.ntotal,
+            'embed_ms': round((embedded - started) * 1000, 2),
+            'search_ms': round((searched - embedded) * 1000, 2),
+            'took_ms': round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def stats(self):
+        stats = {'available': semantic_index.faiss is not None, 'queries': self.queries}
+        if self._index is not None:
+            stats['index'] = self._index.stats()
+        if self._embedder is not None:
+            stats['embedder'] = self._embedder.stats()
+        return stats
+
+
+def init_semantic(app, db):
+    search = SemanticSearch(app.config, db)
+    app.extensions['semantic'] = search
+    if semantic_index.faiss is not None and search.index_path.exists():
+        search.load()
+    return search
+
+
+def get_semantic():
+    return current_app.extensions['semantic']
@@ -209,88 +209,52 @@ class JobMatchApp {
         document.getElementById('searchSpinner').style.display = 'inline-block';
 
         document.getElementById('resultsCard').style.display = 'block';
-        document.getElementById('jobsContainer').innerHTML = '<div class="loading"><i class="fas fa-spinner fa-spin"></i><p>Searching across 20+ job boards...</p></div>';
+        document.getElementById('jobsContainer').innerHTML = '<div class="loading"><i class="fas fa-spinner fa-spin"></i><p>Matching jobs to your resume...</p></div>';
 
         document.getElementById('resultsCard').scrollIntoView({ behavior: 'smooth', block: 'nearest' });
 
-        const params = new URLSearchParams({
-            job_title: jobTitle,
-            location: location
-        });
+        // Ranked server-side: by meaning when the semantic index is built,
+        // otherwise by term and skill overlap (/api/jobs/match)
+        const body = JSON.stringify({ resume_data: this.resumeData, q: `${jobTitle} ${location}`, limit: 50 });
+        const post = url => fetch(url, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body });
 
-        fetch(`/api/v2/search-realtime?${params}`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ resume_data: this.resumeData })
+        post('/api/jobs/semantic-match')
+        .then(r => (r.status === 503 ? post('/api/jobs/match') : r))
+        .then(r => {
+            if (!r.ok) throw new Error(`Matching failed (${r.status})`);
+            return r.json();
         })
-        .then(r => r.json())
         .then(data => {
-            if (data.success && data.jobs) {
-                this.allJobs = data.jobs;
-                this.calculateMatches();
-                this.applyFiltersAndSort();
-                this.displayJobs();
-                this.updateFilterCounts();
-            } else {
-                throw new Error(data.error || 'No jobs found');
-            }
+            this.allJobs = (data.jobs || []).map(job => this.fromSearchResult(job));
         })
-        .catch(() => {
-            this.allJobs = this.generateSampleJobs();
-            this.calculateMatches();
-            this.applyFiltersAndSort();
-            this.displayJobs();
-            this.updateFilterCounts();
+        .catch(err => {
+            console.error(err);
+            this.allJobs = [];
         })
         .finally(() => {
+            this.applyFiltersAndSort();
+            this.updateFilterCounts();
             btn.disabled = false;
             document.getElementById('searchSpinner').style.display = 'none';
         });
     }
 
-    generateSampleJobs() {
-        const titles = ['Python Developer', 'Full Stack Developer', 'Frontend Engineer', 'Data Scientist', 'DevOps Engineer'];
-        const companies = ['Google', 'Microsoft', 'Amazon', 'Apple', 'Netflix', 'Tesla', 'Meta'];
-        const locations = ['Bangalore', 'Mumbai', 'Delhi', 'Remote', 'Hyderabad', 'Pune'];
-        const salaries = ['₹50L - ₹70L', '₹60L - ₹80L', '₹40L - ₹60L', '₹70L - ₹90L'];
-
-        return Array.from({ length: 20 }).map((_, i) => ({
-            title: titles[Math.floor(Math.random() * titles.length)],
-            company: companies[Math.floor(Math.random() * companies.length)],
-            location: locations[Math.floor(Math.random() * locations.length)],
-            salary: salaries[Math.floor(Math.random() * salaries.length)],
-            posted: ['1 day ago', '3 days ago', '1 week ago', '2 weeks ago'][Math.floor(Math.random() * 4)],
-            source: ['Indeed', 'LinkedIn', 'Naukri', 'Glassdoor'][Math.floor(Math.random() * 4)],
-            url: 'https://example.com/job/' + i,
-            description: 'Exciting opportunity to work with cutting-edge technology. Join our team and make an impact.',
-            match_percentage: Math.floor(Math.random() * 40) + 60
-        }));
-    }
-
-    calculateMatches() {
-        if (!this.resumeData) return;
-
-        this.allJobs.forEach(job => {
-            if (!job.match_percentage) {
-                const skills = this.resumeData.skills || [];
-                const description = ((job.description || '') + ' ' + (job.title || '')).toLowerCase();
-
-                let matched = 0;
-                skills.forEach(skill => {
-                    if (description.includes(skill.toLowerCase())) {
-                        matched++;
-                    }
-                });
-
-                let score = skills.length > 0 ? (matched / skills.length) * 100 : 50;
-
-                if (description.includes((this.resumeData.category || '').toLowerCase())) {
-                    score += 15;
-                }
-
-                job.match_percentage = Math.min(100, Math.round(score));
-            }
-        });
+    fromSearchResult(job) {
+        // Job rows carry title/company/location/apply_link (+ match score); fill the rest of the card
+        return {
+            title: job.title || '',
+            company: job.company || '',
+            location: job.location || '',
+            salary: 'Not disclosed',
+            posted: 'Recently',
+            source: 'Job Board',
+            url: job.apply_link,
+            description: (job.matched_skills || []).length
+                ? `Matches your skills: ${job.matched_skills.join(', ')}`
+                : '',
+            match_percentage: job.match_percentage || 0,
+            score: job.score
+        };
     }
 
     applyFiltersAndSort() {
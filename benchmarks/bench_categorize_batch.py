@@ -0,0 +1,70 @@
+"""
+Benchmark: one-at-a-time predict_category vs categorize_batch.
+
+Categorizes the sample resumes (cycled up to --resumes) and the rows of
+Job Listings.csv with the resume parser's model, both the way the parse path
+does it (cleanResume, transform([text]), predict per text) and with
+categorize_batch (one transform and predict_proba per chunk), for the
+pickled model and its compact export. Reports documents per second and
+checks that both paths agree on every label.
+
+    python benchmarks/bench_categorize_batch.py --model-dir resume-parser/model
+"""
+import argparse
+import csv
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "resume-parser"))
+
+import app1
+from common.compact_model import COMPACT_DIR, export
+from common.model_registry import ARTIFACTS, ModelRegistry
+
+CSV_PATH = ROOT / "Job Listings.csv"
+RESUMES = ROOT / "resume-parser" / "__DATA__" / "resumes"
+
+
+def corpora(resumes):
+    texts = [app1.pdf_to_text(path) for path in sorted(RESUMES.glob('*.pdf'))]
+    with open(CSV_PATH, newline='', encoding='utf-8') as f:
+        jobs = [' '.join((r['Title'], r['Company'], r['Location'])) for r in csv.DictReader(f)]
+    return {'resumes': [texts[i % len(texts)] for i in range(resumes)], 'job listings': jobs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--model-dir', default=str(ROOT / "resume-parser" / "model"))
+    parser.add_argument('--resumes', type=int, default=2000)
+    parser.add_argument('--single', type=int, default=200, help="texts timed one at a time")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for filename in ARTIFACTS.values():
+            shutil.copy2(Path(args.model_dir) / filename, tmp)
+        pickled = ModelRegistry(tmp, compact=False).load()
+        export(pickled.vectorizer, pickled.classifier, Path(tmp) / COMPACT_DIR,
+               {key: Path(tmp) / filename for key, filename in ARTIFACTS.items()})
+        compact = ModelRegistry(tmp).load()
+
+        for name, texts in corpora(args.resumes).items():
+            for model in (pickled, compact):
+                started = time.perf_counter()
+                single = [app1.predict_category(text, model) for text in texts[:args.single]]
+                single_rate = len(single) / (time.perf_counter() - started)
+                started = time.perf_counter()
+                results = app1.categorize_batch(texts, 3, model)
+                batch_rate = len(results) / (time.perf_counter() - started)
+                same = single == [r['category'] for r in results[:len(single)]]
+                print(f"{name:<13} {model.format:<8} one at a time: {single_rate:7.0f} docs/s  "
+                      f"batch: {batch_rate:7.0f} docs/s  same labels: {same}")
+
+
+if __name__ == "__main__":
+    main()
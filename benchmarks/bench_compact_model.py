@@ -0,0 +1,100 @@
+"""
+Benchmark: pickled vs memory-mapped categorization model across workers.
+
+Copies the model's pickles to a temporary directory, exports them with
+common.compact_model, then starts N worker processes per format. Each loads
+the model through ModelRegistry, makes one prediction and, once every worker
+is loaded, reads its own RSS and PSS (proportional set size: shared pages
+split between the processes mapping them) from /proc/self/smaps_rollup.
+Linux only. Also checks that both formats predict the same labels.
+
+    python benchmarks/bench_compact_model.py --model-dir resume-parser/model --workers 4
+"""
+import argparse
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from common.compact_model import COMPACT_DIR, export
+from common.model_registry import ARTIFACTS, ModelRegistry
+
+TEXTS = [
+    "python developer with django rest framework postgresql docker and aws experience",
+    "registered nurse icu patient care medication administration",
+    "financial analyst excel budgeting forecasting variance analysis",
+    "java spring boot microservices kafka kubernetes",
+    "graphic designer photoshop illustrator branding typography",
+]
+
+
+def memory_kb():
+    """(rss, pss) of this process in kB"""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return fields['Rss'], fields['Pss']
+
+
+def worker(model_dir, compact, barrier, results):
+    baseline = memory_kb()
+    started = time.perf_counter()
+    model = ModelRegistry(model_dir, compact=compact).load()
+    labels = [str(model.predict(text)) for text in TEXTS]
+    load_ms = (time.perf_counter() - started) * 1000
+    barrier.wait()  # every worker has the model before anyone measures
+    rss, pss = memory_kb()
+    results.put((load_ms, rss - baseline[0], pss - baseline[1], labels, model.format))
+    barrier.wait()
+
+
+def run(model_dir, compact, workers):
+    ctx = multiprocessing.get_context('spawn')
+    barrier, results = ctx.Barrier(workers), ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(model_dir, compact, barrier, results)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    rows = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--model-dir', default=str(ROOT / "resume-parser" / "model"))
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for filename in ARTIFACTS.values():
+            shutil.copy2(Path(args.model_dir) / filename, tmp)
+        pickled = ModelRegistry(tmp, compact=False).load()
+        started = time.perf_counter()
+        export(pickled.vectorizer, pickled.classifier, Path(tmp) / COMPACT_DIR,
+               {key: Path(tmp) / filename for key, filename in ARTIFACTS.items()})
+        size = sum(p.stat().st_size for p in (Path(tmp) / COMPACT_DIR).iterdir()) / 1e6
+        print(f"exported in {time.perf_counter() - started:.1f} s ({size:.1f} MB of .npy)")
+        del pickled
+
+        labels = {}
+        for compact in (False, True):
+            rows = run(tmp, compact, args.workers)
+            load_ms = sorted(row[0] for row in rows)
+            labels[compact] = rows[0][3]
+            print(f"{rows[0][4]:<8} x{args.workers}  load p50: {load_ms[len(load_ms) // 2]:7.0f} ms  "
+                  f"RSS/worker: {sum(r[1] for r in rows) / len(rows) / 1024:6.1f} MB  "
+                  f"PSS/worker: {sum(r[2] for r in rows) / len(rows) / 1024:6.1f} MB")
+        print(f"same labels: {labels[False] == labels[True]}")
+
+
+if __name__ == "__main__":
+    main()
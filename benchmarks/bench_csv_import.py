@@ -0,0 +1,76 @@
+"""
+Benchmark: row-by-row CSV import vs the batched bulk importer, on SQLite.
+
+Builds a larger CSV by repeating "Job Listings.csv", imports it into a fresh
+SQLite database both ways and prints rows/sec. No MySQL server needed.
+
+    python benchmarks/bench_csv_import.py [repeat]
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from application.insert_csv import SQLITE_SCHEMA, sqlite_connection, bulk_import_csv
+
+SOURCE_CSV = ROOT / "Job Listings.csv"
+
+
+def legacy_import(csv_path, db_path):
+    # The old insert_csv_to_mysql loop (minus the per-row print), against SQLite
+    df = pd.read_csv(csv_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute(SQLITE_SCHEMA)
+    cursor = conn.cursor()
+    for _, row in df.iterrows():
+        cursor.execute(
+            "INSERT INTO jobs (title, company, location, apply_link) VALUES (?, ?, ?, ?)",
+            (row.get('Title', 'Unknown'), row.get('Company', 'Unknown'),
+             row.get('Location', 'Unknown'), str(row.get('Apply Link', 'Not Available'))[:1024])
+        )
+    conn.commit()
+    conn.close()
+
+
+def count_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / "jobs.csv"
+        df = pd.read_csv(SOURCE_CSV)
+        pd.concat([df] * repeat, ignore_index=True).to_csv(csv_path, index=False)
+        rows = len(df) * repeat
+        print(f"{rows} rows ({len(df)} x {repeat})")
+
+        legacy_db = tmp / "legacy.db"
+        started = time.perf_counter()
+        legacy_import(csv_path, legacy_db)
+        legacy_s = time.perf_counter() - started
+        print(f"row-by-row: {legacy_s:7.2f}s  {rows / legacy_s:10,.0f} rows/sec  ({count_rows(legacy_db)} rows)")
+
+        for batch_size in (100, 1000, 5000):
+            bulk_db = tmp / f"bulk_{batch_size}.db"
+            conn = sqlite_connection(bulk_db)
+            started = time.perf_counter()
+            bulk_import_csv(csv_path, conn, '?', batch_size=batch_size, chunk_size=20000, verbose=False)
+            bulk_s = time.perf_counter() - started
+            conn.close()
+            print(f"bulk {batch_size:>5}: {bulk_s:7.2f}s  {rows / bulk_s:10,.0f} rows/sec  ({count_rows(bulk_db)} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: per-job skill loop vs sparse top-k matching as the job count grows.
+
+Replicates Job Listings.csv up to 100k jobs, builds a JobMatcher with the
+categorization TF-IDF vectorizer, and times one resume against every job:
+the old browser-style ``skill in text`` loop (ported to Python) against
+JobMatcher.top_k. Sparse matching should stay well under 10 ms.
+
+    python benchmarks/bench_job_matching.py
+"""
+import csv
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from application.matching import job_text, load_vectorizer, resume_text
+from application.resume_parser import SKILL_MATCHER
+from common.job_matcher import JobMatcher
+
+CSV_PATH = ROOT / "Job Listings.csv"
+VECTORIZER_PATH = ROOT / "resume-parser" / "model" / "tfidf_vectorizer_categorization.pkl"
+SIZES = (1_672, 10_000, 100_000)
+ROUNDS = 50
+RESUME = {'category': 'Backend Developer', 'skills': ['Python', 'Django', 'AWS', 'Docker', 'PostgreSQL']}
+
+
+def load_jobs(size):
+    with open(CSV_PATH, newline='', encoding='utf-8') as f:
+        rows = [{'title': r['Title'], 'company': r['Company'], 'location': r['Location']} for r in csv.DictReader(f)]
+    return [rows[i % len(rows)] for i in range(size)]
+
+
+def includes_loop(texts, skills):
+    # What JobMatchApp.calculateMatches did for every job
+    scores = []
+    for text in texts:
+        lowered = text.lower()
+        matched = sum(1 for skill in skills if skill.lower() in lowered)
+        scores.append(matched / len(skills) * 100)
+    return sorted(range(len(texts)), key=scores.__getitem__, reverse=True)[:20]
+
+
+def timed(fn, rounds=ROUNDS):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main():
+    vectorizer = load_vectorizer(str(VECTORIZER_PATH))  # with its IDF, as the app scores
+    text = resume_text(RESUME, 'python developer pune')
+    for size in SIZES:
+        jobs = load_jobs(size)
+        texts = [job_text(job) for job in jobs]
+        matcher = JobMatcher(vectorizer, SKILL_MATCHER).fit(jobs, job_text)
+        loop = timed(lambda: includes_loop(texts, RESUME['skills']), rounds=5)
+        sparse_ms = timed(lambda: matcher.top_k(text, RESUME['skills'], k=20))
+        print(f"{size:>7} jobs  build: {matcher.build_seconds * 1000:7.0f} ms  "
+              f"includes loop: {loop:8.2f} ms  sparse top-k: {sparse_ms:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: SELECT * render-all vs keyset pages as the jobs table grows.
+
+Builds SQLite databases of increasing size through the real migrations and
+bulk importer, then times the old full fetch against the first and a deep
+keyset page (plain and filtered). Keyset times should stay flat.
+
+    python benchmarks/bench_job_pagination.py
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from application.jobs import fetch_jobs_page
+from application.migrations import migrate
+
+SIZES = (10_000, 100_000, 1_000_000)
+ROUNDS = 20
+
+
+def fill(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    companies = [f"Company {i}" for i in range(500)]
+    cities = ["Bengaluru", "Pune", "Remote", "Hyderabad", "Chennai"]
+    batch = []
+    for i in range(rows):
+        batch.append((f"Engineer {i % 997}", companies[i % len(companies)], cities[i % len(cities)],
+                      f"https://example.com/jobs/{i}"))
+        if len(batch) == 10_000:
+            conn.executemany("INSERT INTO jobs (title, company, location, apply_link) VALUES (?, ?, ?, ?)", batch)
+            batch = []
+    if batch:
+        conn.executemany("INSERT INTO jobs (title, company, location, apply_link) VALUES (?, ?, ?, ?)", batch)
+    conn.commit()
+    conn.close()
+
+
+def timed(fn):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            db_path = Path(tmp) / f"jobs_{rows}.db"
+            engine = create_engine(f"sqlite:///{db_path}")
+            migrate(engine, log=lambda msg: None)
+            fill(db_path, rows)
+
+            with engine.connect() as conn:
+                deep_cursor = rows - 100
+                full = timed(lambda: [dict(r) for r in conn.execute(text("SELECT * FROM jobs")).mappings()]) \
+                    if rows <= 100_000 else float('nan')
+                first = timed(lambda: fetch_jobs_page(conn))
+                deep = timed(lambda: fetch_jobs_page(conn, cursor=deep_cursor))
+                filtered = timed(lambda: fetch_jobs_page(conn, cursor=rows // 2, company="Company 42"))
+            engine.dispose()
+            print(f"{rows:>9} rows  SELECT *: {full:9.2f} ms  first page: {first:6.3f} ms  "
+                  f"deep page: {deep:6.3f} ms  filtered: {filtered:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: ranked full-text job search as the corpus grows.
+
+Replicates Job Listings.csv into SQLite databases of increasing size through
+the real migrations (FTS5 table plus sync triggers), then times the old
+LIKE '%term%' scan (which must read every match before it could rank them)
+against application.search for a few typical queries. The replicated corpus
+is a worst case for the index: every term recurs once per copy.
+
+    python benchmarks/bench_job_search.py
+"""
+import csv
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from application.migrations import migrate
+from application.search import search_jobs
+
+CSV_PATH = ROOT / "Job Listings.csv"
+COPIES = (1, 10, 60)
+QUERIES = ("python developer", "devops pune", "data scientist remote")
+ROUNDS = 20
+
+
+def load_rows():
+    with open(CSV_PATH, newline='', encoding='utf-8') as f:
+        return [(r['Title'], r['Company'], r['Location'], r['Apply Link']) for r in csv.DictReader(f)]
+
+
+def fill(db_path, rows, copies):
+    conn = sqlite3.connect(db_path)
+    for _ in range(copies):
+        conn.executemany("INSERT INTO jobs (title, company, location, apply_link) VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def like_scan(conn, q):
+    clauses, params = [], {}
+    for i, term in enumerate(q.split()):
+        clauses.append(f"(title LIKE :t{i} OR company LIKE :t{i} OR location LIKE :t{i})")
+        params[f't{i}'] = f"%{term}%"
+    sql = f"SELECT id, title, company, location, apply_link FROM jobs WHERE {' AND '.join(clauses)}"
+    return conn.execute(text(sql), params).fetchall()
+
+
+def timed(fn):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def main():
+    rows = load_rows()
+    with tempfile.TemporaryDirectory() as tmp:
+        for copies in COPIES:
+            db_path = Path(tmp) / f"jobs_{copies}.db"
+            engine = create_engine(f"sqlite:///{db_path}")
+            migrate(engine, log=lambda msg: None)
+            fill(db_path, rows, copies)
+
+            with engine.connect() as conn:
+                for q in QUERIES:
+                    like = timed(lambda: like_scan(conn, q))
+                    first = timed(lambda: search_jobs(conn, q))
+                    later = timed(lambda: search_jobs(conn, q, page=5))
+                    print(f"{len(rows) * copies:>9} rows  {q!r:<24} LIKE scan: {like:8.2f} ms  "
+                          f"search p1: {first:7.2f} ms  p5: {later:7.2f} ms")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: per-pattern re.search loops vs the precompiled pattern bank.
+
+Runs the old degree, institution and field keyword loops (ported from
+app1.py) over every line of the resumes in resume-parser/__DATA__/resumes,
+and the old experience findall loop (ported from application/resume_parser.py)
+over each whole resume, next to the PatternBank entries that replaced them.
+Checks that both return the same results, prints timings, then the bank's
+own counters, slowest first.
+
+    python benchmarks/bench_pattern_bank.py
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+from PyPDF2 import PdfReader
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "resume-parser"))
+
+import app1
+from application.resume_parser import EXPERIENCE_MATCHER, PATTERNS as PARSER_PATTERNS, ResumeParser
+
+RESUMES_DIR = ROOT / "resume-parser" / "__DATA__" / "resumes"
+ROUNDS = 5
+LEGACY_INSTITUTION_PATTERNS = [
+    r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}College of [A-Za-z\s]+",
+    r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}Institute of [A-Za-z\s]+",
+    r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}University of [A-Za-z\s]+",
+    r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}University\b",
+    r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}College\b",
+    r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}Institute\b",
+    r"IIT [A-Za-z]+",
+    r"NIT [A-Za-z]+",
+    r"BITS [A-Za-z]+",
+]
+EXPERIENCE_PATTERNS = [(member.regex.pattern, label) for member, label in zip(
+    EXPERIENCE_MATCHER.members, EXPERIENCE_MATCHER.labels
+)]
+
+
+def legacy_degree(s):
+    s_lower = s.lower()
+    for pat, label in app1.DEGREE_PATTERNS.items():
+        if re.search(pat, s_lower, re.I):
+            return label
+    return None
+
+
+def legacy_institution(entry):
+    for pat in LEGACY_INSTITUTION_PATTERNS:
+        m = re.search(pat, entry, re.I)
+        if m:
+            return m.group(0).strip(" ,.-")
+    return None
+
+
+def bank_institution(entry):
+    # the pattern pass of app1.extract_institution, without its word-chunk fallback
+    hit = app1.INSTITUTION_MATCHER.search(entry)
+    return hit[2][0].strip(" ,.-") if hit else None
+
+
+def legacy_field(entry):
+    for fk in app1.FIELD_KEYWORDS:
+        fk_low = fk.lower()
+        if fk_low in entry.lower() and fk_low not in app1.INVALID_FIELD_WORDS:
+            return fk
+    return None
+
+
+def legacy_experience(text):
+    text_lower = text.lower()
+    for pattern, unit in EXPERIENCE_PATTERNS:
+        matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        if matches:
+            return f"{matches[0]} {unit}"
+    return "Not specified"
+
+
+def pdf_to_text(path):
+    reader = PdfReader(str(path))
+    return ''.join((page.extract_text() or '') + '\n' for page in reader.pages)
+
+
+def timed(fn, items):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / (ROUNDS * len(items)) * 1e6
+
+
+def main():
+    texts = [pdf_to_text(p) for p in sorted(RESUMES_DIR.glob("*.pdf"))]
+    lines = [' '.join(line.split()) for text in texts for line in text.split('\n') if line.strip()]
+    print(f"{len(texts)} resumes, {len(lines)} lines")
+
+    parser = ResumeParser()
+    rows = [
+        ("degree", legacy_degree, app1.normalize_degree_from_text, lines),
+        ("institution", legacy_institution, bank_institution, lines),
+        ("field keyword", legacy_field, app1.FIELD_MATCHER.first, lines),
+        ("experience", legacy_experience, parser.extract_experience, texts),
+    ]
+    for label, legacy, bank, items in rows:
+        same = all(legacy(item) == bank(item) for item in items)
+        print(f"{label:<14} loop: {timed(legacy, items):8.1f} us  bank: {timed(bank, items):8.1f} us  same: {same}")
+
+    print("\nslowest entries:")
+    entries = sorted(app1.PATTERNS.stats() + PARSER_PATTERNS.stats(), key=lambda s: -s['total_ms'])
+    for stats in entries[:8]:
+        print(f"  {stats['name']:<28} calls: {stats['calls']:7d}  hits: {stats['hits']:6d}  "
+              f"total: {stats['total_ms']:9.1f} ms  avg: {stats['avg_us']:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: serial PDF text extraction vs the page-parallel PdfTextExtractor.
+
+Builds a long "portfolio" by concatenating the resumes in
+resume-parser/__DATA__/resumes COPIES times, then extracts it with the old
+serial PyPDF2 and pdfplumber loops (ported from app1.py and
+application/resume_parser.py) and with PdfTextExtractor for each backend,
+in-process and across worker processes. Checks that the texts match and
+prints timings next to the slowest single page.
+
+    python benchmarks/bench_pdf_text.py [workers]
+"""
+import io
+import sys
+import time
+from pathlib import Path
+
+import pdfplumber
+from PyPDF2 import PdfReader, PdfWriter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from common.pdf_text import PdfTextExtractor
+
+RESUMES_DIR = ROOT / "resume-parser" / "__DATA__" / "resumes"
+COPIES = 3
+
+
+def legacy_pypdf2(data):
+    reader = PdfReader(io.BytesIO(data))
+    text = ''
+    for page in range(len(reader.pages)):
+        content = reader.pages[page].extract_text()
+        if content:
+            text += content + '\n'
+    return text
+
+
+def legacy_pdfplumber(data):
+    text = ""
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages:
+            extracted = page.extract_text()
+            if extracted:
+                text += extracted + "\n"
+    return text
+
+
+def portfolio():
+    writer = PdfWriter()
+    for _ in range(COPIES):
+        for path in sorted(RESUMES_DIR.glob("*.pdf")):
+            for page in PdfReader(str(path)).pages:
+                writer.add_page(page)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def slowest_page(data, backend):
+    pdf = pdfplumber.open(io.BytesIO(data)) if backend == "pdfplumber" else None
+    pages = pdf.pages if pdf else PdfReader(io.BytesIO(data)).pages
+    slowest = 0.0
+    for page in pages:
+        _, ms = timed(page.extract_text)
+        slowest = max(slowest, ms)
+    if pdf:
+        pdf.close()
+    return slowest
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    data = portfolio()
+    print(f"{PdfTextExtractor().page_count(data)} pages, {len(data) // 1024} KiB, {workers} workers")
+    for backend, legacy in (("pypdf2", legacy_pypdf2), ("pdfplumber", legacy_pdfplumber)):
+        expected, legacy_ms = timed(legacy, data)
+        serial = PdfTextExtractor([backend], workers=1)
+        parallel = PdfTextExtractor([backend], workers=workers)
+        parallel.extract(data)  # start the pool's processes outside the timing
+        serial_text, serial_ms = timed(serial.extract, data)
+        parallel_text, parallel_ms = timed(parallel.extract, data)
+        parallel.shutdown()
+        print(f"{backend:<11} loop: {legacy_ms:8.1f} ms  in-process: {serial_ms:8.1f} ms  "
+              f"parallel: {parallel_ms:8.1f} ms  slowest page: {slowest_page(data, backend):6.1f} ms  "
+              f"same: {expected == serial_text == parallel_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: per-header section lookups vs the single-pass SectionSegmenter.
+
+Runs the old fuzzy ``get_section_text`` (ported from app1.py) once per
+section a parse needs and SectionSegmenter.segment once per resume over every
+resume in resume-parser/__DATA__/resumes, prints timings and which sections
+each approach found.
+
+    python benchmarks/bench_section_segmenter.py
+"""
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+from PyPDF2 import PdfReader
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from common.section_segmenter import SectionSegmenter
+
+RESUMES_DIR = ROOT / "resume-parser" / "__DATA__" / "resumes"
+ROUNDS = 50
+LOOKUPS = {
+    'education': ['education', 'educational qualification', 'academic qualification'],
+    'experience': ['work experience', 'professional experience', 'experience'],
+    'skills': ['technical skills', 'skills'],
+    'projects': ['projects'],
+    'certifications': ['certifications'],
+}
+STOP_HEADERS = [
+    'education', 'experience', 'work experience', 'professional experience',
+    'skills', 'projects', 'certifications', 'achievements',
+    'publications', 'internships'
+]
+
+
+def clean_pdf_text(text):
+    text = unicodedata.normalize("NFKC", text)
+    text = text.replace("\xa0", " ").replace("​", "")
+    text = re.sub(r"[ ]{2,}", " ", text)
+    return text.strip()
+
+
+def fuzzy_header_regex(header):
+    return r"\s*".join(list(header.strip()))
+
+
+def legacy_section_text(text, header_names, stop_headers=STOP_HEADERS, window_chars=900):
+    # What app1.get_section_text did on every call
+    text_clean = clean_pdf_text(text.lower())
+    for header in header_names:
+        match = re.search(r"\b" + fuzzy_header_regex(header.lower()) + r"\b", text_clean, re.I)
+        if match:
+            start = match.end()
+            stop_pos = len(text_clean)
+            for sh in stop_headers:
+                m2 = re.search(r"\b" + fuzzy_header_regex(sh.lower()) + r"\b", text_clean[start:], re.I)
+                if m2 and start + m2.start() < stop_pos:
+                    stop_pos = start + m2.start()
+            return text[start:min(stop_pos, start + window_chars)]
+    return None
+
+
+def legacy_sections(text):
+    return {name: legacy_section_text(text, headers) for name, headers in LOOKUPS.items()}
+
+
+def pdf_to_text(path):
+    reader = PdfReader(str(path))
+    return ''.join((page.extract_text() or '') + '\n' for page in reader.pages)
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (ROUNDS * len(texts)) * 1000
+
+
+def main():
+    segmenter = SectionSegmenter()
+    texts = [pdf_to_text(p) for p in sorted(RESUMES_DIR.glob("*.pdf"))]
+    print(f"{len(texts)} resumes, {sum(map(len, texts)) // len(texts)} chars on average")
+
+    for path, text in zip(sorted(RESUMES_DIR.glob("*.pdf")), texts):
+        legacy = legacy_sections(text)
+        spans = segmenter.segment(text)
+        found = {name: bool((legacy[name] or '').strip()) for name in LOOKUPS}
+        print(f"  {path.stem:<30} per-header: {','.join(n for n, ok in found.items() if ok):<45} "
+              f"segmenter: {','.join(n for n in LOOKUPS if n in spans)}")
+
+    rows = [
+        ("per-header lookups", timed(legacy_sections, texts)),
+        ("segmenter, one pass", timed(segmenter.segment, texts)),
+    ]
+    for label, ms in rows:
+        print(f"{label:<22} {ms:8.3f} ms/resume")
+
+
+if __name__ == "__main__":
+    main()
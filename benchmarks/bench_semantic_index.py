@@ -0,0 +1,191 @@
+"""
+Benchmark: semantic job index recall and latency against brute force.
+
+Generates clustered unit vectors shaped like MiniLM job embeddings (384d),
+builds a SemanticJobIndex (IVF, written to disk and memory-mapped), and for a
+set of held-out queries compares its top 10 against exact brute-force inner
+product: recall@10 and per-query latency, unfiltered and with a query-time
+filter selecting ~5% of jobs, plus a search after an incremental add.
+Before that it runs SemanticSearch.sync (what ``flask index-jobs`` does)
+against an empty index directory, the first-run path, and fails if it does
+not finish. Needs faiss-cpu; no model download (vectors are synthetic).
+
+    python benchmarks/bench_semantic_index.py --rows 1000000
+"""
+import argparse
+import contextlib
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine, text
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import application.semantic
+from application.semantic import SemanticSearch
+from common.semantic_index import JobEmbedder, SemanticJobIndex
+
+DIM = 384
+K = 10
+SYNC_JOBS = 500
+SYNC_TIMEOUT = 60  # seconds
+
+
+class SyntheticModel:
+    """Stands in for the SentenceTransformer: a random unit vector per text"""
+
+    def get_sentence_embedding_dimension(self):
+        return DIM
+
+    def encode(self, texts, **kwargs):
+        rng = np.random.default_rng(len(texts))
+        vectors = rng.standard_normal((len(texts), DIM), dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class SyntheticEmbedder(JobEmbedder):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model = SyntheticModel()
+
+
+class JobsDB:
+    """The part of application.db.Database that SemanticSearch uses"""
+
+    def __init__(self, url):
+        self.engine = create_engine(url)
+
+    @contextlib.contextmanager
+    def connection(self):
+        with self.engine.connect() as conn:
+            yield conn
+
+
+def first_sync(tmp):
+    """index-jobs on a fresh install: no index file, no meta sidecar, model not loaded"""
+    db = JobsDB(f"sqlite:///{tmp}/jobs.db")
+    with db.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE jobs (id INTEGER PRIMARY KEY, title TEXT, company TEXT, location TEXT)"))
+        conn.execute(text("INSERT INTO jobs (title, company, location) VALUES (:title, :company, :location)"),
+                     [{'title': f"Engineer {i}", 'company': f"Company {i % 17}", 'location': "Remote"}
+                      for i in range(SYNC_JOBS)])
+    config = {
+        'SEMANTIC_INDEX_PATH': f"{tmp}/index/jobs.faiss",
+        'SEMANTIC_MODEL': 'synthetic',
+        'SEMANTIC_CACHE_PATH': f"{tmp}/index/embeddings.db",
+        'SEMANTIC_BATCH_SIZE': 64,
+        'SEMANTIC_THREADS': None,
+        'SEMANTIC_NPROBE': 16,
+    }
+    application.semantic.JobEmbedder = SyntheticEmbedder
+    search = SemanticSearch(config, db)
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(added=search.sync(log=lambda message: None)),
+                              daemon=True)
+    started = time.perf_counter()
+    worker.start()
+    worker.join(SYNC_TIMEOUT)
+    if worker.is_alive():
+        sys.exit(f"sync on an empty index did not finish within {SYNC_TIMEOUT} s")
+    if result.get('added') != SYNC_JOBS or search.load().ntotal != SYNC_JOBS:
+        sys.exit(f"sync on an empty index added {result.get('added')} jobs, expected {SYNC_JOBS}")
+    print(f"first sync: {SYNC_JOBS} jobs indexed in {time.perf_counter() - started:.2f} s")
+
+
+def clustered_vectors(rows, dim, clusters, rng, chunk=100_000):
+    centers = rng.standard_normal((clusters, dim), dtype=np.float32)
+    out = np.empty((rows, dim), dtype=np.float32)
+    for start in range(0, rows, chunk):
+        stop = min(start + chunk, rows)
+        labels = rng.integers(0, clusters, stop - start)
+        block = centers[labels] + 0.6 * rng.standard_normal((stop - start, dim), dtype=np.float32)
+        out[start:stop] = block / np.linalg.norm(block, axis=1, keepdims=True)
+    return out
+
+
+def brute_force(vectors, ids, queries, k, chunk=200_000):
+    """Exact top-k by inner product, scanning vectors in chunks"""
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_ids = np.full((len(queries), k), -1, dtype=np.int64)
+    for start in range(0, len(vectors), chunk):
+        scores = queries @ vectors[start:start + chunk].T
+        all_scores = np.hstack([best_scores, scores])
+        all_ids = np.hstack([best_ids, np.broadcast_to(ids[start:start + chunk], scores.shape)])
+        top = np.argpartition(-all_scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(all_scores, top, axis=1)
+        best_ids = np.take_along_axis(all_ids, top, axis=1)
+    return best_ids
+
+
+def recall(found, truth):
+    hits = sum(len(set(f[f >= 0]) & set(t[t >= 0])) for f, t in zip(found, truth))
+    return hits / max(1, sum(len(t[t >= 0]) for t in truth))
+
+
+def timed_search(index, queries, ids=None):
+    latencies, found = [], []
+    for query in queries:
+        started = time.perf_counter()
+        _, result = index.search(query[None, :], K, ids)
+        latencies.append((time.perf_counter() - started) * 1000)
+        found.append(result[0])
+    return np.array(found), np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--nprobe', type=int, nargs='+', default=[8, 16, 32])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first_sync(tmp)
+
+    rng = np.random.default_rng(0)
+    vectors = clustered_vectors(args.rows + args.queries, DIM, max(100, args.rows // 500), rng)
+    vectors, queries = vectors[:args.rows], vectors[args.rows:]
+    ids = np.arange(1, args.rows + 1, dtype=np.int64)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SemanticJobIndex(Path(tmp) / 'jobs.faiss', DIM)
+        started = time.perf_counter()
+        index.build(ids, vectors)
+        print(f"{args.rows} vectors: built in {time.perf_counter() - started:.1f} s, "
+              f"nlist={index.nlist}, file {index.path.stat().st_size / 1e6:.0f} MB (memory-mapped)")
+
+        started = time.perf_counter()
+        truth = brute_force(vectors, ids, queries, K)
+        brute_ms = (time.perf_counter() - started) * 1000 / len(queries)
+        print(f"brute force: {brute_ms:8.2f} ms/query")
+
+        for nprobe in args.nprobe:
+            index.nprobe = nprobe
+            found, p50, p99 = timed_search(index, queries)
+            print(f"nprobe={nprobe:<3}  recall@{K}: {recall(found, truth):.3f}  p50: {p50:6.2f} ms  p99: {p99:6.2f} ms")
+
+        # Query-time filter: restrict to ~5% of jobs
+        index.nprobe = args.nprobe[len(args.nprobe) // 2]
+        subset = np.sort(rng.choice(ids, max(K, args.rows // 20), replace=False))
+        truth = brute_force(vectors[subset - 1], subset, queries, K)
+        found, p50, p99 = timed_search(index, queries, subset)
+        print(f"filtered 5%  recall@{K}: {recall(found, truth):.3f}  p50: {p50:6.2f} ms  p99: {p99:6.2f} ms")
+
+        # Incremental add: new jobs land in the delta and are searchable at once
+        extra = clustered_vectors(10_000, DIM, 50, rng)
+        extra_ids = np.arange(args.rows + 1, args.rows + 1 + len(extra), dtype=np.int64)
+        index.add(extra_ids, extra)
+        _, result = index.search(extra[:100], 1)
+        print(f"after adding {len(extra)}: self-hit rate {np.mean(result[:, 0] == extra_ids[:100]):.2f}")
+        started = time.perf_counter()
+        index.compact()
+        print(f"compacted into the file in {time.perf_counter() - started:.1f} s, total {index.ntotal}")
+
+
+if __name__ == "__main__":
+    main()
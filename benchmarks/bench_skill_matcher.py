@@ -0,0 +1,97 @@
+"""
+Benchmark: per-skill regex scans vs the single-pass SkillMatcher.
+
+Runs both implementations over every resume in resume-parser/__DATA__/resumes,
+checks that they extract exactly the same skills and prints timings.
+
+    python benchmarks/bench_skill_matcher.py
+"""
+import ast
+import re
+import sys
+import time
+from pathlib import Path
+
+from PyPDF2 import PdfReader
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from common.skill_matcher import SkillMatcher
+from application.resume_parser import SKILLS_DATABASE
+
+RESUMES_DIR = ROOT / "resume-parser" / "__DATA__" / "resumes"
+ROUNDS = 20
+
+
+def load_full_skills_list():
+    # Read the literal straight from app1.py so the benchmark does not need the
+    # model files, selenium or FastAPI just to get at a list of strings
+    tree = ast.parse((ROOT / "resume-parser" / "app1.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "FULL_SKILLS_LIST":
+            return ast.literal_eval(node.value)
+    raise RuntimeError("FULL_SKILLS_LIST not found in app1.py")
+
+
+def legacy_full_list(body, skills):
+    found = []
+    for skill in skills:
+        if re.search(r'\b' + re.escape(skill) + r'\b', body, re.IGNORECASE):
+            found.append(skill)
+    unique_found = []
+    for s in skills:
+        if s in found and s not in unique_found:
+            unique_found.append(s)
+    return unique_found
+
+
+def legacy_database(text, database):
+    skills_found = set()
+    text_lower = text.lower()
+    for skill, aliases in database.items():
+        for alias in aliases:
+            if re.search(r'\b' + re.escape(alias) + r'\b', text_lower):
+                skills_found.add(skill)
+                break
+    return sorted(skills_found)
+
+
+def pdf_to_text(path):
+    reader = PdfReader(str(path))
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (ROUNDS * len(texts)) * 1000
+
+
+def main():
+    full_list = load_full_skills_list()
+    full_matcher = SkillMatcher(full_list)
+    db_matcher = SkillMatcher(SKILLS_DATABASE)
+
+    texts = [pdf_to_text(p) for p in sorted(RESUMES_DIR.glob("*.pdf"))]
+    print(f"{len(texts)} resumes, {sum(map(len, texts)) // len(texts)} chars on average")
+
+    for text in texts:
+        assert legacy_full_list(text, full_list) == full_matcher.extract(text)
+        assert legacy_database(text, SKILLS_DATABASE) == sorted(db_matcher.find(text))
+    print("outputs identical for both skill lists")
+
+    rows = [
+        ("FULL_SKILLS_LIST  regex", timed(lambda t: legacy_full_list(t, full_list), texts)),
+        ("FULL_SKILLS_LIST  matcher", timed(full_matcher.extract, texts)),
+        ("skills_database   regex", timed(lambda t: legacy_database(t, SKILLS_DATABASE), texts)),
+        ("skills_database   matcher", timed(db_matcher.find, texts)),
+    ]
+    for label, ms in rows:
+        print(f"{label:<28} {ms:8.3f} ms/resume")
+
+
+if __name__ == "__main__":
+    main()
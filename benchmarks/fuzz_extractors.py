@@ -0,0 +1,166 @@
+"""
+Fuzz/benchmark: resume extractors on adversarial text, with a time ceiling.
+
+Badly extracted PDFs produce text no regex author had in mind: whole
+documents on one line, endless runs of digits, separators or spaced-out
+letters. Any pattern that backtracks super-linearly on such input pins a
+parse worker for seconds or minutes. This suite generates that kind of text
+(plus a real resume repeated to the same size) and times every extractor of
+app1.py, apps.py and application/resume_parser.py on it.
+
+Each case runs in a forked process, killed after --kill-after seconds, so a
+catastrophic pattern shows up as a timeout instead of hanging the run. Cases
+slower than --ceiling-ms fail; --scaling also times each case at a quarter of
+the size and fails anything growing much faster than linearly. Exits 1 on
+any failure.
+
+    python benchmarks/fuzz_extractors.py --chars 100000 --ceiling-ms 1000
+"""
+import argparse
+import gc
+import logging
+import multiprocessing
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "resume-parser"))
+
+import app1
+import apps
+from application.resume_parser import ResumeParser
+
+RESUMES_DIR = ROOT / "resume-parser" / "__DATA__" / "resumes"
+MAX_GROWTH = 8.0  # 4x the input may take at most this much longer (linear is 4)
+GROWTH_FLOOR = 0.05  # seconds; below this, growth is timing noise
+REPEAT = 3  # runs per case, best kept
+
+
+def _fill(size, pick):
+    parts, length = [], 0
+    while length < size:
+        part = pick()
+        parts.append(part)
+        length += len(part)
+    return ''.join(parts)[:size]
+
+
+def generators(rng):
+    """{name: fn(size) -> text}"""
+    sample = app1.pdf_to_text(sorted(RESUMES_DIR.glob('*.pdf'))[0])
+    words = ['Abc', 'Defg', 'Hij', '&', ',', '-', '.', 'Klmno', 'Pq', 'Rstu', '2019']
+    return {
+        # a real resume, repeated: the baseline every other case is compared to
+        'resume repeated': lambda n: (sample * (n // len(sample) + 1))[:n],
+        # one endless line of capitalised words and separators, no institution keyword
+        'one line, no keywords': lambda n: _fill(n, lambda: rng.choice(words) + ' '),
+        # the same, with a keyword at the very end only
+        'one line, keyword last': lambda n: _fill(n - 20, lambda: rng.choice(words) + ' ') + ' Stanford University',
+        # a degree up front sends the whole text through the institution patterns
+        'degree, then one long name': lambda n: 'B.Tech ' + _fill(n - 7, lambda: rng.choice(words) + ' '),
+        'digit run': lambda n: ''.join(rng.choice('0123456789') for _ in range(n)),
+        'digits then experience': lambda n: _fill(n, lambda: '9' * rng.randint(50, 500) + ' years experiance '),
+        'label then separators': lambda n: _fill(n, lambda: rng.choice(['phone', 'contact', 'experience', 'exp'])
+                                              + rng.choice([':', ' ', '\t', ' : ']) * rng.randint(20, 300) + 'x'),
+        'email-like run': lambda n: _fill(n, lambda: rng.choice(['a.', 'b-', 'c_', '1%', 'x@y.', 'z.'])),
+        'url run at the end': lambda n: 'Resume\n' + _fill(n - 7, lambda: rng.choice(['http', '#tag', 'x/', '.com'])),
+        'headers without line breaks': lambda n: _fill(n, lambda: rng.choice(
+            ['skills ', 'education ', 'experience ', 'projects ', 'S K I L L S ', 'E d u c a t i o n '])),
+        'degree mentions': lambda n: _fill(n, lambda: rng.choice(
+            ['B. ', 'M. ', 'Bachelor ', 'Master of ', 'B.Tech in ', 'Ph.D ', 'in ', 'of ', 'College ', 'Institute of '])),
+        'blank lines and spaces': lambda n: _fill(n, lambda: rng.choice(['\n', ' ', '\t', '\n \n', ' ', '​'])),
+    }
+
+
+def extractors():
+    """{name: fn(text)}; each gets a fresh document, as one request would"""
+    parser = ResumeParser()
+    return {
+        'app1.cleanResume': app1.cleanResume,
+        'app1.segment': app1.SECTION_SEGMENTER.segment,
+        'app1.name': lambda t: app1.extract_name_from_resume(t + '\nx'),  # needs one non-blank line
+        'app1.email': app1.extract_email_from_resume,
+        'app1.phone': app1.extract_contact_number_from_resume,
+        'app1.skills': app1.extract_skills_from_resume,
+        'app1.education': app1.extract_education_from_resume,
+        'apps.cleanResume': apps.cleanResume,
+        'apps.name': apps.extract_name_from_resume,
+        'apps.email': apps.extract_email_from_resume,
+        'apps.phone': apps.extract_contact_number_from_resume,
+        'apps.skills': apps.extract_skills_from_resume,
+        'apps.education': apps.extract_education_from_resume,
+        'resume_parser.skills': parser.extract_skills,
+        'resume_parser.experience': parser.extract_experience,
+        'resume_parser.name': parser.extract_name,
+    }
+
+
+def _run(fn, text, conn):
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn(text)
+        conn.send(time.perf_counter() - started)
+
+
+def timed(fn, text, kill_after):
+    """Best of REPEAT runs of fn(text) in a forked process, in seconds, or None if
+    not even one finished within kill_after"""
+    ctx = multiprocessing.get_context('fork')
+    receiver, sender = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_run, args=(fn, text, sender))
+    proc.start()
+    runs = []
+    deadline = time.monotonic() + kill_after
+    while len(runs) < REPEAT and receiver.poll(max(0.0, deadline - time.monotonic())):
+        runs.append(receiver.recv())
+    proc.kill()
+    proc.join()
+    return min(runs) if runs else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--chars', type=int, default=100_000, help="size of each generated text")
+    parser.add_argument('--ceiling-ms', type=float, default=1000.0, help="time allowed per extractor and text")
+    parser.add_argument('--kill-after', type=float, default=20.0, help="seconds before a case is killed")
+    parser.add_argument('--scaling', action='store_true', help="also fail cases growing faster than linearly")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    texts = {name: make(args.chars) for name, make in generators(random.Random(args.seed)).items()}
+    small = {name: text[:len(text) // 4] for name, text in texts.items()}  # same structure, a quarter the size
+    cases = extractors()
+    gc.freeze()  # a collection in a forked case would otherwise walk (and copy) the loaded models
+    failures = []
+    for ext_name, fn in cases.items():
+        print(ext_name)
+        for text_name, text in texts.items():
+            seconds = timed(fn, text, args.kill_after)
+            if seconds is None:
+                failures.append((ext_name, text_name, f"killed after {args.kill_after:.0f} s"))
+                print(f"  {text_name:<28} KILLED after {args.kill_after:.0f} s")
+                continue
+            note = ''
+            if seconds * 1000 > args.ceiling_ms:
+                failures.append((ext_name, text_name, f"{seconds * 1000:.0f} ms"))
+                note = '  OVER CEILING'
+            if args.scaling:
+                quarter = timed(fn, small[text_name], args.kill_after) or 0.0
+                growth = seconds / quarter if seconds > GROWTH_FLOOR and quarter else 0.0
+                if growth > MAX_GROWTH:
+                    failures.append((ext_name, text_name, f"{growth:.1f}x slower on 4x the text"))
+                    note += f'  GROWS {growth:.1f}x'
+            print(f"  {text_name:<28} {seconds * 1000:9.1f} ms{note}")
+
+    print(f"\n{len(failures)} failures (ceiling {args.ceiling_ms:.0f} ms for {args.chars} chars)")
+    for ext_name, text_name, what in failures:
+        print(f"  {ext_name} on '{text_name}': {what}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
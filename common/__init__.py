@@ -0,0 +1 @@
+"""Engines shared by the resume parser, the job agent and the job board app."""
@@ -0,0 +1,123 @@
+"""
+Concurrent application scheduler with per-host politeness.
+
+apply_to_jobs_batch used to apply to one job at a time and sleep a fixed delay
+after each, whatever site came next. ApplyScheduler runs several browser
+workers in parallel and only rate-limits where it matters: each target host
+gets at most ``max_per_host`` jobs in flight and a ``min_interval`` gap between
+one job finishing and the next starting. Jobs on different ATS domains proceed
+concurrently; jobs on the same domain keep the old spacing.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+logger = logging.getLogger('job_agent')
+
+
+def job_host(url):
+    """Politeness key for a job URL (hostname without a leading www.)"""
+    host = (urlparse(url or '').hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class ApplyScheduler:
+    """Hands jobs to worker threads while honouring per-host limits."""
+
+    def __init__(self, workers=1, min_interval=0.0, max_per_host=1):
+        self.workers = max(1, workers)
+        self.min_interval = min_interval
+        self.max_per_host = max(1, max_per_host)
+
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._in_flight = {}
+        self._next_start = {}
+
+    def _take(self):
+        """Next job whose host is free; None when nothing is left. Holds the lock."""
+        while True:
+            if not self._pending:
+                return None
+            now = time.monotonic()
+            wake = None
+            for position, (index, job, host) in enumerate(self._pending):
+                if self._in_flight.get(host, 0) >= self.max_per_host:
+                    continue
+                ready_at = self._next_start.get(host, 0.0)
+                if ready_at <= now:
+                    del self._pending[position]
+                    self._in_flight[host] = self._in_flight.get(host, 0) + 1
+                    return index, job, host
+                wake = ready_at if wake is None else min(wake, ready_at)
+            # Every pending host is busy or cooling down
+            self._cond.wait(None if wake is None else wake - now)
+
+    def _finish(self, host):
+        with self._cond:
+            self._in_flight[host] -= 1
+            self._next_start[host] = time.monotonic() + self.min_interval
+            self._cond.notify_all()
+
+    def _worker(self, worker_index, open_worker, on_result):
+        try:
+            worker = open_worker(worker_index)
+        except Exception as e:
+            logger.warning(f"Apply worker {worker_index} could not start: {str(e)}")
+            worker = None
+        if worker is None:
+            return
+
+        apply, close = worker
+        try:
+            while True:
+                with self._cond:
+                    taken = self._take()
+                if taken is None:
+                    return
+                index, job, host = taken
+                try:
+                    result = apply(job)
+                except Exception as e:
+                    logger.error(f"Apply worker {worker_index} failed on job {index}: {str(e)}")
+                    result = None
+                finally:
+                    self._finish(host)
+                on_result(index, job, result)
+        finally:
+            if close:
+                close()
+
+    def run(self, jobs, open_worker, on_result):
+        """Apply to every job and block until all are done.
+
+        open_worker(worker_index) returns ``(apply, close)`` for a worker with
+        its own browser (``close`` may be None), or None/raises when no browser
+        is available. apply(job) runs in the worker thread and
+        on_result(index, job, result) is called as each job finishes; jobs left
+        over because no worker could start are reported with result None.
+        """
+        with self._cond:
+            self._pending = deque((i, job, job_host(job.get('url'))) for i, job in enumerate(jobs))
+
+        count = min(self.workers, len(jobs))
+        threads = [
+            threading.Thread(
+                target=self._worker, args=(i, open_worker, on_result),
+                name=f"apply-worker-{i}", daemon=True
+            )
+            for i in range(1, count)
+        ]
+        for thread in threads:
+            thread.start()
+        # Worker 0 runs on the calling thread (it usually reuses the caller's browser)
+        self._worker(0, open_worker, on_result)
+        for thread in threads:
+            thread.join()
+
+        with self._cond:
+            leftover, self._pending = list(self._pending), deque()
+        for index, job, host in leftover:
+            on_result(index, job, None)
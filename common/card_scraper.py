@@ -0,0 +1,114 @@
+"""
+Batched scraping of job search result cards.
+
+Walking the cards from Python costs one ``find_element`` round-trip per
+selector per field per card; a 100-card LinkedIn page with its selector
+fallbacks runs to hundreds of calls. scrape_cards sends the card selector and
+the per-field fallback lists to the page once and gets every card back as a
+plain record from a single ``execute_script``.
+
+A spec is data: ``card`` is the CSS selector of one result card and ``fields``
+maps each output key to its fallback selectors. For each field the first
+selector whose element has non-empty text wins (``attr`` reads that attribute
+instead of the text, and then any matching element will do). Cards missing a
+``required`` field are dropped; other missing fields take the caller's default.
+"""
+import time
+
+CARD_SCRIPT = """
+var spec = arguments[0], limit = arguments[1];
+var cards = Array.prototype.slice.call(document.querySelectorAll(spec.card), 0, limit);
+var keys = Object.keys(spec.fields);
+var records = [];
+cards.forEach(function (card) {
+    var record = {};
+    for (var k = 0; k < keys.length; k++) {
+        var field = spec.fields[keys[k]], value = null;
+        for (var s = 0; s < field.selectors.length && value === null; s++) {
+            var el = card.querySelector(field.selectors[s]);
+            if (!el) { continue; }
+            if (field.attr) {
+                value = el[field.attr] || el.getAttribute(field.attr) || '';
+            } else {
+                var text = (el.innerText || el.textContent || '').trim();
+                if (text) { value = text; }
+            }
+        }
+        if (value === null && field.required) { return; }
+        record[keys[k]] = value;
+    }
+    records.push(record);
+});
+return {cards: cards.length, records: records};
+"""
+
+LINKEDIN_CARDS = {
+    'card': 'div.base-card',
+    'fields': {
+        'title': {
+            'selectors': [
+                'h3.base-search-card__title',
+                'h3.job-card-list__title',
+                'a.job-card-container__link',
+                '.job-card-list__title--link',
+            ],
+            'required': True,
+        },
+        'url': {
+            'selectors': [
+                'a.base-card__full-link',
+                'a.job-card-container__link',
+                'a.job-card-list__title',
+            ],
+            'attr': 'href',
+            'required': True,
+        },
+        'company': {
+            'selectors': [
+                'h4.base-search-card__subtitle',
+                'a.job-card-container__company-name',
+                '.job-card-container__primary-description',
+            ],
+        },
+        'location': {
+            'selectors': [
+                'span.job-search-card__location',
+                '.job-card-container__metadata-item',
+                'span.job-card-container__location',
+            ],
+        },
+    },
+}
+
+INDEED_CARDS = {
+    'card': 'div.job_seen_beacon',
+    'fields': {
+        'title': {'selectors': ['h2.jobTitle a'], 'required': True},
+        'url': {'selectors': ['h2.jobTitle a'], 'attr': 'href', 'required': True},
+        'company': {'selectors': ["span[data-testid='company-name']"]},
+        'location': {'selectors': ["div[data-testid='text-location']"]},
+    },
+}
+
+
+def scrape_cards(driver, spec, limit, defaults=None, **extra):
+    """Scrape up to ``limit`` cards in one round-trip.
+
+    Returns ``(records, stats)``; each record gets ``defaults`` for missing
+    fields plus the ``extra`` keys (e.g. ``platform``), and stats holds the
+    card count and parse time in milliseconds.
+    """
+    defaults = defaults or {}
+    started = time.perf_counter()
+    data = driver.execute_script(CARD_SCRIPT, spec, limit) or {}
+    records = []
+    for raw in data.get('records') or []:
+        record = {key: value if value is not None else defaults.get(key) for key, value in raw.items()}
+        record.update(extra)
+        records.append(record)
+    stats = {
+        'cards': data.get('cards', 0),
+        'parsed': len(records),
+        'parse_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
+    return records, stats
@@ -0,0 +1,363 @@
+"""
+Memory-mappable export of the categorization model.
+
+Every parse worker unpickled its own copy of the TF-IDF vectorizer (a
+30k-entry Python dict plus an IDF matrix) and the RandomForest (one Python
+object and a set of node arrays per tree), so each process paid the full
+deserialization at start and held a private copy of the same read-only data.
+``export`` rewrites a validated pickle pair into plain ``.npy`` arrays under
+``<model dir>/compact/``:
+
+- the vocabulary as a sorted fixed-width byte-string array with its column
+  numbers beside it, looked up with one ``searchsorted`` per document;
+- the IDF weights as a float64 vector;
+- every tree of the forest concatenated into flat node arrays (children,
+  feature, threshold) with the leaf class probabilities in their own table.
+
+``load_compact`` opens them with ``np.load(mmap_mode='r')``: nothing is
+parsed, pages are read on first touch and shared between every process
+mapping the same files. CompactVectorizer and CompactForest reproduce the
+arithmetic of the sklearn objects they were exported from (token pattern,
+counts, IDF product, sequential l2 norm, float32 thresholds, estimator-order
+probability sums), so predictions are identical to the pickled model's.
+
+    python -m common.compact_model resume-parser/model [--version v2]
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+from common.parse_cache import file_digest
+
+FORMAT_VERSION = 1
+COMPACT_DIR = 'compact'
+META_FILE = 'meta.json'
+BLOCK_ROWS = 64  # rows densified at a time for tree walks
+
+
+class CompactFormatError(Exception):
+    """The compact export is missing, stale or cannot represent the model."""
+
+
+def _idf(tfidf):
+    """IDF weights the transformer was fitted with.
+
+    Pickles from older scikit-learn keep them only in ``_idf_diag``; newer
+    releases expose ``idf_``.
+    """
+    idf = getattr(tfidf, 'idf_', None)
+    if idf is None and hasattr(tfidf, '_idf_diag'):
+        idf = tfidf._idf_diag.diagonal()
+    return None if idf is None else np.asarray(idf, dtype=np.float64)
+
+
+def _vectorizer_arrays(vectorizer):
+    if getattr(vectorizer, 'analyzer', 'word') != 'word' or tuple(getattr(vectorizer, 'ngram_range', (1, 1))) != (1, 1):
+        raise CompactFormatError("only word unigram vectorizers can be exported")
+    if getattr(vectorizer, 'preprocessor', None) or getattr(vectorizer, 'tokenizer', None) \
+            or getattr(vectorizer, 'strip_accents', None):
+        raise CompactFormatError("custom preprocessors, tokenizers and accent stripping cannot be exported")
+    tfidf = getattr(vectorizer, '_tfidf', None)
+    if tfidf is None:
+        raise CompactFormatError("vectorizer is not a TfidfVectorizer")
+    if tfidf.norm not in ('l1', 'l2', None):
+        raise CompactFormatError(f"unsupported norm {tfidf.norm!r}")
+
+    terms = sorted(vectorizer.vocabulary_)
+    encoded = [term.encode('utf-8') for term in terms]
+    vocab = np.array(encoded, dtype=f'S{max(map(len, encoded))}')
+    # Byte order and str order agree for UTF-8, but sort the bytes to be sure
+    order = np.argsort(vocab, kind='stable')
+    vocab = vocab[order]
+    columns = np.array([vectorizer.vocabulary_[terms[i]] for i in order], dtype=np.int32)
+    arrays = {'vocab': vocab, 'vocab_columns': columns}
+
+    idf = _idf(tfidf) if tfidf.use_idf else None
+    if tfidf.use_idf:
+        if idf is None:
+            raise CompactFormatError("vectorizer has no fitted IDF weights")
+        arrays['idf'] = idf
+    params = {
+        'n_features': len(terms),
+        'lowercase': bool(vectorizer.lowercase),
+        'token_pattern': vectorizer.token_pattern,
+        'binary': bool(vectorizer.binary),
+        'norm': tfidf.norm,
+        'use_idf': bool(tfidf.use_idf),
+        'sublinear_tf': bool(tfidf.sublinear_tf),
+    }
+    return arrays, params
+
+
+def _forest_arrays(classifier):
+    estimators = getattr(classifier, 'estimators_', None)
+    if not estimators or getattr(classifier, 'n_outputs_', 1) != 1:
+        raise CompactFormatError("classifier is not a fitted single-output tree ensemble")
+
+    n_classes = len(classifier.classes_)
+    left, right, feature, threshold, leaf, values, roots = [], [], [], [], [], [], []
+    offset = leaves = max_depth = 0
+    for estimator in estimators:
+        tree = estimator.tree_
+        is_leaf = tree.children_left == -1
+        node_ids = np.arange(tree.node_count, dtype=np.int64) + offset
+        # Leaves loop back to themselves on an always-true test, so a walk
+        # that overshoots a leaf stays on it
+        left.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+        right.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+        leaf_ids = np.full(tree.node_count, -1, dtype=np.int64)
+        leaf_ids[is_leaf] = np.arange(is_leaf.sum()) + leaves
+        leaf.append(leaf_ids)
+        # Leaf rows normalised the way DecisionTreeClassifier.predict_proba does:
+        # scikit-learn >= 1.4 stores fractions, older releases weighted class
+        # counts (an all-zero row is left as is)
+        proba = tree.value[is_leaf, 0, :n_classes].astype(np.float64)
+        normalizer = proba.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        values.append(proba / normalizer)
+        roots.append(offset)
+        offset += tree.node_count
+        leaves += int(is_leaf.sum())
+        max_depth = max(max_depth, int(tree.max_depth))
+
+    classes = np.asarray(classifier.classes_)
+    if classes.dtype == object:
+        classes = classes.astype(str)
+    arrays = {
+        'node_left': np.concatenate(left).astype(np.int32),
+        'node_right': np.concatenate(right).astype(np.int32),
+        'node_feature': np.concatenate(feature).astype(np.int32),
+        'node_threshold': np.concatenate(threshold).astype(np.float64),
+        'node_leaf': np.concatenate(leaf).astype(np.int32),
+        'leaf_values': np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+        'roots': np.array(roots, dtype=np.int32),
+        'classes': classes,
+    }
+    params = {
+        'n_features': int(classifier.n_features_in_),
+        'n_trees': len(estimators),
+        'n_nodes': offset,
+        'max_depth': max_depth,
+    }
+    return arrays, params
+
+
+def export(vectorizer, classifier, out_dir, sources=None):
+    """Write the compact form of a vectorizer/classifier pair to out_dir.
+
+    ``sources`` maps artifact keys to the pickles they came from; their size,
+    mtime and sha256 are recorded so a loader can tell when the export is
+    stale. The directory is built beside out_dir and renamed into place, so
+    readers never see a partial export.
+    """
+    vectorizer_arrays, vectorizer_params = _vectorizer_arrays(vectorizer)
+    forest_arrays, forest_params = _forest_arrays(classifier)
+    if vectorizer_params['n_features'] != forest_params['n_features']:
+        raise CompactFormatError(
+            f"vectorizer has {vectorizer_params['n_features']} features, "
+            f"classifier expects {forest_params['n_features']}"
+        )
+
+    out_dir = Path(out_dir)
+    tmp_dir = out_dir.with_name(out_dir.name + '.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    for name, array in {**vectorizer_arrays, **forest_arrays}.items():
+        np.save(tmp_dir / f'{name}.npy', array, allow_pickle=False)
+
+    meta = {
+        'format': FORMAT_VERSION,
+        'vectorizer': vectorizer_params,
+        'forest': forest_params,
+        'sources': {
+            key: {'size': Path(path).stat().st_size, 'mtime_ns': Path(path).stat().st_mtime_ns,
+                  'sha256': file_digest(path)}
+            for key, path in (sources or {}).items()
+        },
+        'exported_at': time.time(),
+    }
+    (tmp_dir / META_FILE).write_text(json.dumps(meta, indent=2), encoding='utf-8')
+
+    old_dir = out_dir.with_name(out_dir.name + '.old')
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if out_dir.exists():
+        # Processes that mapped the old files keep their pages until they reload
+        os.replace(out_dir, old_dir)
+    os.replace(tmp_dir, out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return meta
+
+
+class CompactVectorizer:
+    """TfidfVectorizer.transform over memory-mapped vocabulary and IDF arrays."""
+
+    def __init__(self, arrays, params):
+        self.vocab = arrays['vocab']
+        self.vocab_columns = arrays['vocab_columns']
+        self.idf = arrays.get('idf')
+        self.n_features = params['n_features']
+        self.lowercase = params['lowercase']
+        self.token_pattern = re.compile(params['token_pattern'])
+        self.binary = params['binary']
+        self.norm = params['norm']
+        self.sublinear_tf = params['sublinear_tf']
+        self._width = self.vocab.dtype.itemsize
+
+    def _weights(self, data, columns, indptr):
+        if self.binary:
+            data = np.ones_like(data)
+        if self.sublinear_tf:
+            data = np.log(data) + 1.0
+        if self.idf is not None:
+            data = data * self.idf[columns]
+        if self.norm:
+            squares = data * data if self.norm == 'l2' else np.abs(data)
+            for start, stop in zip(indptr[:-1], indptr[1:]):
+                if start == stop:
+                    continue
+                # Running sum in index order, as sklearn's in-place row normalizers do
+                total = np.add.accumulate(squares[start:stop])[-1]
+                if total != 0.0:
+                    data[start:stop] /= np.sqrt(total) if self.norm == 'l2' else total
+        return data
+
+    def transform(self, raw_documents):
+        """Documents to a CSR TF-IDF matrix; one vocabulary lookup for the batch"""
+        tokens, rows = [], []
+        for doc in raw_documents:
+            found = self.token_pattern.findall(doc.lower() if self.lowercase else doc)
+            tokens.extend(found)
+            rows.append(len(found))
+        n_docs = len(rows)
+        rows = np.repeat(np.arange(n_docs, dtype=np.int64), rows)
+        # Tokens never contain a newline, so one encode + split converts them all
+        tokens = np.array('\n'.join(tokens).encode('utf-8').split(b'\n') if tokens else [], dtype=np.bytes_)
+        # Anything wider than the widest term can't be in the vocabulary
+        fits = np.char.str_len(tokens) <= self._width
+        rows, tokens = rows[fits], tokens[fits].astype(self.vocab.dtype)
+
+        pos = np.searchsorted(self.vocab, tokens)
+        pos[pos == len(self.vocab)] = 0
+        known = self.vocab[pos] == tokens
+        # (row, column) keys sort into CSR order; their multiplicity is the count
+        keys, counts = np.unique(
+            rows[known] * self.n_features + self.vocab_columns[pos[known]], return_counts=True
+        )
+        rows, columns = np.divmod(keys, self.n_features)
+        indptr = np.zeros(n_docs + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_docs), out=indptr[1:])
+        data = self._weights(counts.astype(np.float64), columns, indptr)
+        return sparse.csr_matrix((data, columns, indptr), shape=(n_docs, self.n_features))
+
+
+class CompactForest:
+    """RandomForestClassifier.predict over flat memory-mapped node arrays."""
+
+    def __init__(self, arrays, params):
+        self.left = arrays['node_left']
+        self.right = arrays['node_right']
+        self.feature = arrays['node_feature']
+        self.threshold = arrays['node_threshold']
+        self.leaf = arrays['node_leaf']
+        self.leaf_values = arrays['leaf_values']
+        self.roots = np.asarray(arrays['roots'])
+        self.classes_ = arrays['classes']
+        self.n_features_in_ = params['n_features']
+        self.max_depth = params['max_depth']
+
+    def _leaves(self, dense):
+        """Leaf reached in every tree by every row of dense, shape (rows, trees)"""
+        (n_rows, n_features), n_trees = dense.shape, len(self.roots)
+        nodes = np.tile(self.roots.astype(np.int64), n_rows)
+        # Walks still inside a tree: their slot in nodes, node, and row offset in dense
+        walks = np.flatnonzero(self.leaf[nodes] < 0)
+        current = nodes[walks]
+        offsets = walks // n_trees * n_features
+        values = dense.ravel()
+        while len(walks):
+            go_left = values.take(offsets + self.feature.take(current)) <= self.threshold.take(current)
+            current = np.where(go_left, self.left.take(current), self.right.take(current))
+            inside = self.leaf.take(current) < 0
+            if not inside.all():
+                nodes[walks[~inside]] = current[~inside]
+                walks, current, offsets = walks[inside], current[inside], offsets[inside]
+        return self.leaf.take(nodes).reshape(n_rows, n_trees)
+
+    def predict_proba(self, X, block=BLOCK_ROWS):
+        X = sparse.csr_matrix(X, dtype=np.float32)  # the dtype sklearn's trees compare in
+        proba = np.empty((X.shape[0], self.leaf_values.shape[1]))
+        for start in range(0, X.shape[0], block):
+            leaves = self._leaves(X[start:start + block].toarray())
+            # Summed tree by tree in estimator order, like ForestClassifier
+            proba[start:start + block] = np.add.accumulate(self.leaf_values[leaves], axis=1)[:, -1] / len(self.roots)
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+
+def load_compact(path, sources=None):
+    """Map an export; raises CompactFormatError if it is absent or stale.
+
+    ``sources`` maps artifact keys to the current pickles: the export must
+    have been made from files of the same size and mtime (or content).
+    """
+    path = Path(path)
+    meta_path = path / META_FILE
+    if not meta_path.exists():
+        raise CompactFormatError(f"{path}: no compact export")
+    meta = json.loads(meta_path.read_text(encoding='utf-8'))
+    if meta.get('format') != FORMAT_VERSION:
+        raise CompactFormatError(f"{path}: format {meta.get('format')} is not {FORMAT_VERSION}")
+    for key, source in (sources or {}).items():
+        recorded = meta['sources'].get(key)
+        if recorded is None:
+            raise CompactFormatError(f"{path}: exported without {key}")
+        stat = Path(source).stat()
+        if (stat.st_size, stat.st_mtime_ns) != (recorded['size'], recorded['mtime_ns']) \
+                and file_digest(source) != recorded['sha256']:
+            raise CompactFormatError(f"{path}: {Path(source).name} changed since the export")
+
+    # Plain ndarray views of the maps: same shared pages, without np.memmap's
+    # per-indexing overhead
+    arrays = {p.stem: np.asarray(np.load(p, mmap_mode='r', allow_pickle=False)) for p in path.glob('*.npy')}
+    return CompactVectorizer(arrays, meta['vectorizer']), CompactForest(arrays, meta['forest']), meta
+
+
+def main(argv=None):
+    from common.model_registry import ModelRegistry, SMOKE_TEXT
+
+    parser = argparse.ArgumentParser(description="Export a categorization model to memory-mappable arrays")
+    parser.add_argument('model_dir', help="model root (the directory holding versions/)")
+    parser.add_argument('--version', default=None, help="name under versions/ (default: the unversioned model)")
+    parser.add_argument('--check', nargs='*', default=[], help="text files to compare predictions on")
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry(args.model_dir, compact=False)
+    model = registry.load(args.version)
+    path = registry.version_dir(args.version)
+    files = registry._files(path, model.metadata)
+    meta = export(model.vectorizer, model.classifier, path / COMPACT_DIR, files)
+    print(f"Exported {meta['forest']['n_trees']} trees ({meta['forest']['n_nodes']} nodes) and "
+          f"{meta['vectorizer']['n_features']} terms to {path / COMPACT_DIR}")
+
+    vectorizer, forest, _ = load_compact(path / COMPACT_DIR, files)
+    texts = [SMOKE_TEXT] + [Path(p).read_text(encoding='utf-8', errors='ignore') for p in args.check]
+    expected = model.classifier.predict(model.vectorizer.transform(texts))
+    mismatched = int(np.sum(forest.predict(vectorizer.transform(texts)) != expected))
+    print(f"Checked {len(texts)} texts: {mismatched} predictions differ from the pickled model")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Pool of warm Selenium WebDrivers.
+
+Starting Chrome (plus chromedriver and CDP setup) costs several seconds, and
+the agent endpoints used to pay it on every request. DriverPool keeps up to
+``size`` browsers alive and leases them out. Each checkout health-checks the
+driver and wipes cookies, storage and extra windows so no state leaks between
+leases; a driver is quit and replaced after ``max_uses`` leases to bound
+memory growth in long-lived browsers.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from common.metrics import LatencyStats
+
+logger = logging.getLogger('job_agent')
+
+
+class DriverPoolTimeout(Exception):
+    """Raised when no driver becomes available within the lease timeout."""
+
+
+class DriverPool:
+    """Thread-safe pool of reusable WebDriver instances."""
+
+    def __init__(self, factory, size=2, max_uses=20, lease_timeout=300, window=500):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+
+        self._idle = deque()
+        self._uses = {}
+        self._total = 0  # idle + leased + being created
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self.lease_latency = LatencyStats(window)
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.recycled = 0
+        self.unhealthy = 0
+
+    # ---------- driver lifecycle ----------
+    def _create(self):
+        driver = self.factory()
+        with self._cond:
+            self.created += 1
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _destroy(self, driver):
+        with self._cond:
+            self._uses.pop(id(driver), None)
+            self._total -= 1
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting pooled driver: {str(e)}")
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Close extra windows and clear cookies and storage for every origin"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': '*',
+                'storageTypes': 'local_storage,session_storage,indexeddb,cache_storage,service_workers',
+            })
+        except Exception:
+            # Non-Chromium driver: fall back to what WebDriver itself can clear
+            driver.delete_all_cookies()
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+        driver.get('about:blank')
+
+    # ---------- leasing ----------
+    def acquire(self, timeout=None):
+        """Check out a healthy, clean driver, starting one if the pool has room"""
+        timeout = self.lease_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        deadline = started + timeout
+
+        while True:
+            driver = None
+            create = False
+            with self._cond:
+                while not self._idle and self._total >= self.size:
+                    if self._closed:
+                        raise DriverPoolTimeout("Driver pool is closed")
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        raise DriverPoolTimeout(f"No WebDriver available after {timeout}s")
+                    self._cond.wait(remaining)
+                if self._idle:
+                    driver = self._idle.popleft()
+                else:
+                    self._total += 1
+                    create = True
+
+            if create:
+                try:
+                    driver = self._create()
+                except Exception:
+                    with self._cond:
+                        self._total -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self.misses += 1
+                break
+
+            # Warm driver: make sure it survived the previous lease
+            try:
+                healthy = self._is_healthy(driver)
+                if healthy:
+                    self._reset(driver)
+            except Exception as e:
+                logger.debug(f"Pooled driver reset failed: {str(e)}")
+                healthy = False
+            if healthy:
+                with self._cond:
+                    self.hits += 1
+                break
+            with self._cond:
+                self.unhealthy += 1
+            self._destroy(driver)
+
+        with self._cond:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        self.lease_latency.add(time.perf_counter() - started)
+        return driver
+
+    def release(self, driver, discard=False):
+        """Return a driver to the pool (or quit it when discarded or worn out)"""
+        with self._cond:
+            worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+            if worn_out and not discard:
+                self.recycled += 1
+            keep = not (discard or worn_out or self._closed)
+            if keep:
+                self._idle.append(driver)
+                self._cond.notify()
+        if not keep:
+            self._destroy(driver)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except Exception:
+            # The driver may be in an unknown state; don't hand it to the next caller
+            self.release(driver, discard=True)
+            raise
+        else:
+            self.release(driver)
+
+    def prewarm(self, count=None):
+        """Start drivers up front so the first requests hit a warm browser"""
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self._cond:
+                if self._closed or self._total >= count:
+                    return
+                self._total += 1
+            try:
+                driver = self._create()
+            except Exception:
+                with self._cond:
+                    self._total -= 1
+                raise
+            with self._cond:
+                self._idle.append(driver)
+                self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            leases = self.hits + self.misses
+            return {
+                'size': self.size,
+                'max_uses': self.max_uses,
+                'total': self._total,
+                'idle': len(self._idle),
+                'in_use': self._total - len(self._idle),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / leases, 3) if leases else 0.0,
+                'created': self.created,
+                'recycled': self.recycled,
+                'unhealthy': self.unhealthy,
+                'lease_ms': self.lease_latency.summary(),
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for driver in idle:
+            self._destroy(driver)
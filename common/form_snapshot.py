@@ -0,0 +1,95 @@
+"""
+One-round-trip snapshot of the form controls on a page.
+
+FormFiller used to probe the page with up to five ``find_element`` calls per
+pattern per field type, each an HTTP round-trip to chromedriver and most of
+them ending in NoSuchElementException. FormSnapshot runs a single script that
+returns every input, textarea, select and label together with the attributes
+the field patterns look at; matching then happens in Python and the page is
+only touched again to fill the chosen elements.
+"""
+
+# Each control comes back with its WebElement reference so it can be filled
+# directly without another lookup.
+SNAPSHOT_SCRIPT = """
+var directText = function (node) {
+    var text = '';
+    for (var i = 0; i < node.childNodes.length; i++) {
+        if (node.childNodes[i].nodeType === 3) { text += node.childNodes[i].textContent; }
+    }
+    return text;
+};
+var controls = [];
+document.querySelectorAll('input, textarea, select').forEach(function (el) {
+    controls.push({
+        element: el,
+        tag: el.tagName.toLowerCase(),
+        type: (el.getAttribute('type') || '').toLowerCase(),
+        id: el.getAttribute('id') || '',
+        name: el.getAttribute('name') || '',
+        placeholder: el.getAttribute('placeholder') || '',
+        cls: el.getAttribute('class') || ''
+    });
+});
+var labels = [];
+document.querySelectorAll('label').forEach(function (el) {
+    labels.push({text: directText(el), for: el.getAttribute('for') || ''});
+});
+return {controls: controls, labels: labels};
+"""
+
+
+class FormSnapshot:
+    """Form controls and labels of a page, matched against field patterns in Python."""
+
+    def __init__(self, controls, labels):
+        self.controls = controls
+        self.labels = labels
+        self._by_id = {}
+        for control in controls:
+            # First element wins, as with find_element(By.ID, ...)
+            self._by_id.setdefault(control['id'], control)
+
+    @classmethod
+    def capture(cls, driver):
+        data = driver.execute_script(SNAPSHOT_SCRIPT) or {}
+        return cls(data.get('controls') or [], data.get('labels') or [])
+
+    def _first(self, predicate):
+        for control in self.controls:
+            if predicate(control):
+                return control['element']
+        return None
+
+    def find(self, patterns, use_labels=False, match_class=False):
+        """Return the element for the first pattern that matches, trying in order
+        exact id, exact name, label text, placeholder and partial id/name(/class)."""
+        for pattern in patterns:
+            element = self._first(lambda c: c['id'] == pattern)
+            if element is not None:
+                return element
+
+            element = self._first(lambda c: c['name'] == pattern)
+            if element is not None:
+                return element
+
+            if use_labels:
+                for label in self.labels:
+                    if pattern in label['text'].lower():
+                        control = self._by_id.get(label['for']) if label['for'] else None
+                        if control is not None:
+                            return control['element']
+                        break
+
+            element = self._first(lambda c: pattern in c['placeholder'])
+            if element is not None:
+                return element
+
+            element = self._first(
+                lambda c: pattern in c['id'] or pattern in c['name']
+                or (match_class and pattern in c['cls'])
+            )
+            if element is not None:
+                return element
+
+        return None
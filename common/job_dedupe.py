@@ -0,0 +1,209 @@
+"""
+Cross-session index of jobs already applied to.
+
+LinkedIn and Indeed URLs carry per-search tracking parameters (``refId``,
+``trackingId``, ``position`` on LinkedIn; ``bb``, ``xkcb``, ``vjs`` on Indeed),
+so the same posting looks new on every search and the agent re-applies to it.
+canonical_job_id reduces a job to a stable identity: the platform's own job id
+when the URL has one, otherwise the URL with tracking parameters stripped plus
+the normalised company and title.
+
+AppliedJobIndex stores those identities in SQLite and keeps a Bloom filter in
+memory in front of it, so checking a fresh search result (almost always a
+miss) costs a few hashes instead of a query.
+"""
+import hashlib
+import math
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that identify a click or a search, not a posting
+TRACKING_PARAMS = {
+    'refid', 'trackingid', 'position', 'pagenum', 'currentjobid', 'eborigin', 'origin',
+    'bb', 'xkcb', 'vjs', 'fccid', 'from', 'tk', 'advn', 'adid', 'sjdu', 'acatk', 'pub',
+    'camk', 'jrtk', 'jsa', 'ref', 'src', 'source', 'gclid', 'fbclid',
+}
+
+_LINKEDIN_VIEW = re.compile(r'/jobs/view/(?:[^/?#]*?-)?(\d{6,})')
+_SPACES = re.compile(r'\s+')
+
+
+def _normalize_text(value):
+    return _SPACES.sub(' ', (value or '').strip().lower())
+
+
+def canonical_url(url):
+    """URL with tracking parameters, fragment, www. and trailing slash removed"""
+    parts = urlsplit((url or '').strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith('utm_')
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower() or 'https', host, path, urlencode(query), ''))
+
+
+def platform_job_id(url):
+    """'linkedin:<id>' / 'indeed:<jk>' when the URL carries the platform's job id"""
+    parts = urlsplit((url or '').strip())
+    host = (parts.hostname or '').lower()
+    params = {k.lower(): v for k, v in parse_qsl(parts.query)}
+    if 'linkedin.' in host:
+        match = _LINKEDIN_VIEW.search(parts.path)
+        if match:
+            return f"linkedin:{match.group(1)}"
+        if params.get('currentjobid', '').isdigit():
+            return f"linkedin:{params['currentjobid']}"
+    if 'indeed.' in host:
+        jk = params.get('jk') or params.get('vjk')
+        if jk:
+            return f"indeed:{jk.lower()}"
+    return None
+
+
+def canonical_job_id(job):
+    """Stable identity of a posting across searches and sessions"""
+    url = job.get('url') or ''
+    job_id = platform_job_id(url)
+    if job_id:
+        return job_id
+    return '|'.join((
+        canonical_url(url) if url else '',
+        _normalize_text(job.get('company')),
+        _normalize_text(job.get('title')),
+    ))
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class AppliedJobIndex:
+    """SQLite-backed set of (candidate, canonical job id) with a Bloom filter in front."""
+
+    def __init__(self, path, capacity=100000, error_rate=0.01):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS applied_jobs (
+                candidate TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                status TEXT,
+                url TEXT,
+                title TEXT,
+                company TEXT,
+                first_seen TEXT,
+                last_seen TEXT,
+                PRIMARY KEY (candidate, job_id)
+            )
+        """)
+        self._conn.commit()
+
+        self.lookups = 0
+        self.bloom_negatives = 0
+        self.false_positives = 0
+        self._load(capacity)
+
+    @staticmethod
+    def _member(candidate, job_id):
+        return f"{candidate or ''}\x1f{job_id}"
+
+    def _load(self, capacity):
+        rows = self._conn.execute('SELECT candidate, job_id FROM applied_jobs').fetchall()
+        self._bloom = BloomFilter(max(capacity, len(rows) * 2), self.error_rate)
+        for candidate, job_id in rows:
+            self._bloom.add(self._member(candidate, job_id))
+
+    def contains(self, job, candidate=None):
+        """True if the candidate already applied to this posting"""
+        job_id = canonical_job_id(job)
+        member = self._member(candidate, job_id)
+        with self._lock:
+            self.lookups += 1
+            if member not in self._bloom:
+                self.bloom_negatives += 1
+                return False
+            row = self._conn.execute(
+                'SELECT 1 FROM applied_jobs WHERE candidate = ? AND job_id = ?', (candidate or '', job_id)
+            ).fetchone()
+            if row is None:
+                self.false_positives += 1
+            return row is not None
+
+    def add(self, job, candidate=None, status=None):
+        """Record that the candidate applied to this posting"""
+        job_id = canonical_job_id(job)
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO applied_jobs (candidate, job_id, status, url, title, company, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (candidate, job_id) DO UPDATE SET status = excluded.status, last_seen = excluded.last_seen
+            """, (candidate or '', job_id, status, job.get('url'), job.get('title'), job.get('company'), now, now))
+            self._conn.commit()
+            self._bloom.add(self._member(candidate, job_id))
+            if self._bloom.count > self._bloom.capacity:
+                # Past capacity the false-positive rate climbs; rebuild twice as large
+                self._load(self._bloom.capacity * 2)
+        return job_id
+
+    def filter_new(self, jobs, candidate=None):
+        """Split jobs into (new, already_applied), also dropping repeats within the list"""
+        new, seen, batch = [], [], set()
+        for job in jobs:
+            job_id = canonical_job_id(job)
+            if job_id in batch or self.contains(job, candidate):
+                seen.append(job)
+                continue
+            batch.add(job_id)
+            new.append(job)
+        return new, seen
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM applied_jobs').fetchone()[0]
+            return {
+                'entries': entries,
+                'bloom_bits': self._bloom.size,
+                'bloom_hashes': self._bloom.hashes,
+                'lookups': self.lookups,
+                'bloom_negatives': self.bloom_negatives,
+                'false_positives': self.false_positives,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
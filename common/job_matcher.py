@@ -0,0 +1,98 @@
+"""
+Sparse resume-to-job matching.
+
+The job board used to score matches in the browser, looping every job's text
+over every resume skill with ``description.includes(skill)``. JobMatcher
+vectorizes the job texts once into one sparse matrix: TF-IDF terms (the
+categorization vectorizer, or one fitted on the jobs) next to a binary vector
+of the skills each job mentions. A resume is turned into a vector the same
+way and scored against every job with a single sparse matrix-vector product
+over only the columns the resume touches; ``argpartition`` then picks the
+top k without sorting all scores.
+"""
+import time
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+
+class JobMatcher:
+    """Top-k job ranking for a resume over an in-memory sparse job matrix.
+
+    ``vectorizer`` is a fitted TF-IDF vectorizer (or None to fit one on the
+    jobs); ``skill_matcher`` is a common.skill_matcher.SkillMatcher.
+    ``skill_weight`` is the share of the score that comes from skill overlap
+    rather than term similarity. Scores are cosine similarities in [0, 1].
+    """
+
+    def __init__(self, vectorizer, skill_matcher, skill_weight=0.5):
+        self.vectorizer = vectorizer
+        self.skill_matcher = skill_matcher
+        self.skill_weight = skill_weight
+        self._skill_index = {skill: i for i, skill in enumerate(skill_matcher.skills)}
+        self.jobs = []
+        self.job_skills = []
+        self.matrix = None
+        self.build_seconds = 0.0
+
+    def _skill_matrix(self, skill_lists):
+        rows, cols = [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in skills:
+                col = self._skill_index.get(skill)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        data = np.ones(len(rows), dtype=np.float32)
+        shape = (len(skill_lists), len(self._skill_index))
+        return sparse.csr_matrix((data, (rows, cols)), shape=shape)
+
+    def _combine(self, terms, skills):
+        # Normalise each block, weight it, then normalise the whole row so a
+        # dot product between two rows is their weighted cosine similarity
+        terms = normalize(terms.astype(np.float32)) * (1.0 - self.skill_weight)
+        skills = normalize(skills) * self.skill_weight
+        return normalize(sparse.hstack([terms, skills], format='csr'))
+
+    def fit(self, jobs, text_of):
+        """Vectorize jobs once; text_of(job) gives the text to match against"""
+        started = time.perf_counter()
+        texts = [text_of(job) for job in jobs]
+        if self.vectorizer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self.vectorizer = TfidfVectorizer().fit(texts)
+
+        self.jobs = list(jobs)
+        self.job_skills = [self.skill_matcher.extract(text) for text in texts]
+        matrix = self._combine(self.vectorizer.transform(texts), self._skill_matrix(self.job_skills))
+        # Column-major so a query only reads the columns it has non-zeros in
+        self.matrix = matrix.tocsc()
+        self.build_seconds = time.perf_counter() - started
+        return self
+
+    def query_vector(self, text, skills=()):
+        """Sparse row vector for a resume: its text plus its extracted skills"""
+        found = set(skills) | self.skill_matcher.find(text)
+        return self._combine(self.vectorizer.transform([text]), self._skill_matrix([found]))
+
+    def top_k(self, text, skills=(), k=20):
+        """(job indices, scores) of the k best matches, best first; zero scores dropped"""
+        if self.matrix is None or not self.jobs:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        query = self.query_vector(text, skills)
+        cols = query.indices
+        scores = self.matrix[:, cols] @ query.data
+        scores = np.asarray(scores).ravel()
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        top = top[scores[top] > 0]
+        return top, scores[top]
+
+    def matched_skills(self, index, skills):
+        """Resume skills that job index also mentions"""
+        wanted = set(skills)
+        return [skill for skill in self.job_skills[index] if skill in wanted]
@@ -0,0 +1,169 @@
+"""
+Background job runs with progress events.
+
+Search/apply runs drive a real browser for minutes, far longer than an HTTP
+request should stay open. JobRunManager executes them on a bounded thread pool
+and returns a job id straight away; each run records an ordered list of events
+that clients can poll (``snapshot``) or follow live as Server-Sent Events
+(``stream``), resuming from the last event id they saw.
+"""
+import asyncio
+import json
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+TERMINAL_STATES = ('completed', 'failed')
+
+
+class JobRun:
+    """State and event history of a single background run."""
+
+    def __init__(self, kind, meta=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.meta = meta or {}
+        self.status = 'queued'
+        self.created_at = datetime.now().isoformat()
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.events = []
+        self._lock = threading.Lock()
+        self._subscribers = []
+
+    def emit(self, event_type, data=None):
+        """Record an event and push it to every live subscriber."""
+        with self._lock:
+            event = {
+                'id': len(self.events) + 1,
+                'type': event_type,
+                'timestamp': datetime.now().isoformat(),
+                'data': data or {},
+            }
+            self.events.append(event)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+        return event
+
+    def subscribe(self, loop, after=0):
+        """Register a queue for new events; returns (backlog, queue) atomically."""
+        queue = asyncio.Queue()
+        with self._lock:
+            backlog = self.events[after:]
+            self._subscribers.append((loop, queue))
+        return backlog, queue
+
+    def unsubscribe(self, queue):
+        with self._lock:
+            self._subscribers = [(l, q) for l, q in self._subscribers if q is not queue]
+
+    @property
+    def done(self):
+        return self.status in TERMINAL_STATES
+
+    def snapshot(self, include_events=True):
+        with self._lock:
+            data = {
+                'job_id': self.id,
+                'kind': self.kind,
+                'status': self.status,
+                'created_at': self.created_at,
+                'finished_at': self.finished_at,
+                'meta': self.meta,
+                'result': self.result,
+                'error': self.error,
+                'event_count': len(self.events),
+            }
+            if include_events:
+                data['events'] = list(self.events)
+        return data
+
+
+class JobRunManager:
+    """Runs callables in a bounded thread pool and keeps their recent history."""
+
+    def __init__(self, max_workers=2, max_runs=100):
+        self.max_runs = max_runs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job-run')
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind, fn, *args, meta=None, **kwargs):
+        """Start fn(run, *args, **kwargs) in the background and return the JobRun.
+
+        fn reports progress through run.emit(); its return value becomes the
+        run result and is published as the final 'completed' event.
+        """
+        run = JobRun(kind, meta)
+        with self._lock:
+            self._runs[run.id] = run
+            self._prune()
+        run.emit('queued', {'kind': kind})
+        self._executor.submit(self._execute, run, fn, args, kwargs)
+        return run
+
+    def _execute(self, run, fn, args, kwargs):
+        run.status = 'running'
+        run.emit('running')
+        try:
+            result = fn(run, *args, **kwargs)
+        except Exception as e:
+            run.error = str(e)
+            run.status = 'failed'
+            run.finished_at = datetime.now().isoformat()
+            run.emit('failed', {'error': str(e), 'traceback': traceback.format_exc(limit=5)})
+            return
+        run.result = result
+        run.status = 'completed'
+        run.finished_at = datetime.now().isoformat()
+        run.emit('completed', result)
+
+    def _prune(self):
+        # Forget the oldest finished runs once over the retention limit
+        if len(self._runs) <= self.max_runs:
+            return
+        for run_id in [rid for rid, r in self._runs.items() if r.done]:
+            if len(self._runs) <= self.max_runs:
+                break
+            del self._runs[run_id]
+
+    def get(self, run_id):
+        with self._lock:
+            return self._runs.get(run_id)
+
+    async def stream(self, run, after=0, heartbeat=15):
+        """Yield the run's events as Server-Sent Events until it finishes."""
+        loop = asyncio.get_running_loop()
+        backlog, queue = run.subscribe(loop, after)
+        try:
+            for event in backlog:
+                yield self._format(event)
+                if event['type'] in TERMINAL_STATES:
+                    return
+            if any(event['type'] in TERMINAL_STATES for event in run.events[:after]):
+                # Reconnected at or past the end (Last-Event-ID): nothing more will come
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self._format(event)
+                if event['type'] in TERMINAL_STATES:
+                    return
+        finally:
+            run.unsubscribe(queue)
+
+    @staticmethod
+    def _format(event):
+        return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
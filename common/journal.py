@@ -0,0 +1,140 @@
+"""
+Append-only JSONL journal of application outcomes.
+
+save_log used to write the whole applications_log once, after the batch; a
+Chrome crash, a kill or a KeyboardInterrupt lost every finished application
+and a rerun applied to the same jobs again. ApplicationJournal appends each
+outcome as one JSON line the moment it is known. Lines are flushed at once and
+fsynced in batches (every ``sync_every`` records or ``sync_interval`` seconds),
+so a crash loses at most the last unsynced batch on power loss and nothing on
+a process crash.
+
+Reading back tolerates a torn final line. ``completed`` gives the jobs already
+in a terminal state so a rerun can skip them, and ``compact`` folds the
+journal into the latest record per job, which is what the summary JSON holds.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from common.job_dedupe import canonical_job_id
+
+# Outcomes that should not be retried on resume; 'failed' jobs are retried
+TERMINAL_STATUSES = ('ready_to_submit', 'ready_to_submit_external', 'submitted')
+
+
+def job_key(job):
+    """Identity of a job within the journal (tracking parameters ignored)"""
+    return canonical_job_id(job)
+
+
+class ApplicationJournal:
+    """Thread-safe JSONL journal with batched fsync."""
+
+    def __init__(self, path, sync_every=8, sync_interval=2.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        if self._file is None:
+            torn = False
+            if self.path.exists() and self.path.stat().st_size:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b'\n'
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if torn:
+                # Terminate a half-written line so the next record stays parseable
+                self._file.write('\n')
+        return self._file
+
+    def append(self, entry, candidate=None, session=None):
+        """Record one application outcome"""
+        record = {
+            **entry,
+            'job_key': job_key(entry),
+            'candidate': candidate,
+            'session': session,
+            'journaled_at': datetime.now().isoformat(),
+        }
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            f = self._open()
+            f.write(line)
+            f.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+                self._sync()
+        return record
+
+    def _sync(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def records(self, candidate=None, session=None):
+        """Journal records in write order, optionally for one candidate or session"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash; everything before it is intact
+                    continue
+                if candidate is not None and record.get('candidate') != candidate:
+                    continue
+                if session is not None and record.get('session') != session:
+                    continue
+                yield record
+
+    def completed(self, candidate=None):
+        """Keys of jobs whose latest outcome is terminal"""
+        return {
+            key for key, record in self.latest(candidate=candidate).items()
+            if record.get('status') in TERMINAL_STATUSES
+        }
+
+    def latest(self, candidate=None, session=None):
+        """Latest record per job key, in order of first appearance"""
+        latest = {}
+        for record in self.records(candidate=candidate, session=session):
+            # Re-derived so records written before a canonicalization change still match
+            latest[job_key(record)] = record
+        return latest
+
+    def compact(self, candidate=None, session=None):
+        """Latest outcome per job with the journal bookkeeping stripped"""
+        bookkeeping = ('job_key', 'candidate', 'session', 'journaled_at')
+        return [
+            {k: v for k, v in record.items() if k not in bookkeeping}
+            for record in self.latest(candidate=candidate, session=session).values()
+        ]
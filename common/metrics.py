@@ -0,0 +1,38 @@
+"""Small helpers for the latency counters exposed by the stats endpoints."""
+import threading
+from collections import deque
+
+
+class LatencyStats:
+    """Rolling window of durations (in seconds) summarised in milliseconds."""
+
+    def __init__(self, window=500):
+        self._values = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def add(self, seconds):
+        with self._lock:
+            self._values.append(seconds)
+            self.count += 1
+
+    def mean(self, default=0.0):
+        with self._lock:
+            return sum(self._values) / len(self._values) if self._values else default
+
+    def summary(self):
+        with self._lock:
+            ordered = sorted(self._values)
+            count = self.count
+        if not ordered:
+            return {'count': count, 'avg': 0.0, 'p50': 0.0, 'p95': 0.0}
+
+        def pick(pct):
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))] * 1000, 2)
+
+        return {
+            'count': count,
+            'avg': round(sum(ordered) / len(ordered) * 1000, 2),
+            'p50': pick(0.5),
+            'p95': pick(0.95),
+        }
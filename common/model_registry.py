@@ -0,0 +1,331 @@
+"""
+Lazily loaded, hot-swappable resume categorization model.
+
+Both resume parsers used to unpickle the classifier and TF-IDF vectorizer at
+import time from cwd-relative paths: importing failed unless the server ran
+from resume-parser/, every start paid the full deserialization, and a new
+model meant a restart. ModelRegistry resolves artifacts under a model
+directory the app passes in (next to the app file), loads them on first use
+or in warmup(), and validates a version before it serves: metadata, file
+digests, that the vectorizer's vocabulary fits the classifier, and a smoke
+prediction. swap() loads and validates the new version beside the live one,
+then replaces it with a single reference assignment. A request uses the
+LoadedModel it fetched for its whole prediction, so in-flight requests never
+see a half-swapped vectorizer/classifier pair and none are dropped.
+
+A version with an up-to-date ``compact/`` export (common.compact_model) is
+memory-mapped from it instead of unpickled; a stale or unreadable export is
+logged and the pickles are used.
+
+Layout::
+
+    model/
+        rf_classifier_categorization.pkl       default (unversioned) model
+        tfidf_vectorizer_categorization.pkl
+        versions/<name>/
+            metadata.json                      {"version", "sha256": {...}, "sklearn"}
+            rf_classifier_categorization.pkl
+            tfidf_vectorizer_categorization.pkl
+            compact/                           optional .npy export of the pair
+"""
+import hashlib
+import json
+import logging
+import pickle
+import re
+import threading
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from common.compact_model import COMPACT_DIR, CompactFormatError, load_compact
+from common.parse_cache import file_digest
+
+ARTIFACTS = {
+    'classifier': 'rf_classifier_categorization.pkl',
+    'vectorizer': 'tfidf_vectorizer_categorization.pkl',
+}
+SMOKE_TEXT = "python developer with sql and machine learning experience"
+BATCH_CHUNK = 256  # texts per transform/predict_proba call in predict_batch
+
+_VERSION_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]*$')
+_ACTIVE = object()
+
+logger = logging.getLogger(__name__)
+
+
+class ModelLoadError(Exception):
+    """A model version is missing, corrupt or fails validation."""
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def restore_idf(vectorizer):
+    """Give an unpickled TF-IDF vectorizer back its idf_; returns it.
+
+    Pickles from older scikit-learn keep the IDF only in ``_idf_diag``, which
+    newer transform() silently skips, scoring on term frequency alone.
+    """
+    tfidf = getattr(vectorizer, '_tfidf', None)
+    if getattr(tfidf, 'use_idf', False) and not hasattr(tfidf, 'idf_') and hasattr(tfidf, '_idf_diag'):
+        tfidf.idf_ = tfidf._idf_diag.diagonal()
+    return vectorizer
+
+
+class LoadedModel:
+    """One validated classifier/vectorizer pair; immutable once serving."""
+
+    def __init__(self, name, version, path, classifier, vectorizer, metadata, load_seconds, format='pickle'):
+        self.name = name
+        self.version = version
+        self.path = path
+        self.classifier = classifier
+        self.vectorizer = vectorizer
+        self.metadata = metadata
+        self.load_seconds = load_seconds
+        self.format = format
+        self.loaded_at = time.time()
+        self.predictions = 0
+
+    def predict(self, text):
+        self.predictions += 1
+        return self.classifier.predict(self.vectorizer.transform([text]))[0]
+
+    def predict_batch(self, texts, chunk_size=BATCH_CHUNK):
+        """Labels and class probabilities for many texts.
+
+        Each chunk is one sparse transform and one predict_proba call; the label
+        is the most probable class, which is how the forest's predict picks it.
+        """
+        classes = self.classifier.classes_
+        labels, probabilities = [], []
+        for start in range(0, len(texts), chunk_size):
+            proba = self.classifier.predict_proba(self.vectorizer.transform(texts[start:start + chunk_size]))
+            labels.extend(classes.take(np.argmax(proba, axis=1), axis=0).tolist())
+            probabilities.append(proba)
+        self.predictions += len(texts)
+        return labels, np.vstack(probabilities) if probabilities else np.empty((0, len(classes)))
+
+    def categorize(self, texts, top=3, chunk_size=BATCH_CHUNK):
+        """predict_batch as JSON-ready dicts with the top classes of each text"""
+        labels, proba = self.predict_batch(texts, chunk_size)
+        classes = [str(label) for label in self.classifier.classes_]
+        ranked = np.argsort(-proba, axis=1, kind='stable')[:, :max(1, top)]
+        return [
+            {
+                'category': str(label),
+                'probability': round(float(p.max()), 4),
+                'top': [{'category': classes[i], 'probability': round(float(p[i]), 4)} for i in best],
+            }
+            for label, p, best in zip(labels, proba, ranked)
+        ]
+
+    def describe(self):
+        return {
+            'name': self.name,
+            'version': self.version,
+            'path': str(self.path),
+            'format': self.format,
+            'load_ms': round(self.load_seconds * 1000, 1),
+            'loaded_at': self.loaded_at,
+            'predictions': self.predictions,
+            'labels': len(getattr(self.classifier, 'classes_', [])),
+        }
+
+
+class ModelRegistry:
+    """Resolves, validates and serves the active categorization model.
+
+    ``name`` selects ``root/versions/<name>``; None is the unversioned model
+    directly under ``root``. ``compact=False`` ignores compact exports.
+    """
+
+    def __init__(self, root, name=None, artifacts=ARTIFACTS, compact=True):
+        self.root = Path(root).resolve()
+        self.artifacts = dict(artifacts)
+        self.active = name or None
+        self.compact = compact
+        self._current = None
+        self._lock = threading.Lock()
+        self._versions = {}
+        self.swaps = 0
+        self.failed_swaps = 0
+
+    def version_dir(self, name):
+        if name is None:
+            return self.root
+        # Names come from admin requests: never let one point outside versions/
+        if not _VERSION_NAME.match(name):
+            raise ModelLoadError(f"Invalid model version name: {name!r}")
+        return self.root / 'versions' / name
+
+    def _metadata(self, path):
+        meta_path = path / 'metadata.json'
+        if not meta_path.exists():
+            return {}
+        try:
+            metadata = json.loads(meta_path.read_text(encoding='utf-8'))
+        except ValueError as e:
+            raise ModelLoadError(f"{meta_path}: invalid JSON ({e})")
+        if not isinstance(metadata, dict) or not isinstance(metadata.get('version', ''), str):
+            raise ModelLoadError(f"{meta_path}: expected an object with a string 'version'")
+        return metadata
+
+    def _files(self, path, metadata):
+        files = {key: path / metadata.get('artifacts', {}).get(key, filename)
+                 for key, filename in self.artifacts.items()}
+        missing = [str(p) for p in files.values() if not p.exists()]
+        if missing:
+            raise ModelLoadError(f"Missing model artifacts: {', '.join(missing)}")
+        return files
+
+    def version_of(self, name=None):
+        """Version id for name without unpickling anything (cached)"""
+        if name not in self._versions:
+            path = self.version_dir(name)
+            metadata = self._metadata(path)
+            files = self._files(path, metadata)
+            # The unversioned model is identified by its content
+            self._versions[name] = metadata.get('version') or f"default-{file_digest(*files.values())[:12]}"
+        return self._versions[name]
+
+    def _validate(self, path, metadata, files, classifier, vectorizer):
+        for key, expected in (metadata.get('sha256') or {}).items():
+            if key in files and _sha256(files[key]) != expected:
+                raise ModelLoadError(f"{files[key]}: sha256 does not match metadata")
+
+        trained_with = metadata.get('sklearn')
+        if trained_with:
+            import sklearn
+            if trained_with.split('.')[:2] != sklearn.__version__.split('.')[:2]:
+                logger.warning(f"{path}: trained with scikit-learn {trained_with}, running {sklearn.__version__}")
+
+        vocabulary = getattr(vectorizer, 'vocabulary_', None)
+        features = len(vocabulary) if vocabulary is not None else getattr(vectorizer, 'n_features', None)
+        expected_features = getattr(classifier, 'n_features_in_', None)
+        if features is not None and expected_features is not None and features != expected_features:
+            raise ModelLoadError(
+                f"{path}: vectorizer has {features} features, classifier expects {expected_features}"
+            )
+        try:
+            label = classifier.predict(vectorizer.transform([SMOKE_TEXT]))[0]
+        except Exception as e:
+            raise ModelLoadError(f"{path}: smoke prediction failed ({e})")
+        classes = getattr(classifier, 'classes_', None)
+        if classes is not None and label not in list(classes):
+            raise ModelLoadError(f"{path}: smoke prediction {label!r} is not a known class")
+
+    def _load_compact(self, path, files):
+        """The mapped (classifier, vectorizer) export of files, or None"""
+        if not self.compact or not (path / COMPACT_DIR).is_dir():
+            return None
+        try:
+            vectorizer, classifier, _ = load_compact(path / COMPACT_DIR, files)
+        except (CompactFormatError, OSError, ValueError, KeyError) as e:
+            logger.warning(f"{path / COMPACT_DIR}: not used ({e}); loading the pickles")
+            return None
+        return classifier, vectorizer
+
+    def _unpickle(self, path, files):
+        loaded = {}
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for key, file_path in files.items():
+                try:
+                    with open(file_path, 'rb') as f:
+                        loaded[key] = pickle.load(f)
+                except Exception as e:
+                    raise ModelLoadError(f"{file_path}: could not be unpickled ({e})")
+        for warning in caught:
+            logger.warning(f"{path}: {warning.message}")
+        # the compact export reads _idf_diag too, so both formats score alike
+        return loaded['classifier'], restore_idf(loaded['vectorizer'])
+
+    def load(self, name=None):
+        """Map or unpickle, then validate, a version without making it active"""
+        started = time.perf_counter()
+        path = self.version_dir(name)
+        metadata = self._metadata(path)
+        files = self._files(path, metadata)
+        compact = self._load_compact(path, files)
+        classifier, vectorizer = compact or self._unpickle(path, files)
+
+        self._validate(path, metadata, files, classifier, vectorizer)
+        self._versions.pop(name, None)  # files may have been replaced in place
+        model = LoadedModel(
+            name, self.version_of(name), path, classifier, vectorizer,
+            metadata, time.perf_counter() - started, 'compact' if compact else 'pickle'
+        )
+        logger.info(
+            f"Loaded categorization model {model.version} ({model.format}) in {model.load_seconds * 1000:.0f} ms"
+        )
+        return model
+
+    def get(self, name=_ACTIVE):
+        """The active model, loaded on first use.
+
+        Parse workers pass the name the server had active when it submitted the
+        job; a worker still on another version switches to it first.
+        """
+        current = self._current
+        wanted = self.active if name is _ACTIVE else name
+        if current is not None and current.name == wanted:
+            return current
+        with self._lock:
+            current = self._current
+            if current is None or current.name != wanted:
+                current = self.load(wanted)
+                self._current, self.active = current, wanted
+        return current
+
+    def warmup(self):
+        return self.get()
+
+    def current_version(self):
+        """Version id of the active model, loaded or not"""
+        current = self._current
+        return current.version if current is not None and current.name == self.active else self.version_of(self.active)
+
+    def swap(self, name):
+        """Load and validate version name, then make it active atomically.
+
+        Raises ModelLoadError and leaves the live model serving if it fails.
+        """
+        try:
+            model = self.load(name or None)
+        except ModelLoadError:
+            self.failed_swaps += 1
+            raise
+        with self._lock:
+            previous = self._current
+            self._current, self.active = model, model.name
+            self.swaps += 1
+        logger.info(
+            f"Swapped categorization model {previous.version if previous else '(not loaded)'} -> {model.version}"
+        )
+        return model
+
+    def available(self):
+        """Names under versions/ (plus None for the default model)"""
+        versions = self.root / 'versions'
+        names = sorted(p.name for p in versions.iterdir() if p.is_dir()) if versions.is_dir() else []
+        return [None] + names
+
+    def stats(self):
+        current = self._current
+        return {
+            'root': str(self.root),
+            'active': self.active,
+            'loaded': current.describe() if current is not None else None,
+            'available': self.available(),
+            'swaps': self.swaps,
+            'failed_swaps': self.failed_swaps,
+        }
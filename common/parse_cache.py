@@ -0,0 +1,150 @@
+"""
+Content-addressed cache for parsed resumes.
+
+Entries are keyed by the SHA-256 of the uploaded bytes salted with the parser
+and model version, so a re-upload of the same file skips PDF extraction,
+categorization and every extractor, while a new model or parser release never
+serves stale results. Entries live on disk as one JSON file each, with the
+directory kept under a byte budget by evicting the least recently used files.
+An optional in-memory LRU tier sits in front of the disk store.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+def file_digest(*paths):
+    """SHA-256 over the contents of the given files (missing files are skipped)."""
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        except FileNotFoundError:
+            continue
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Two-tier (memory + disk) LRU cache of JSON-serializable parse results."""
+
+    def __init__(self, directory, version, max_bytes=256 * 1024 * 1024, memory_items=0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Pick up entries left by previous runs, oldest first
+        entries = sorted(self.directory.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for path in entries:
+            self._sizes[path.stem] = path.stat().st_size
+        self._total_bytes = sum(self._sizes.values())
+
+    def key(self, data, kind=''):
+        """Cache key for raw upload bytes; kind separates e.g. 'pdf' from 'txt'."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.version}:{kind}:".encode('utf-8'))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached value for key, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return self._memory[key]
+
+            if key not in self._sizes:
+                self.misses += 1
+                return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            # Bump mtime so eviction order follows reads as well as writes
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self._forget(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            # Move to the most-recent end of the disk LRU order
+            if key in self._sizes:
+                self._sizes[key] = self._sizes.pop(key)
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """Store value under key on disk (and in memory when enabled)."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        payload = json.dumps(value).encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        # Atomic rename so concurrent readers never see a half-written entry
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes -= self._sizes.pop(key, 0)
+            self._sizes[key] = len(payload)
+            self._total_bytes += len(payload)
+            self._remember(key, value)
+            self._evict()
+
+    def _remember(self, key, value):
+        if self.memory_items <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _forget(self, key):
+        self._total_bytes -= self._sizes.pop(key, 0)
+        self._memory.pop(key, None)
+
+    def _evict(self):
+        # _sizes is kept in least- to most-recently-used order
+        while self._total_bytes > self.max_bytes and len(self._sizes) > 1:
+            oldest = next(iter(self._sizes))
+            self._forget(oldest)
+            self.evictions += 1
+            try:
+                self._path(oldest).unlink()
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._sizes),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'memory_entries': len(self._memory),
+                'hits': self.hits,
+                'memory_hits': self.memory_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
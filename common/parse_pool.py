@@ -0,0 +1,107 @@
+"""
+Bounded process pool for CPU-bound parsing.
+
+PDF extraction, categorization and the regex extractors are pure CPU work;
+running them inside an ``async def`` handler blocks the event loop for every
+other request. BoundedProcessPool runs them in worker processes and admits at
+most ``workers + max_queue`` jobs at a time; past that it raises PoolFullError
+so the server can answer 503 with a Retry-After hint instead of queueing
+without limit. Queue depth, wait time and service time are tracked for sizing.
+"""
+import asyncio
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common.metrics import LatencyStats
+
+
+class PoolFullError(Exception):
+    """Raised when the pool already holds its maximum number of jobs."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Parse pool is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def _timed_call(fn, args):
+    # Runs in the worker; wall-clock stamps are comparable across processes
+    started = time.time()
+    result = fn(*args)
+    return started, time.time(), result
+
+
+class BoundedProcessPool:
+    """ProcessPoolExecutor with admission control and latency statistics."""
+
+    def __init__(self, workers=None, max_queue=None, initializer=None, window=500):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = self.workers * 2 if max_queue is None else max_queue
+        self.initializer = initializer
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.wait_time = LatencyStats(window)
+        self.service_time = LatencyStats(window)
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _get_executor(self):
+        # Created lazily so importing the app (e.g. in a spawned worker) never starts processes
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=self.initializer)
+        return self._executor
+
+    def _retry_after(self):
+        service = self.service_time.mean(default=1.0)
+        backlog = max(1, self._in_flight - self.workers + 1)
+        return max(1, math.ceil(service * backlog / self.workers))
+
+    async def run(self, fn, *args):
+        """Run fn(*args) in a worker process, or raise PoolFullError when saturated."""
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PoolFullError(self._retry_after())
+            self._in_flight += 1
+
+        submitted = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            started, finished, result = await loop.run_in_executor(self._get_executor(), _timed_call, fn, args)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        with self._lock:
+            self.completed += 1
+        self.wait_time.add(max(0.0, started - submitted))
+        self.service_time.add(finished - started)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'in_flight': self._in_flight,
+                'queue_depth': max(0, self._in_flight - self.workers),
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'wait_ms': self.wait_time.summary(),
+                'service_ms': self.service_time.summary(),
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
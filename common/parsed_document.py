@@ -0,0 +1,110 @@
+"""
+Resume text with lazily computed, cached views.
+
+Every extractor used to derive its own copy of the same text: the name
+extractor split it into lines, the skills extractor split it again to drop
+the first six lines, the category prediction ran cleanResume over it and the
+experience extractor lower-cased it, once per call and per parser.
+
+ParsedDocument carries the raw text and computes each derived view (lower
+case, NFKC-normalized, lines, header region, body, sections, or any view an
+app defines with ``view``) the first time an extractor asks for it, then
+keeps it. Extractors take either a ParsedDocument or a plain string
+(``as_document``), so a request that builds one document derives each view
+at most once however many extractors read it.
+"""
+import re
+import unicodedata
+from functools import cached_property
+
+from common.section_segmenter import PREAMBLE, SectionSegmenter
+
+HEADER_LINES = 8      # where the name and contact details usually are
+BODY_SKIP_LINES = 6   # lines dropped from the body when no heading is found
+
+_default_segmenter = None
+
+
+def _segmenter():
+    global _default_segmenter
+    if _default_segmenter is None:
+        _default_segmenter = SectionSegmenter()
+    return _default_segmenter
+
+
+class ParsedDocument:
+    """The text of one resume plus views derived from it on first use.
+
+    ``segmenter`` locates the sections (a shared SectionSegmenter by default).
+    """
+
+    def __init__(self, text, segmenter=None):
+        self.text = text
+        self.segmenter = segmenter or _segmenter()
+        self._views = {}
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def normalized(self):
+        """NFKC text without non-breaking/zero-width spaces or runs of spaces"""
+        text = unicodedata.normalize('NFKC', self.text)
+        text = text.replace('\xa0', ' ').replace('\u200b', '')
+        return re.sub(r'[ ]{2,}', ' ', text).strip()
+
+    @cached_property
+    def raw_lines(self):
+        """text.split('\\n'), blank lines and surrounding spaces kept"""
+        return self.text.split('\n')
+
+    @cached_property
+    def lines(self):
+        """Non-blank lines, stripped"""
+        return [line.strip() for line in self.raw_lines if line.strip()]
+
+    @cached_property
+    def header(self):
+        """The first HEADER_LINES non-blank lines"""
+        return self.lines[:HEADER_LINES]
+
+    @cached_property
+    def sections(self):
+        """{section: (start, end)} offsets into text (see SectionSegmenter.segment)"""
+        return self.segmenter.segment(self.text)
+
+    @cached_property
+    def body(self):
+        """The text below the name/contact block.
+
+        Everything but the first BODY_SKIP_LINES lines (all of it when there
+        are no more), starting earlier if a section heading comes first.
+        """
+        text = self.text
+        end = len(text.rstrip())
+        start = len(text) - len(text.lstrip())
+        for _ in range(BODY_SKIP_LINES):
+            start = text.find('\n', start) + 1
+            if not start or start >= end:
+                return text
+        if PREAMBLE in self.sections:
+            # Skills listed on line 7 stay in the body even if the first
+            # heading comes later
+            start = min(start, self.sections[PREAMBLE][1])
+        return text[start:end]
+
+    def section(self, name, limit=None):
+        """The text of one section (at most limit characters), or None"""
+        return self.segmenter.text(self.text, name, self.sections, limit)
+
+    def view(self, fn):
+        """fn(text), computed once per document (e.g. view(cleanResume))"""
+        if fn not in self._views:
+            self._views[fn] = fn(self.text)
+        return self._views[fn]
+
+
+def as_document(text, segmenter=None):
+    """text as a ParsedDocument, unless it already is one"""
+    return text if isinstance(text, ParsedDocument) else ParsedDocument(text, segmenter)
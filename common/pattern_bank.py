@@ -0,0 +1,291 @@
+"""
+Precompiled extraction patterns with hit and time counters.
+
+The education, contact and experience extractors passed string patterns to
+``re.search`` inside loops: ``normalize_degree_from_text`` tried every entry
+of DEGREE_PATTERNS in turn, the field lookup lower-cased the entry once per
+keyword, ``extract_institution`` tried nine patterns and
+``ResumeParser.extract_experience`` ran eight ``findall`` over the whole
+resume. ``re`` caches compiled patterns, but every call still paid the cache
+lookup, and a miss rescanned the text once per pattern.
+
+A PatternBank compiles them once at import:
+
+* ``pattern`` wraps a single regex.
+* ``first_of`` merges an ordered list of patterns into one alternation of
+  named groups, mapped back to a label per pattern. The earliest listed
+  pattern found anywhere wins, which is exactly what the loop that stopped at
+  the first ``re.search`` hit returned.
+* ``keywords`` puts a keyword list into one Aho-Corasick automaton (see
+  common/skill_matcher.py) that finds the earliest listed keyword occurring in
+  the text.
+
+Every entry counts its calls, hits and time spent, and merged patterns count
+hits per member, so ``stats()`` lists the slowest patterns first. Counters
+from worker processes are shipped back with ``drain()`` and ``merge()``.
+
+Text from badly extracted PDFs can hold runs of thousands of characters with
+no line break, keyword or '@', so patterns in the bank are written to take
+linear time on any input: a match that can only begin at the start of a run
+is anchored there rather than tried from every position inside it (see the
+institution and experience patterns), repetitions are capped where a real
+value is short, and ``sub_before_last_word`` spares a whitespace-terminated
+``re.sub`` the trailing run it would otherwise backtrack over.
+benchmarks/fuzz_extractors.py times every extractor on such text.
+"""
+import re
+import threading
+import time
+
+from common.skill_matcher import SkillMatcher
+
+
+def sub_before_last_word(pattern, repl, text):
+    """re.sub(pattern, repl, text) for a pattern whose every match ends in whitespace.
+
+    No such match lies in the text's trailing run of non-whitespace, yet
+    ``re.sub`` tries one at each position of it, and a pattern like
+    r'http\\S+\\s' scans to the end of the run each time: quadratic in its
+    length. The run is split off first and appended unchanged.
+    """
+    if not text or text[-1].isspace():
+        return re.sub(pattern, repl, text)
+    last_word = text.rsplit(None, 1)[-1]
+    head = text[:len(text) - len(last_word)]
+    return re.sub(pattern, repl, head) + last_word if head else text
+
+
+class _Counted:
+    """Calls, hits and seconds spent in one bank entry"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _record(self, started, hit):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.calls += 1
+            self.hits += 1 if hit else 0
+            self.seconds += elapsed
+
+    def _counters(self):
+        return {'calls': self.calls, 'hits': self.hits, 'seconds': self.seconds}
+
+    def _add(self, counters):
+        self.calls += counters['calls']
+        self.hits += counters['hits']
+        self.seconds += counters['seconds']
+
+    def _clear(self):
+        self.calls = self.hits = 0
+        self.seconds = 0.0
+
+    def counters(self, reset=False):
+        with self._lock:
+            counters = self._counters()
+            if reset:
+                self._clear()
+            return counters
+
+    def merge(self, counters):
+        with self._lock:
+            self._add(counters)
+
+    def stats(self):
+        counters = self.counters()
+        calls = counters['calls']
+        return {
+            'name': self.name,
+            'calls': calls,
+            'hits': counters['hits'],
+            'total_ms': round(counters['seconds'] * 1000, 3),
+            'avg_us': round(counters['seconds'] / calls * 1e6, 2) if calls else 0.0,
+        }
+
+
+class Pattern(_Counted):
+    """One compiled regex"""
+
+    def __init__(self, name, pattern, flags=0):
+        super().__init__(name)
+        self.regex = re.compile(pattern, flags)
+
+    def search(self, text):
+        started = time.perf_counter()
+        match = self.regex.search(text)
+        self._record(started, match)
+        return match
+
+    def finditer(self, text):
+        """Every match, as a list (collected up front so the scan is timed)"""
+        started = time.perf_counter()
+        matches = list(self.regex.finditer(text))
+        self._record(started, matches)
+        return matches
+
+    def split(self, text):
+        started = time.perf_counter()
+        parts = self.regex.split(text)
+        self._record(started, len(parts) > 1)
+        return parts
+
+    def sub(self, repl, text):
+        started = time.perf_counter()
+        result, count = self.regex.subn(repl, text)
+        self._record(started, count)
+        return result
+
+
+class FirstOf(_Counted):
+    """Ordered patterns tried in one scan; the first listed one found wins.
+
+    ``patterns`` is a sequence of ``(pattern, label)``. ``search`` returns
+    ``(label, match text, groups of that pattern)`` for the earliest listed
+    pattern that matches anywhere in the text (at its leftmost match, like
+    ``re.search``), or None. ``members`` keeps each pattern compiled on its
+    own for callers that need all of its matches.
+
+    Once a pattern is found, the rest of the text is only scanned for the
+    ones listed before it.
+
+    An alternation gives up the fast scans ``re`` does for a single pattern
+    starting with a literal or character class, and tries every member at
+    every position. ``guard`` is a zero-width regex that holds wherever any
+    member can match (e.g. r'\\b(?=[bm])' when every member starts with
+    \\b and b or m); checked first, it rejects most positions in one step.
+    """
+
+    def __init__(self, name, patterns, flags=0, guard=''):
+        super().__init__(name)
+        self.guard = guard
+        patterns = list(patterns)
+        self.labels = [label for _, label in patterns]
+        self.members = [Pattern(f"{name}[{i}]", pattern, flags) for i, (pattern, _) in enumerate(patterns)]
+        self.member_hits = [0] * len(patterns)
+        # Each member becomes (?P<pN>...) and its own groups follow it
+        self._groups = []
+        alternatives = []
+        group = 1
+        for i, member in enumerate(self.members):
+            self._groups.append((f'p{i}', group, group + member.regex.groups))
+            alternatives.append(f"(?P<p{i}>{member.regex.pattern})")
+            group += member.regex.groups + 1
+        self._alternatives = alternatives
+        self._flags = flags
+        # _prefixes[k]: the alternation of the first k members (same group numbers)
+        self._prefixes = [None] * len(alternatives) + [self._compile(len(alternatives))]
+        self.regex = self._prefixes[-1]
+
+    def _compile(self, count):
+        return re.compile(f"{self.guard}(?:{'|'.join(self._alternatives[:count])})", self._flags)
+
+    def _prefix(self, count):
+        if self._prefixes[count] is None:
+            self._prefixes[count] = self._compile(count)
+        return self._prefixes[count]
+
+    def search(self, text):
+        started = time.perf_counter()
+        best, best_match = None, None
+        regex, pos = self.regex, 0
+        while True:
+            match = regex.search(text, pos)
+            if match is None:
+                break
+            # lastgroup is the member's own group: it closes after any group inside it
+            best, best_match = int(match.lastgroup[1:]), match
+            if best == 0:
+                break
+            # members listed earlier were tried first at this position, so any
+            # better match starts further on (possibly inside this one)
+            regex, pos = self._prefix(best), match.start() + 1
+        self._record(started, best_match)
+        if best_match is None:
+            return None
+        with self._lock:
+            self.member_hits[best] += 1
+        name, first, last = self._groups[best]
+        return self.labels[best], best_match.group(name), best_match.groups()[first:last]
+
+    def _counters(self):
+        return dict(super()._counters(), member_hits=list(self.member_hits))
+
+    def _add(self, counters):
+        super()._add(counters)
+        self.member_hits = [a + b for a, b in zip(self.member_hits, counters['member_hits'])]
+
+    def _clear(self):
+        super()._clear()
+        self.member_hits = [0] * len(self.member_hits)
+
+    def stats(self):
+        stats = super().stats()
+        hits = self.counters()['member_hits']
+        stats['members'] = [
+            {'pattern': member.regex.pattern, 'label': label, 'hits': count}
+            for member, label, count in zip(self.members, self.labels, hits)
+        ]
+        return stats
+
+
+class Keywords(_Counted):
+    """Keywords found as plain case-insensitive substrings, in one pass"""
+
+    def __init__(self, name, keywords):
+        super().__init__(name)
+        self.matcher = SkillMatcher(keywords, whole_words=False)
+
+    def first(self, text):
+        """The earliest listed keyword occurring in text, or None"""
+        started = time.perf_counter()
+        keyword = self.matcher.first(text)
+        self._record(started, keyword)
+        return keyword
+
+
+class PatternBank:
+    """Named, precompiled patterns and their counters"""
+
+    def __init__(self):
+        self._entries = {}
+
+    def _add(self, entry):
+        if entry.name in self._entries:
+            raise ValueError(f"Pattern {entry.name!r} is already in the bank")
+        self._entries[entry.name] = entry
+        return entry
+
+    def pattern(self, name, pattern, flags=0):
+        return self._add(Pattern(name, pattern, flags))
+
+    def first_of(self, name, patterns, flags=0, guard=''):
+        entry = self._add(FirstOf(name, patterns, flags, guard))
+        for member in entry.members:  # used on their own, e.g. to collect every match
+            self._add(member)
+        return entry
+
+    def keywords(self, name, keywords):
+        return self._add(Keywords(name, keywords))
+
+    def stats(self):
+        """Every entry's counters, most time spent first"""
+        return sorted((entry.stats() for entry in self._entries.values()), key=lambda s: -s['total_ms'])
+
+    def drain(self):
+        """{name: counters} since the last drain, resetting them (to ship from a worker)"""
+        drained = {}
+        for name, entry in self._entries.items():
+            counters = entry.counters(reset=True)
+            if counters['calls']:
+                drained[name] = counters
+        return drained
+
+    def merge(self, drained):
+        """Add counters drained from another process's copy of this bank"""
+        for name, counters in drained.items():
+            if name in self._entries:
+                self._entries[name].merge(counters)
@@ -0,0 +1,214 @@
+"""
+Page-parallel PDF text extraction.
+
+PDF text used to be extracted two ways. ``pdf_to_text`` in app1.py and
+apps.py walked the pages with PyPDF2 one after another, growing the result
+with ``text +=``. ``ResumeParser.extract_text_from_pdf`` did the same with
+pdfplumber, and when any page failed it started over with PyPDF2, after
+whatever pdfplumber had already appended. A fifty-page portfolio took fifty
+pages' time, and a page that sent a parser into a loop held its worker
+indefinitely.
+
+PdfTextExtractor is the one engine behind both. It reads the document once to
+count its pages. Short documents (most resumes) are extracted in-process.
+Longer ones are split into page ranges that run in a process pool, each
+worker opening its own copy of the document, so the whole takes about as long
+as its slowest range.
+
+``pages`` yields each page's text in order as soon as its range is done, and
+``extract`` joins them the way the old loops did. ``backends`` lists the
+libraries to try for each page, so a page pdfplumber cannot read still gets
+PyPDF2's text. A page gets at most ``page_timeout`` seconds; past that it is
+skipped and logged. The cap uses SIGALRM, so it holds wherever extraction runs
+in a process's main thread, as it does in pool workers.
+"""
+import io
+import logging
+import math
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import util
+from pathlib import Path
+
+from PyPDF2 import PdfReader
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+logger = logging.getLogger(__name__)
+
+
+class PageTimeout(Exception):
+    """Raised inside a page's extraction once it runs past the page timeout"""
+
+
+def _raise_timeout(signum, frame):
+    raise PageTimeout()
+
+
+@contextmanager
+def _deadline(seconds):
+    """Interrupt the block after seconds (a no-op off the main thread or without SIGALRM)"""
+    if not seconds or not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _open(backend, data):
+    """(pages, close) of the document as read by one backend"""
+    if backend == 'pypdf2':
+        return PdfReader(io.BytesIO(data)).pages, lambda: None
+    if backend == 'pdfplumber':
+        if pdfplumber is None:
+            raise RuntimeError("pdfplumber is not installed")
+        pdf = pdfplumber.open(io.BytesIO(data))
+        return pdf.pages, pdf.close
+    raise ValueError(f"Unknown PDF backend {backend!r}")
+
+
+def _read(source):
+    """PDF bytes from bytes, a path or a binary file object (e.g. an upload)"""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, Path)):
+        return Path(source).read_bytes()
+    return source.read()
+
+
+def _page_text(data, number, backends, page_timeout, documents):
+    """Text of one page from the first backend that reads it in time, or ''"""
+    for backend in backends:
+        try:
+            with _deadline(page_timeout):
+                if backend not in documents:
+                    documents[backend] = None  # stays None if opening fails
+                    documents[backend] = _open(backend, data)
+                if documents[backend] is None:
+                    continue
+                return documents[backend][0][number].extract_text() or ''
+        except PageTimeout:
+            # another backend would most likely hang on the same page too
+            logger.warning(f"PDF page {number + 1}: no text after {page_timeout}s with {backend}, skipped")
+            return ''
+        except Exception as e:
+            logger.debug(f"PDF page {number + 1}: {backend} failed ({e})")
+    return ''
+
+
+def _iter_range(data, start, stop, backends, page_timeout):
+    documents = {}  # backend -> (pages, close), opened on first use
+    try:
+        for number in range(start, stop):
+            yield _page_text(data, number, backends, page_timeout, documents)
+    finally:
+        for document in documents.values():
+            if document is not None:
+                document[1]()
+
+
+def _extract_range(data, start, stop, backends, page_timeout):
+    # Runs in a pool worker
+    return list(_iter_range(data, start, stop, backends, page_timeout))
+
+
+class PdfTextExtractor:
+    """Extracts PDF text page by page, across processes for long documents.
+
+    ``backends`` are tried in order for each page ('pypdf2', 'pdfplumber').
+    Documents of at least ``min_parallel_pages`` pages are split into
+    ``workers`` page ranges (or ranges of ``pages_per_task`` pages).
+    """
+
+    def __init__(self, backends=('pypdf2',), workers=None, page_timeout=30.0,
+                 min_parallel_pages=4, pages_per_task=None):
+        self.backends = tuple(backends)
+        self.workers = workers or os.cpu_count() or 1
+        self.page_timeout = page_timeout
+        self.min_parallel_pages = min_parallel_pages
+        self.pages_per_task = pages_per_task
+        self._executor = None
+        self._owner = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        # Created on first use, and again in a forked child: the pool's
+        # processes belong to the process that started them
+        with self._lock:
+            if self._executor is None or self._owner != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._owner = os.getpid()
+                # A pool worker (e.g. a parse worker) exits through multiprocessing's
+                # handler, which waits for its children without running the
+                # executor's own exit hook; stop this pool first, before the
+                # handler closes the queues that carry the stop signal
+                util.Finalize(None, self.shutdown, kwargs={'wait': True}, exitpriority=100)
+            return self._executor
+
+    def page_count(self, data):
+        """Number of pages, from the first backend that can open the document"""
+        error = None
+        for backend in self.backends:
+            try:
+                pages, close = _open(backend, data)
+            except Exception as e:
+                error = error or e
+                continue
+            try:
+                return len(pages)
+            finally:
+                close()
+        raise error
+
+    def ranges(self, count):
+        """[(start, stop)] page ranges for a document of count pages, one per task"""
+        size = self.pages_per_task or max(1, math.ceil(count / self.workers))
+        return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+    def pages(self, source):
+        """Each page's text in order ('' when it has none), as soon as it is extracted.
+
+        source is PDF bytes, a path or a binary file object.
+        """
+        data = _read(source)
+        count = self.page_count(data)
+        if count < self.min_parallel_pages or self.workers < 2:
+            yield from _iter_range(data, 0, count, self.backends, self.page_timeout)
+            return
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_extract_range, data, start, stop, self.backends, self.page_timeout)
+            for start, stop in self.ranges(count)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool:
+            with self._lock:
+                self._executor = None  # a worker died; start a fresh pool next time
+            raise
+        finally:
+            for future in futures:  # the caller may stop reading early
+                future.cancel()
+
+    def extract(self, source):
+        """The document's text: every page with text, each followed by a newline"""
+        return ''.join(text + '\n' for text in self.pages(source) if text)
+
+    def shutdown(self, wait=False):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owner == os.getpid():
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,163 @@
+"""
+Condition-based page readiness for the Selenium agents.
+
+The agents used to ``time.sleep`` a fixed 2-4 seconds after every navigation,
+click and redirect, which dominated the time spent per application and was
+still too short on slow pages. PageReadiness waits for concrete conditions
+instead, each bounded by a timeout budget:
+
+* ``document_ready`` - ``document.readyState == 'complete'``
+* ``network_idle``   - no new resource requests for ``quiet_ms`` (checked in
+  the page by one async script, not by polling from Python)
+* ``selector``       - a CSS selector is present
+* ``new_window``     - a window not in a known set of handles has opened, or
+  the current tab has navigated away instead
+
+Every wait records how long it actually took (and whether it ran out of
+budget) in a WaitTimings registry, which the stats endpoints summarise.
+"""
+import logging
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from common.metrics import LatencyStats
+
+logger = logging.getLogger('job_agent')
+
+NETWORK_IDLE_SCRIPT = """
+var quiet = arguments[0], budget = arguments[1], done = arguments[arguments.length - 1];
+if (performance.setResourceTimingBufferSize) { performance.setResourceTimingBufferSize(5000); }
+var start = Date.now(), changed = start;
+var seen = performance.getEntriesByType('resource').length;
+(function check() {
+    var count = performance.getEntriesByType('resource').length;
+    if (count !== seen) { seen = count; changed = Date.now(); }
+    if (document.readyState === 'complete' && Date.now() - changed >= quiet) { return done(true); }
+    if (Date.now() - start >= budget) { return done(false); }
+    setTimeout(check, 50);
+})();
+"""
+
+
+class WaitTimings:
+    """Per-condition durations of readiness waits, shared across agents."""
+
+    def __init__(self, window=500):
+        self.window = window
+        self._stats = {}
+        self._timeouts = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds, timed_out=False):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = LatencyStats(self.window)
+                self._timeouts[name] = 0
+            if timed_out:
+                self._timeouts[name] += 1
+        stats.add(seconds)
+
+    def summary(self):
+        with self._lock:
+            items = list(self._stats.items())
+            timeouts = dict(self._timeouts)
+        return {name: {**stats.summary(), 'timeouts': timeouts[name]} for name, stats in items}
+
+
+class PageReadiness:
+    """Bounded, timed waits on page conditions for one driver."""
+
+    def __init__(self, driver, timings=None, timeout=10, quiet_ms=500, poll=0.1):
+        self.driver = driver
+        self.timings = timings or WaitTimings()
+        self.timeout = timeout
+        self.quiet_ms = quiet_ms
+        self.poll = poll
+
+    def _timed(self, name, started, ok):
+        self.timings.record(name, time.perf_counter() - started, timed_out=not ok)
+        if not ok:
+            logger.debug(f"Readiness wait '{name}' ran out of budget")
+
+    def _wait(self, condition, timeout):
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=self.poll).until(condition)
+        except TimeoutException:
+            return None
+
+    def document_ready(self, timeout=None):
+        """Wait for document.readyState == 'complete'"""
+        started = time.perf_counter()
+        ok = self._wait(
+            lambda d: d.execute_script("return document.readyState") == 'complete',
+            self.timeout if timeout is None else timeout
+        ) is not None
+        self._timed('document_ready', started, ok)
+        return ok
+
+    def network_idle(self, quiet_ms=None, timeout=None):
+        """Wait until the page has loaded and issued no new requests for quiet_ms"""
+        quiet_ms = self.quiet_ms if quiet_ms is None else quiet_ms
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            ok = bool(self.driver.execute_async_script(NETWORK_IDLE_SCRIPT, quiet_ms, int(timeout * 1000)))
+        except WebDriverException as e:
+            # Navigation during the wait unloads the script; settle for readyState
+            logger.debug(f"Network idle wait interrupted: {str(e)}")
+            remaining = max(0.0, timeout - (time.perf_counter() - started))
+            ok = self._wait(
+                lambda d: d.execute_script("return document.readyState") == 'complete', remaining
+            ) is not None
+        self._timed('network_idle', started, ok)
+        return ok
+
+    def selector(self, css, timeout=None):
+        """Wait for an element matching css; returns it, or None on timeout"""
+        started = time.perf_counter()
+        element = self._wait(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css)),
+            self.timeout if timeout is None else timeout
+        )
+        self._timed('selector', started, element is not None)
+        return element
+
+    def new_window(self, known_handles, timeout=None, from_url=None):
+        """Wait for a window outside known_handles; returns its handle or None.
+
+        With from_url, also stops (returning None) as soon as the current tab
+        leaves that URL, i.e. the redirect stayed in the same window.
+        """
+        known = set(known_handles)
+        started = time.perf_counter()
+        navigated = []
+
+        def opened(driver):
+            fresh = [h for h in driver.window_handles if h not in known]
+            if fresh:
+                return fresh[0]
+            if from_url is not None and driver.current_url != from_url:
+                navigated.append(driver.current_url)
+                return True
+            return False
+
+        handle = self._wait(opened, self.timeout if timeout is None else timeout)
+        self._timed('new_window', started, handle is not None)
+        return None if navigated else handle
+
+    def page_loaded(self, css=None, timeout=None):
+        """Wait for load plus network quiescence, then optionally for css, within one budget"""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        ok = self.network_idle(timeout=timeout)
+        if css:
+            remaining = max(0.5, timeout - (time.perf_counter() - started))
+            ok = self.selector(css, timeout=remaining) is not None and ok
+        self._timed('page_loaded', started, ok)
+        return ok
@@ -0,0 +1,204 @@
+"""
+Single-pass resume section segmentation.
+
+Section lookups used to happen per extractor and per header: app1's
+``get_section_text`` re-normalized the whole text, built a fuzzy regex for
+each header name and then rescanned the rest of the document once per stop
+header (and the module defined the function twice, the second silently
+replacing the first). Any mention of a header word counted, so "Education &
+Certifications" ended the education section before it began.
+
+SectionSegmenter compiles every header of every section into one regex,
+shaped as a trie over their letters (letter-spaced headings like
+"E D U C A T I O N" included), and finds all of them in a single
+``finditer`` over the lower-cased text. A hit on a line that reads as a
+heading and is made up of header phrases ("[TECHNICAL SKILLS]", "Education:",
+"WORK EXPERIENCE", "Awards & Honors") opens a section that runs to the next
+heading line. A section with no heading line of its own (its header shares
+the line with content, as in "Education: B.Tech, IIT Delhi", or extraction
+lost the line breaks) falls back to its first mention, which is what the old
+lookup always did, and the section it was found in ends above it. ``segment``
+returns ``{section: (start, end)}`` offsets into the original text, so
+extractors slice it instead of searching again.
+"""
+import bisect
+import re
+import unicodedata
+
+SECTION_HEADERS = {
+    'education': ('education', 'educational qualification', 'academic qualification', 'academic background'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment history', 'work history'),
+    'skills': ('skills', 'technical skills', 'core competencies'),
+    'projects': ('projects', 'personal projects', 'academic projects'),
+    'certifications': ('certifications', 'certificates', 'licenses'),
+    # Not extracted from, but a section ends where one of these begins
+    'summary': ('summary', 'professional summary', 'objective', 'career objective'),
+    'achievements': ('achievements', 'awards', 'honors'),
+    'publications': ('publications',),
+    'internships': ('internships',),
+    'interests': ('interests', 'hobbies'),
+}
+PREAMBLE = 'preamble'  # everything before the first heading: name and contact details
+
+_HEADING_EDGES = '[]()*•#=-–—|: \t'
+_MAX_HEADING_WORDS = 6
+_CONNECTORS = re.compile(r'(?:[\W_]|\band\b)*')  # what may sit between header phrases on a heading line
+
+
+def _trie(phrases):
+    root = {}
+    for phrase in phrases:
+        node = root
+        for ch in phrase.lower():
+            if not ch.isspace():
+                node = node.setdefault(ch, {})
+        node[''] = {}  # a phrase ends here
+    return root
+
+
+def _trie_regex(node):
+    """One regex for every phrase below a trie node.
+
+    Letters may be spaced out ("S K I L L S") and a trailing 's' is optional
+    (certification/s). Sharing prefixes keeps the work per text position to a
+    character test or two instead of one attempt per phrase.
+    """
+    branches = []
+    for ch, child in sorted(node.items()):
+        if not ch:
+            continue
+        tails = []
+        if any(child):
+            tails.append(r'[ \t]*' + _trie_regex(child))
+        if '' in child:
+            tails.append(r'(?:[ \t]*s)?')  # longer phrases are tried first
+        branches.append(re.escape(ch) + (tails[0] if len(tails) == 1 else f"(?:{'|'.join(tails)})"))
+    return f"(?:{'|'.join(branches)})"
+
+
+def _matchable(text):
+    """(lower-cased text to scan, offset of each of its characters in text or None)
+
+    PDF text carries ligatures, non-breaking and zero-width spaces that hide
+    headers; when there are any they are normalized per character, so every
+    match still maps back to an offset in the original text.
+    """
+    if text.isascii() or (unicodedata.is_normalized('NFKC', text) and '\u200b' not in text):
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered, None
+    chars, offsets = [], []
+    for i, ch in enumerate(text):
+        normalized = '' if ch == '\u200b' else unicodedata.normalize('NFKC', ch).lower()
+        chars.append(normalized)
+        offsets.extend([i] * len(normalized))
+    offsets.append(len(text))
+    return ''.join(chars), offsets
+
+
+def is_heading(line):
+    """Whether a line reads as a section heading rather than running text"""
+    title = line.strip(_HEADING_EDGES)
+    words = title.split()
+    return (
+        0 < len(title) <= 60
+        and title[0].isupper()
+        and ':' not in title  # "Skills: Python, SQL" is content, "Skills:" a heading
+        and (len(words) <= _MAX_HEADING_WORDS or all(len(word) == 1 for word in words))  # "S K I L L S"
+        and not any(ch.isdigit() for ch in title)
+    )
+
+
+class SectionSegmenter:
+    """Finds the sections of a resume in one scan of its text.
+
+    ``headers`` maps a section name to the header phrases that open it;
+    matching is case-insensitive and on word boundaries.
+    """
+
+    def __init__(self, headers=SECTION_HEADERS):
+        self.headers = {section: tuple(phrases) for section, phrases in headers.items()}
+        self._sections = {}
+        for section, phrases in self.headers.items():
+            for phrase in phrases:
+                letters = ''.join(phrase.lower().split())
+                self._sections[letters] = self._sections[letters + 's'] = section
+        phrases = [phrase for phrases in self.headers.values() for phrase in phrases]
+        # Scanned against lower-cased text: cheaper than re.I at every position
+        self.pattern = re.compile(r'\b' + _trie_regex(_trie(phrases)) + r'\b')
+
+    def _only_headers(self, line):
+        """Whether a lower-cased line is header phrases and punctuation only
+        ("skills & tools" is not: it opens no known section)"""
+        return _CONNECTORS.fullmatch(self.pattern.sub(' ', line)) is not None
+
+    def _section(self, header):
+        """Section of a matched header, whatever its spacing and case"""
+        return self._sections[''.join(header.lower().split())]
+
+    def segment(self, text):
+        """{section: (start, end)} for every section found, plus PREAMBLE"""
+        view, offsets = _matchable(text)
+        headings = []      # (line start, body start, section) of heading lines
+        mentions = []      # (start, section, end) of headers in running text
+        lines = {}
+        line_start = searched = 0
+        for m in self.pattern.finditer(view):
+            # only look back to the previous match: a text without line breaks
+            # would otherwise be rescanned from its start for every header
+            line_start = view.rfind('\n', searched, m.start()) + 1 or line_start
+            searched = m.start()
+            if line_start not in lines:
+                line_end = view.find('\n', m.end())
+                line_end = len(view) if line_end == -1 else line_end
+                line = text[line_start:line_end] if offsets is None else text[offsets[line_start]:offsets[line_end]]
+                heading = is_heading(line) and self._only_headers(view[line_start:line_end])
+                lines[line_start] = (heading, min(line_end + 1, len(view)))
+            heading, body_start = lines[line_start]
+            if heading:
+                headings.append((line_start, body_start, self._section(m.group())))
+            else:
+                mentions.append((m.start(), self._section(m.group()), m.end()))
+
+        spans = {}
+        heading_starts = sorted({start for start, _, _ in headings})
+        for line_start, body_start, section in headings:
+            if section in spans:
+                continue
+            i = bisect.bisect_right(heading_starts, line_start)
+            spans[section] = (body_start, heading_starts[i] if i < len(heading_starts) else len(view))
+        if heading_starts:
+            spans[PREAMBLE] = (0, heading_starts[0])
+
+        # Sections without a heading line start at their first mention and run
+        # to the next header of anything else, as the old per-header lookup did.
+        # When that mention opens its line ("Education: B.Tech ..."), the
+        # heading's section it sat in ends on the line above
+        headed = set(spans) - {PREAMBLE}
+        for i, (start, section, body_start) in enumerate(mentions):
+            if section in spans:
+                continue
+            end = next((m[0] for m in mentions[i + 1:] if m[1] != section), len(view))
+            j = bisect.bisect_right(heading_starts, start)
+            if j < len(heading_starts):
+                end = min(end, heading_starts[j])
+            spans[section] = (body_start, end)
+            line_start = view.rfind('\n', 0, start) + 1
+            if view[line_start:start].strip(_HEADING_EDGES):
+                continue
+            for other in headed:
+                other_start, other_end = spans[other]
+                if other_start <= line_start < other_end:
+                    spans[other] = (other_start, line_start)
+
+        if offsets is not None:
+            spans = {section: (offsets[start], offsets[end]) for section, (start, end) in spans.items()}
+        return spans
+
+    def text(self, text, section, spans=None, limit=None):
+        """The text of one section (at most limit characters), or None"""
+        spans = self.segment(text) if spans is None else spans
+        if section not in spans:
+            return None
+        start, end = spans[section]
+        return text[start:end if limit is None else min(end, start + limit)]
@@ -0,0 +1,337 @@
+"""
+CPU sentence-embedding index over job listings.
+
+Keyword and TF-IDF matching only score words a resume and a job share, so an
+"SDE II" posting never matches a "Software Engineer" resume. JobEmbedder
+embeds text with a sentence-transformers model on CPU, in batches, and keeps
+every vector in an SQLite cache keyed by a hash of (model, text), so a job is
+only ever encoded once. SemanticJobIndex stores the vectors in FAISS:
+
+- the main index is an inverted-file (IVF) index written to disk and opened
+  with IO_FLAG_MMAP, so startup does not read it into memory and its pages
+  are shared between worker processes;
+- new jobs go into a small in-memory delta index that is searched alongside
+  it and merged into the main file by ``compact``;
+- searches can be restricted to a set of job ids (query-time filters), with
+  nprobe widened as the filter gets more selective.
+
+Vectors are L2-normalised, so inner product is cosine similarity.
+"""
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+DEFAULT_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+
+def _require_faiss():
+    if faiss is None:
+        raise RuntimeError("faiss is not installed (pip install faiss-cpu)")
+
+
+class EmbeddingCache:
+    """SQLite store of float32 vectors keyed by sha1(model, text)."""
+
+    def __init__(self, path, model_name):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)')
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text):
+        return hashlib.sha1(f"{self.model_name}\x00{text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, keys):
+        """{key: vector} for the keys present in the cache"""
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                chunk = unique[start:start + 500]
+                marks = ','.join('?' * len(chunk))
+                rows = self._conn.execute(f'SELECT key, vector FROM embeddings WHERE key IN ({marks})', chunk)
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items):
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)',
+                ((key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in items)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class JobEmbedder:
+    """Batched CPU sentence embeddings with an on-disk cache in front."""
+
+    def __init__(self, model_name=DEFAULT_MODEL, batch_size=64, cache=None, threads=None):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache = cache
+        self.threads = threads
+        self.encoded = 0
+        self.encode_seconds = 0.0
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    if self.threads:
+                        import torch
+                        torch.set_num_threads(self.threads)
+                    self._model = SentenceTransformer(self.model_name, device='cpu')
+        return self._model
+
+    @property
+    def dim(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def _encode(self, texts):
+        started = time.perf_counter()
+        vectors = self.model.encode(
+            texts, batch_size=self.batch_size, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False,
+        )
+        self.encoded += len(texts)
+        self.encode_seconds += time.perf_counter() - started
+        return vectors.astype(np.float32, copy=False)
+
+    def embed(self, texts):
+        """(len(texts), dim) float32 array of normalised embeddings"""
+        if not texts:
+            return np.empty((0, self.dim), dtype=np.float32)
+        if self.cache is None:
+            return self._encode(list(texts))
+
+        keys = [self.cache.key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        if missing:
+            missing_keys = list(missing)
+            for start in range(0, len(missing_keys), self.batch_size * 16):
+                batch = missing_keys[start:start + self.batch_size * 16]
+                vectors = self._encode([missing[key] for key in batch])
+                self.cache.put_many(zip(batch, vectors))
+                cached.update(zip(batch, vectors))
+        return np.vstack([cached[key] for key in keys])
+
+    def stats(self):
+        stats = {
+            'model': self.model_name,
+            'encoded': self.encoded,
+            'encode_per_sec': round(self.encoded / self.encode_seconds, 1) if self.encode_seconds else None,
+        }
+        if self.cache is not None:
+            stats.update({'cache_hits': self.cache.hits, 'cache_misses': self.cache.misses})
+        return stats
+
+
+def ivf_nlist(count):
+    """Inverted lists for count vectors: ~4*sqrt(n), at least 39 training points each"""
+    return max(1, min(int(4 * math.sqrt(count)), count // 39))
+
+
+class SemanticJobIndex:
+    """Memory-mapped FAISS index of job embeddings plus an in-memory delta.
+
+    ``path`` is the index file; a ``.meta.json`` sidecar records the model,
+    dimension and highest job id indexed, so ``max_id`` tells a sync where to
+    resume. Below ``flat_below`` vectors the main index is exact (flat).
+    """
+
+    def __init__(self, path, dim, model_name=DEFAULT_MODEL, nprobe=16, flat_below=50000):
+        _require_faiss()
+        self.path = Path(path)
+        self.meta_path = self.path.with_name(self.path.name + '.meta.json')
+        self.dim = dim
+        self.model_name = model_name
+        self.nprobe = nprobe
+        self.flat_below = flat_below
+        self.max_id = 0
+        self.main = None
+        self._lock = threading.RLock()
+        self._reset_delta()
+
+    def _reset_delta(self):
+        self.delta = faiss.IndexIDMap2(faiss.IndexFlatIP(self.dim))
+        self._delta_ids = []
+        self._delta_vectors = []
+
+    @property
+    def ntotal(self):
+        return (self.main.ntotal if self.main is not None else 0) + self.delta.ntotal
+
+    @property
+    def nlist(self):
+        ivf = faiss.try_extract_index_ivf(self.main) if self.main is not None else None
+        return ivf.nlist if ivf is not None else 0
+
+    def load(self):
+        """Open the persisted index memory-mapped; False when there is none yet.
+
+        The file is the source of truth: anything still in the delta is dropped.
+        """
+        with self._lock:
+            if not self.path.exists():
+                return False
+            meta = json.loads(self.meta_path.read_text()) if self.meta_path.exists() else {}
+            if meta.get('model', self.model_name) != self.model_name or meta.get('dim', self.dim) != self.dim:
+                raise RuntimeError(
+                    f"{self.path} was built with {meta.get('model')} ({meta.get('dim')}d); "
+                    f"rebuild it for {self.model_name}"
+                )
+            # IVF lists are mapped from the file; a small flat index is simply read
+            self.main = faiss.read_index(str(self.path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            self.max_id = meta.get('max_id', 0)
+            self._reset_delta()
+            return True
+
+    def _new_main(self, vectors):
+        count = len(vectors)
+        if count < self.flat_below:
+            return faiss.IndexIDMap2(faiss.IndexFlatIP(self.dim))
+        nlist = ivf_nlist(count)
+        quantizer = faiss.IndexFlatIP(self.dim)
+        index = faiss.IndexIVFFlat(quantizer, self.dim, nlist, faiss.METRIC_INNER_PRODUCT)
+        sample = vectors
+        if count > nlist * 256:
+            sample = vectors[np.random.default_rng(0).choice(count, nlist * 256, replace=False)]
+        index.train(sample)
+        return index
+
+    def _write(self, index):
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        faiss.write_index(index, str(tmp))
+        os.replace(tmp, self.path)
+        self.meta_path.write_text(json.dumps({
+            'model': self.model_name, 'dim': self.dim, 'max_id': self.max_id, 'count': index.ntotal,
+        }))
+
+    def build(self, ids, vectors):
+        """Replace the index with exactly these vectors, persisted and re-mapped"""
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock:
+            index = self._new_main(vectors)
+            index.add_with_ids(vectors, ids)
+            self.max_id = int(ids.max()) if len(ids) else 0
+            self._write(index)
+            self.load()
+
+    def add(self, ids, vectors):
+        """Make new jobs searchable now; they reach the file on compact()"""
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if not len(ids):
+            return
+        with self._lock:
+            self.delta.add_with_ids(vectors, ids)
+            self._delta_ids.append(ids)
+            self._delta_vectors.append(vectors)
+            self.max_id = max(self.max_id, int(ids.max()))
+
+    def compact(self):
+        """Merge the delta into the on-disk index and map it again"""
+        with self._lock:
+            if not self._delta_ids:
+                return
+            ids = np.concatenate(self._delta_ids)
+            vectors = np.vstack(self._delta_vectors)
+            if self.main is None:
+                self.build(ids, vectors)
+                return
+            # The mapped index is read-only: add to a fully read copy and swap files
+            index = faiss.read_index(str(self.path))
+            if self.nlist == 0 and index.ntotal + len(ids) >= self.flat_below:
+                # Outgrew exact search: retrain as IVF over everything
+                old_ids = faiss.vector_to_array(index.id_map).astype(np.int64)
+                old = index.index.reconstruct_n(0, index.ntotal)
+                self.build(np.concatenate([old_ids, ids]), np.vstack([old, vectors]))
+                return
+            index.add_with_ids(vectors, ids)
+            self._write(index)
+            self.load()
+
+    def _params(self, index, selector, nprobe):
+        if faiss.try_extract_index_ivf(index) is not None:
+            return faiss.SearchParametersIVF(sel=selector, nprobe=nprobe)
+        return faiss.SearchParameters(sel=selector) if selector is not None else None
+
+    def search(self, vectors, k=20, ids=None):
+        """(scores, job ids) arrays of shape (len(vectors), k), best first; -1 pads.
+
+        ``ids`` restricts results to those job ids.
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        selector = None
+        nprobe = self.nprobe
+        if ids is not None:
+            ids = np.ascontiguousarray(ids, dtype=np.int64)
+            selector = faiss.IDSelectorBatch(len(ids), faiss.swig_ptr(ids))
+            # A selective filter leaves few hits per probed list: probe more of them
+            if self.main is not None and len(ids):
+                nprobe = min(max(self.nlist, 1), int(nprobe * max(1.0, self.main.ntotal / len(ids))))
+
+        with self._lock:
+            parts = []
+            for index in (self.main, self.delta):
+                if index is None or index.ntotal == 0:
+                    continue
+                scores, found = index.search(vectors, k, params=self._params(index, selector, nprobe))
+                parts.append((scores, found))
+        if not parts:
+            return np.full((len(vectors), k), -np.inf, dtype=np.float32), np.full((len(vectors), k), -1)
+        if len(parts) == 1:
+            return parts[0]
+
+        scores = np.hstack([p[0] for p in parts])
+        found = np.hstack([p[1] for p in parts])
+        scores[found < 0] = -np.inf
+        order = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+        return np.take_along_axis(scores, order, axis=1), np.take_along_axis(found, order, axis=1)
+
+    def stats(self):
+        return {
+            'path': str(self.path),
+            'total': self.ntotal,
+            'main': self.main.ntotal if self.main is not None else 0,
+            'delta': self.delta.ntotal,
+            'nlist': self.nlist,
+            'nprobe': self.nprobe,
+            'max_id': self.max_id,
+        }
@@ -0,0 +1,139 @@
+"""
+Single-pass skill matching.
+
+Both resume parsers used to run one ``re.search(r'\\b' + skill + r'\\b', ...)``
+per skill or alias, i.e. hundreds of full scans of the same text. SkillMatcher
+compiles every alias into one Aho-Corasick automaton at import time and finds
+all of them in a single pass, applying the same ``\\b`` rules as the regexes it
+replaces so the extracted skills do not change.
+"""
+
+
+def _is_word(ch):
+    # Same definition of a word character as `\w` in `re` for str patterns
+    return ch.isalnum() or ch == '_'
+
+
+def _lower_same_length(text):
+    """Lower-case text without changing its length (keeps match offsets valid)."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A handful of characters expand when lower-cased (e.g. 'İ'); keep those as-is
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton mapping aliases to canonical skill names.
+
+    ``skills`` is either an iterable of skill names (each name is its own alias)
+    or a mapping ``{canonical_name: [alias, ...]}``. Matching is case-insensitive
+    and an alias only counts when it sits on word boundaries, exactly like
+    ``re.search(r'\\b' + re.escape(alias) + r'\\b', text, re.IGNORECASE)``.
+    With ``whole_words=False`` any occurrence counts, like
+    ``alias.lower() in text.lower()``.
+    """
+
+    def __init__(self, skills, whole_words=True):
+        self.whole_words = whole_words
+        if isinstance(skills, dict):
+            items = skills.items()
+        else:
+            items = ((skill, [skill]) for skill in skills)
+
+        # Canonical names in declaration order, first occurrence wins
+        self.skills = []
+        index = {}
+        alias_ids = {}
+        for skill, aliases in items:
+            if skill not in index:
+                index[skill] = len(self.skills)
+                self.skills.append(skill)
+            for alias in aliases:
+                if alias:
+                    alias_ids.setdefault(alias.lower(), set()).add(index[skill])
+
+        self._build(alias_ids)
+
+    def _build(self, alias_ids):
+        goto = [{}]
+        outputs = [[]]
+
+        for alias, ids in alias_ids.items():
+            state = 0
+            for ch in alias:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((len(alias), _is_word(alias[0]), _is_word(alias[-1]), frozenset(ids)))
+
+        # Breadth-first construction of failure links; each state inherits the
+        # outputs of its longest proper suffix so one lookup reports every alias
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                outputs[nxt] = outputs[nxt] + outputs[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def find(self, text):
+        """Return the set of canonical skill names present in text."""
+        return {self.skills[i] for i in self._find_ids(text)}
+
+    def first(self, text):
+        """The earliest declared skill present in text, or None."""
+        found_ids = self._find_ids(text)
+        return self.skills[min(found_ids)] if found_ids else None
+
+    def _find_ids(self, text):
+        if not text:
+            return set()
+
+        haystack = _lower_same_length(text)
+        size = len(haystack)
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        whole_words = self.whole_words
+        found_ids = set()
+        state = 0
+        for pos, ch in enumerate(haystack):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            if not outputs[state]:
+                continue
+
+            for length, starts_word, ends_word, ids in outputs[state]:
+                if ids <= found_ids:
+                    continue
+                if not whole_words:
+                    found_ids |= ids
+                    continue
+                start = pos - length + 1
+                before = start > 0 and _is_word(haystack[start - 1])
+                after = pos + 1 < size and _is_word(haystack[pos + 1])
+                if before != starts_word and after != ends_word:
+                    found_ids |= ids
+
+        return found_ids
+
+    def extract(self, text):
+        """Return the skills present in text, in declaration order."""
+        found = self.find(text)
+        return [skill for skill in self.skills if skill in found]
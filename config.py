@@ -9,3 +9,29 @@ class Config:
         f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Shared connection pool (see application/db.py)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))  # extra connections allowed under bursts
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))  # seconds to wait for a free connection
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))  # reconnect before MySQL's wait_timeout
+
+    # Resume-to-job matching (see application/matching.py)
+    MATCH_VECTORIZER_PATH = os.getenv(
+        'MATCH_VECTORIZER_PATH',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume-parser', 'model', 'tfidf_vectorizer_categorization.pkl')
+    )
+    MATCH_SKILL_WEIGHT = float(os.getenv('MATCH_SKILL_WEIGHT', 0.5))  # share of the score from skill overlap
+    MATCH_REFRESH_SECONDS = int(os.getenv('MATCH_REFRESH_SECONDS', 30))  # how often to check jobs for changes
+
+    # Semantic job index (see application/semantic.py; build with `flask index-jobs`)
+    SEMANTIC_MODEL = os.getenv('SEMANTIC_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+    SEMANTIC_INDEX_PATH = os.getenv(
+        'SEMANTIC_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'semantic', 'jobs.faiss')
+    )
+    SEMANTIC_CACHE_PATH = os.getenv(
+        'SEMANTIC_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'semantic', 'embeddings.db')
+    )
+    SEMANTIC_BATCH_SIZE = int(os.getenv('SEMANTIC_BATCH_SIZE', 64))  # texts per model.encode batch
+    SEMANTIC_THREADS = int(os.getenv('SEMANTIC_THREADS', 0)) or None  # torch CPU threads (default: torch's choice)
+    SEMANTIC_NPROBE = int(os.getenv('SEMANTIC_NPROBE', 16))  # IVF lists searched per query
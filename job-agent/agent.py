@@ -3,14 +3,14 @@ import os
 import sys
 import json
 import logging
+import threading
+import uuid
 from datetime import datetime
 from pathlib import Path
 import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import (
     TimeoutException, 
@@ -19,6 +19,14 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.form_snapshot import FormSnapshot
+from common.card_scraper import scrape_cards, LINKEDIN_CARDS, INDEED_CARDS
+from common.readiness import PageReadiness, WaitTimings
+from common.apply_scheduler import ApplyScheduler
+from common.journal import ApplicationJournal, job_key, TERMINAL_STATUSES
+from common.job_dedupe import AppliedJobIndex
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -44,10 +52,28 @@ class Config:
     RESUME_DIR = BASE_DIR.parent / "resumes"
     LOGS_DIR = BASE_DIR / "logs"
     
-    DEFAULT_DELAY = 5
+    DEFAULT_DELAY = 5  # minimum gap between applications on the same host
+    APPLY_WORKERS = 2  # browsers applying in parallel
+    MAX_PER_HOST = 1  # concurrent applications per job site
     MAX_APPLICATIONS_PER_SESSION = 20
     TIMEOUT = 15
     
+    # Page readiness budgets (replace fixed sleeps)
+    READY_TIMEOUT = 10  # seconds per wait
+    NETWORK_QUIET_MS = 500  # no new requests for this long = idle
+    NEW_WINDOW_TIMEOUT = 5
+    FORM_SELECTOR = "form, input, textarea, select"
+    
+    # Every application outcome is appended here as it happens; a rerun
+    # skips jobs already finished in it when SKIP_COMPLETED is on
+    JOURNAL_PATH = LOGS_DIR / "journal.jsonl"
+    JOURNAL_SYNC_EVERY = 8  # fsync after this many records
+    
+    # Postings already applied to, by canonical job id, across sessions;
+    # searches and batches leave them out too while SKIP_COMPLETED is on
+    APPLIED_INDEX_PATH = LOGS_DIR / "applied_jobs.db"
+    SKIP_COMPLETED = True
+    
     # Changed to India
     DEFAULT_LOCATION = "India"
     SEARCH_RADIUS = 25  # miles
@@ -106,44 +132,15 @@ class FormFiller:
     }
     
     @staticmethod
-    def find_field(driver, field_type, timeout=5):
+    def snapshot(driver):
+        return FormSnapshot.capture(driver)
+    
+    @staticmethod
+    def find_field(driver, field_type, timeout=5, snapshot=None):
         patterns = FormFiller.FIELD_PATTERNS.get(field_type, [])
-        
-        for pattern in patterns:
-            # Try by ID
-            try:
-                return driver.find_element(By.ID, pattern)
-            except NoSuchElementException:
-                pass
-            
-            # Try by name
-            try:
-                return driver.find_element(By.NAME, pattern)
-            except NoSuchElementException:
-                pass
-            
-            # Try by label text
-            try:
-                label = driver.find_element(By.XPATH, f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{pattern}')]")
-                for_attr = label.get_attribute('for')
-                if for_attr:
-                    return driver.find_element(By.ID, for_attr)
-            except NoSuchElementException:
-                pass
-            
-            # Try by placeholder
-            try:
-                return driver.find_element(By.XPATH, f"//*[contains(@placeholder, '{pattern}')]")
-            except NoSuchElementException:
-                pass
-            
-            # Try partial match in any attribute
-            try:
-                return driver.find_element(By.XPATH, f"//*[contains(@id, '{pattern}') or contains(@name, '{pattern}') or contains(@class, '{pattern}')]")
-            except NoSuchElementException:
-                pass
-        
-        return None
+        if snapshot is None:
+            snapshot = FormFiller.snapshot(driver)
+        return snapshot.find(patterns, use_labels=True, match_class=True)
     
     @staticmethod
     def fill_field(element, value, clear_first=True):
@@ -172,7 +169,7 @@ class FormFiller:
 
 class JobApplicationAgent:
     
-    def __init__(self, resume_path, config=None):
+    def __init__(self, resume_path, config=None, journal=None, applied_index=None):
         self.config = config or Config()
         self.resume_path = Path(resume_path)
         
@@ -183,8 +180,25 @@ class JobApplicationAgent:
         self.driver = None
         self.applications_log = []
         self.form_filler = FormFiller()
+        self.parse_stats = {}  # platform -> card count and parse time of the last search
+        self.wait_timings = WaitTimings()
+        self.ready = None
+        self.headless = False
+        # Scheduler workers share their parent's journal and index (one
+        # SQLite handle, one Bloom filter load) instead of opening their own
+        self.journal = journal or ApplicationJournal(
+            self.config.JOURNAL_PATH, sync_every=self.config.JOURNAL_SYNC_EVERY
+        )
+        self.applied_index = applied_index or AppliedJobIndex(self.config.APPLIED_INDEX_PATH)
+        self.session_id = uuid.uuid4().hex
+        self.skipped_jobs = []
+    
+    @property
+    def candidate_key(self):
+        return self.candidate_data.get('email') or self.candidate_data.get('name')
         
     def setup_driver(self, headless=False):
+        self.headless = headless
         options = webdriver.ChromeOptions()
         
         if headless:
@@ -215,6 +229,12 @@ class JobApplicationAgent:
             "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
+        self.ready = PageReadiness(
+            self.driver, self.wait_timings,
+            timeout=self.config.READY_TIMEOUT,
+            quiet_ms=self.config.NETWORK_QUIET_MS
+        )
+        
         logger.info("WebDriver initialized successfully")
         
     def parse_resume(self):
@@ -245,6 +265,22 @@ class JobApplicationAgent:
             logger.error(f"Error parsing resume: {str(e)}")
             return False
     
+    def parse_result_cards(self, platform, spec, num_jobs, location):
+        # All cards come back from a single script call
+        job_listings, stats = scrape_cards(
+            self.driver, spec, num_jobs,
+            defaults={'company': 'Unknown', 'location': location},
+            platform=platform
+        )
+        self.parse_stats[platform] = stats
+        
+        if self.config.SKIP_COMPLETED:
+            job_listings, applied = self.applied_index.filter_new(job_listings, self.candidate_key)
+            if applied:
+                logger.info(f"Dropped {len(applied)} {platform} results already applied to or repeated")
+        logger.info(f"Parsed {stats['parsed']}/{stats['cards']} {platform} cards in {stats['parse_ms']} ms")
+        return job_listings
+    
     def search_jobs_indeed(self, job_title=None, location=None, num_jobs=10):
         job_title = job_title or self.candidate_data.get('category', 'Software Engineer')
         location = location or self.config.DEFAULT_LOCATION
@@ -263,45 +299,11 @@ class JobApplicationAgent:
             
             logger.info(f"Searching Indeed: {job_title} in {location}")
             self.driver.get(search_url)
-            time.sleep(3)
 
-            wait = WebDriverWait(self.driver, self.config.TIMEOUT)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.job_seen_beacon")))
-            
-            job_listings = []
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon")
-            
-            for card in job_cards[:num_jobs]:
-                try:
-                    # Get job title and link
-                    title_elem = card.find_element(By.CSS_SELECTOR, "h2.jobTitle a")
-                    job_url = title_elem.get_attribute('href')
-                    job_title_text = title_elem.text
-                    
-                    # Get company
-                    try:
-                        company = card.find_element(By.CSS_SELECTOR, "span[data-testid='company-name']").text
-                    except:
-                        company = "Unknown"
-                    
-                    # Get location
-                    try:
-                        loc = card.find_element(By.CSS_SELECTOR, "div[data-testid='text-location']").text
-                    except:
-                        loc = location
-                    
-                    job_listings.append({
-                        'title': job_title_text,
-                        'company': company,
-                        'location': loc,
-                        'url': job_url,
-                        'platform': 'indeed'
-                    })
-                    
-                except Exception as e:
-                    logger.debug(f"Could not parse job card: {str(e)}")
-                    continue
+            if self.ready.selector("div.job_seen_beacon", timeout=self.config.TIMEOUT) is None:
+                raise TimeoutException("Indeed results did not appear")
             
+            job_listings = self.parse_result_cards('indeed', INDEED_CARDS, num_jobs, location)
             logger.info(f"Found {len(job_listings)} jobs on Indeed")
             return job_listings
             
@@ -323,105 +325,14 @@ class JobApplicationAgent:
             
             logger.info(f"Searching LinkedIn: {job_title} in {location}")
             self.driver.get(search_url)
-            time.sleep(4)
+            self.ready.selector("div.base-card", timeout=self.config.TIMEOUT)
             
-            # Scroll to load more jobs
+            # Scroll to load more jobs, waiting for the lazy-load requests to settle
             for _ in range(3):
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            
-            job_listings = []
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card")
-            
-            for card in job_cards[:num_jobs]:
-                # try:
-                #     title_elem = card.find_element(By.CSS_SELECTOR, "h3.base-search-card__title")
-                #     link_elem = card.find_element(By.CSS_SELECTOR, "a.base-card__full-link")
-                    
-                #     job_url = link_elem.get_attribute('href')
-                #     job_title_text = title_elem.textfor card in job_cards[:num_jobs]:
-                try:
-                    # Try multiple selectors for title
-                    title_elem = None
-                    title_selectors = [
-                        "h3.base-search-card__title",
-                        "h3.job-card-list__title",
-                        "a.job-card-container__link",
-                        ".job-card-list__title--link"
-                    ]
-                    
-                    for selector in title_selectors:
-                        try:
-                            title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if title_elem and title_elem.text.strip():
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    if not title_elem or not title_elem.text.strip():
-                        logger.debug("Skipping card - no title found")
-                        continue
-                    
-                    # Try multiple selectors for link
-                    link_elem = None
-                    link_selectors = [
-                        "a.base-card__full-link",
-                        "a.job-card-container__link",
-                        "a.job-card-list__title"
-                    ]
-                    
-                    for selector in link_selectors:
-                        try:
-                            link_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if link_elem:
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    if not link_elem:
-                        logger.debug("Skipping card - no link found")
-                        continue
-                    
-                    try:
-                        company_selectors = [
-                            "h4.base-search-card__subtitle",
-                            "a.job-card-container__company-name",
-                            ".job-card-container__primary-description"
-                        ]
-                        company = "Unknown"
-                        for selector in company_selectors:
-                            try:
-                                comp_elem = card.find_element(By.CSS_SELECTOR, selector)
-                                if comp_elem and comp_elem.text.strip():
-                                    company = comp_elem.text.strip()
-                                    break
-                            except:
-                                continue
-                    except:
-                        company = "Unknown"
-
-                    try:
-                        location_selectors = [
-                            "span.job-search-card__location",
-                            ".job-card-container__metadata-item",
-                            "span.job-card-container__location"
-                        ]
-                        loc = location
-                        for selector in location_selectors:
-                            try:
-                                loc_elem = card.find_element(By.CSS_SELECTOR, selector)
-                                if loc_elem and loc_elem.text.strip():
-                                    loc = loc_elem.text.strip()
-                                    break
-                            except:
-                                continue
-                    except:
-                        loc = location
-                    
-                except Exception as e:
-                    logger.debug(f"Could not parse LinkedIn job card: {str(e)}")
-                    continue
+                self.ready.network_idle(timeout=2)
             
+            job_listings = self.parse_result_cards('linkedin', LINKEDIN_CARDS, num_jobs, location)
             logger.info(f"Found {len(job_listings)} jobs on LinkedIn")
             return job_listings
             
@@ -439,37 +350,40 @@ class JobApplicationAgent:
             
             filled_fields = []
             
+            # One snapshot of the page serves every field lookup below
+            snapshot = self.form_filler.snapshot(self.driver)
+            
             # Try to fill full name
-            full_name_field = self.form_filler.find_field(self.driver, 'full_name')
+            full_name_field = self.form_filler.find_field(self.driver, 'full_name', snapshot=snapshot)
             if full_name_field:
                 if self.form_filler.fill_field(full_name_field, name):
                     filled_fields.append('full_name')
             else:
                 # Try first and last name separately
-                first_name_field = self.form_filler.find_field(self.driver, 'first_name')
+                first_name_field = self.form_filler.find_field(self.driver, 'first_name', snapshot=snapshot)
                 if first_name_field and self.form_filler.fill_field(first_name_field, first_name):
                     filled_fields.append('first_name')
                 
-                last_name_field = self.form_filler.find_field(self.driver, 'last_name')
+                last_name_field = self.form_filler.find_field(self.driver, 'last_name', snapshot=snapshot)
                 if last_name_field and self.form_filler.fill_field(last_name_field, last_name):
                     filled_fields.append('last_name')
             
             # Fill email
-            email_field = self.form_filler.find_field(self.driver, 'email')
+            email_field = self.form_filler.find_field(self.driver, 'email', snapshot=snapshot)
             if email_field:
                 email = self.candidate_data.get('email', '')
                 if self.form_filler.fill_field(email_field, email):
                     filled_fields.append('email')
             
             # Fill phone
-            phone_field = self.form_filler.find_field(self.driver, 'phone')
+            phone_field = self.form_filler.find_field(self.driver, 'phone', snapshot=snapshot)
             if phone_field:
                 phone = self.candidate_data.get('phone', '')
                 if self.form_filler.fill_field(phone_field, phone):
                     filled_fields.append('phone')
             
             # Upload resume
-            resume_field = self.form_filler.find_field(self.driver, 'resume')
+            resume_field = self.form_filler.find_field(self.driver, 'resume', snapshot=snapshot)
             if resume_field:
                 if self.form_filler.upload_file(resume_field, str(self.resume_path)):
                     filled_fields.append('resume')
@@ -490,7 +404,7 @@ class JobApplicationAgent:
             logger.info(f"Applying to: {job_info['title']} at {job_info['company']}")
             
             self.driver.get(job_url)
-            time.sleep(3)
+            self.ready.page_loaded()
             
             # Look for apply button
             apply_button = None
@@ -550,19 +464,19 @@ class JobApplicationAgent:
             is_external = 'company site' in button_text or 'employer site' in button_text
 
             # Click apply button
+            job_page = self.driver.current_url
             try:
                 apply_button.click()
             except ElementClickInterceptedException:
                 # Try JavaScript click
                 self.driver.execute_script("arguments[0].click();", apply_button)
 
-            time.sleep(2)
-
             # Handle external vs internal application
             if is_external:
-                form_filled = self.handle_external_application(job_info)
+                form_filled = self.handle_external_application(job_info, job_page)
             else:
-                # Fill the form on current page
+                # Fill the form on current page once it has rendered
+                self.ready.page_loaded(self.config.FORM_SELECTOR)
                 form_filled = self.fill_application_form()
             
             if not form_filled:
@@ -604,25 +518,24 @@ class JobApplicationAgent:
             logger.error(f"Error applying to job: {str(e)}")
             return False
     
-    def handle_external_application(self, job_info):
-        """Handle 'Apply on company site' redirects"""
+    def handle_external_application(self, job_info, job_page=None):
+        """Handle 'Apply on company site' redirects (job_page: URL the apply button was clicked on)"""
         try:
             logger.info("Detected external application - following redirect...")
-            time.sleep(2)
             
             # Get current window handle
             main_window = self.driver.current_window_handle
             
-            # Check if new tab/window opened
-            if len(self.driver.window_handles) > 1:
+            # Wait for a new tab/window to open
+            new_window = self.ready.new_window(
+                [main_window], timeout=self.config.NEW_WINDOW_TIMEOUT, from_url=job_page
+            )
+            if new_window:
                 # Switch to new window
-                for handle in self.driver.window_handles:
-                    if handle != main_window:
-                        self.driver.switch_to.window(handle)
-                        break
+                self.driver.switch_to.window(new_window)
                 
                 logger.info(f"Redirected to: {self.driver.current_url}")
-                time.sleep(3)
+                self.ready.page_loaded(self.config.FORM_SELECTOR)
                 
                 # Try to fill form on external site
                 form_filled = self.fill_application_form()
@@ -663,7 +576,7 @@ class JobApplicationAgent:
             else:
                 # Stayed in same window - just redirected
                 logger.info(f"Redirected to: {self.driver.current_url}")
-                time.sleep(3)
+                self.ready.page_loaded(self.config.FORM_SELECTOR)
                 return self.fill_application_form()
                 
         except Exception as e:
@@ -675,53 +588,109 @@ class JobApplicationAgent:
                 pass
             return False
     
-    def apply_to_jobs_batch(self, job_listings, delay=None):
-        """Apply to multiple jobs"""
+    def skip_completed(self, job_listings):
+        """Drop jobs the journal already has a terminal outcome for (resume mode)"""
+        completed = self.journal.completed(candidate=self.candidate_key)
+        pending = [job for job in job_listings if job_key(job) not in completed]
+        self.skipped_jobs = [job for job in job_listings if job_key(job) in completed]
+        if self.skipped_jobs:
+            logger.info(f"Skipping {len(self.skipped_jobs)} jobs already completed in the journal")
+        return pending
+    
+    def open_apply_worker(self, worker_index):
+        """Scheduler worker: an agent with its own browser and log"""
+        worker = JobApplicationAgent(
+            self.resume_path, self.config, journal=self.journal, applied_index=self.applied_index
+        )
+        worker.candidate_data = self.candidate_data
+        worker.wait_timings = self.wait_timings
+        if worker_index == 0:
+            # The first worker reuses this agent's browser
+            worker.driver, worker.ready = self.driver, self.ready
+            return worker.apply_and_collect, None
+        
+        worker.setup_driver(headless=self.headless)
+        return worker.apply_and_collect, worker.close
+    
+    def apply_and_collect(self, job):
+        """Apply to one job; returns (success, log entries it produced)"""
+        start = len(self.applications_log)
+        started = time.perf_counter()
+        applied = self.apply_to_job(job)
+        self.wait_timings.record('application', time.perf_counter() - started)
+        
+        entries = self.applications_log[start:]
+        del self.applications_log[start:]
+        return applied, entries
+    
+    def apply_to_jobs_batch(self, job_listings, delay=None, workers=None):
+        """Apply to multiple jobs, in parallel across different job sites"""
         delay = delay or self.config.DEFAULT_DELAY
         
-        successful = 0
-        failed = 0
+        # Never open a page for a posting this candidate already applied to
+        if self.config.SKIP_COMPLETED:
+            job_listings, applied = self.applied_index.filter_new(job_listings, self.candidate_key)
+            if applied:
+                logger.info(f"Skipping {len(applied)} jobs already applied to")
+                self.skipped_jobs.extend(applied)
         
-        for i, job in enumerate(job_listings, 1):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Processing job {i}/{len(job_listings)}")
-            logger.info(f"{'='*60}")
-            
-            if self.apply_to_job(job):
-                successful += 1
-            else:
-                failed += 1
-                self.applications_log.append({
+        scheduler = ApplyScheduler(
+            workers=workers or self.config.APPLY_WORKERS,
+            min_interval=delay,
+            max_per_host=self.config.MAX_PER_HOST
+        )
+        
+        progress = {'done': 0, 'successful': 0, 'failed': 0}
+        lock = threading.Lock()
+        
+        def on_result(index, job, result):
+            applied, entries = result or (False, [])
+            if not applied:
+                entries = entries + [{
                     **job,
                     'timestamp': datetime.now().isoformat(),
                     'status': 'failed',
                     'form_filled': False
-                })
-            
-            # Rate limiting
-            if i < len(job_listings):
-                logger.info(f"Waiting {delay} seconds before next application...")
-                time.sleep(delay)
+                }]
+            
+            with lock:
+                progress['done'] += 1
+                progress['successful' if applied else 'failed'] += 1
+                self.applications_log.extend(entries)
+                for entry in entries:
+                    self.journal.append(entry, candidate=self.candidate_key, session=self.session_id)
+                    if entry.get('status') in TERMINAL_STATUSES:
+                        self.applied_index.add(entry, candidate=self.candidate_key, status=entry['status'])
+                logger.info(f"Processed job {progress['done']}/{len(job_listings)}: {job.get('title')}")
         
+        logger.info(f"Applying to {len(job_listings)} jobs with up to {scheduler.workers} browsers "
+                    f"({delay}s between jobs on the same site)")
+        scheduler.run(job_listings, self.open_apply_worker, on_result)
+        
+        successful, failed = progress['successful'], progress['failed']
         logger.info(f"\n{'='*60}")
         logger.info(f"Batch complete: {successful} ready to submit, {failed} failed")
+        for name, summary in self.wait_timings.summary().items():
+            logger.info(f"  {name}: p50 {summary['p50']} ms, p95 {summary['p95']} ms, {summary['timeouts']} timeouts")
         logger.info(f"{'='*60}")
         
         return successful, failed
     
     def save_log(self):
-        """Save application log"""
+        """Save application summary, compacted from this session's journal records"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = self.config.LOGS_DIR / f"applications_{timestamp}.json"
+        applications = self.journal.compact(session=self.session_id)
         
         with open(log_file, 'w') as f:
             json.dump({
                 'candidate': self.candidate_data,
-                'applications': self.applications_log,
+                'applications': applications,
                 'summary': {
-                    'total': len(self.applications_log),
-                    'ready': sum(1 for a in self.applications_log if a.get('status') == 'ready_to_submit'),
-                    'failed': sum(1 for a in self.applications_log if a.get('status') == 'failed')
+                    'total': len(applications),
+                    'ready': sum(1 for a in applications if a.get('status') == 'ready_to_submit'),
+                    'failed': sum(1 for a in applications if a.get('status') == 'failed'),
+                    'skipped': len(self.skipped_jobs)
                 }
             }, f, indent=2)
         
@@ -729,6 +698,7 @@ class JobApplicationAgent:
     
     def close(self):
         """Cleanup"""
+        self.journal.sync()
         if self.driver:
             self.driver.quit()
             logger.info("WebDriver closed")
@@ -784,8 +754,10 @@ def main():
         for i, job in enumerate(all_jobs, 1):
             logger.info(f"{i}. {job['title']} at {job['company']} ({job['platform']})")
         
-        # Apply to jobs
+        # Apply to jobs, skipping ones an earlier (possibly interrupted) run finished
         logger.info("\nStarting application process...")
+        if agent.config.SKIP_COMPLETED:
+            all_jobs = agent.skip_completed(all_jobs)
         agent.apply_to_jobs_batch(all_jobs[:3], delay=10)  # Apply to first 3 jobs
 
         agent.save_log()
@@ -794,6 +766,8 @@ def main():
         
     except KeyboardInterrupt:
         logger.info("\nProcess interrupted by user")
+        # Finished applications are already in the journal; summarise what we have
+        agent.save_log()
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
     finally:
@@ -1,20 +1,19 @@
-from fastapi import FastAPI, File, UploadFile, Form, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, Form
 from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
-from PyPDF2 import PdfReader
 import re
-import pickle
 import nltk
 from nltk import word_tokenize, pos_tag, ne_chunk
 from nltk.tree import Tree
 
 # Miscellaneous imports
-import unicodedata
+import io
 from typing import Optional, List
 import asyncio
 from datetime import datetime
 import json
+import math
 from pathlib import Path
 import logging
 import sys
@@ -22,8 +21,6 @@ import sys
 #Selenium imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException,
@@ -34,6 +31,27 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import time
 import os
+import threading
+import uuid
+
+# Shared engines live in the repository-level `common` package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.skill_matcher import SkillMatcher
+from common.parse_cache import ParseCache
+from common.parse_pool import BoundedProcessPool, PoolFullError
+from common.job_runs import JobRunManager
+from common.driver_pool import DriverPool
+from common.form_snapshot import FormSnapshot
+from common.card_scraper import scrape_cards, LINKEDIN_CARDS, INDEED_CARDS
+from common.readiness import PageReadiness, WaitTimings
+from common.apply_scheduler import ApplyScheduler
+from common.journal import ApplicationJournal, job_key, TERMINAL_STATUSES
+from common.job_dedupe import AppliedJobIndex
+from common.model_registry import ModelRegistry, ModelLoadError
+from common.section_segmenter import SectionSegmenter
+from common.parsed_document import as_document
+from common.pattern_bank import PatternBank, sub_before_last_word
+from common.pdf_text import PdfTextExtractor
 
 # If first run, uncomment and run once
 # nltk.download('punkt')
@@ -48,14 +66,67 @@ class JobAgentConfig:
     LOGS_DIR = BASE_DIR / "logs" / "applications"
     RESUME_STORAGE = BASE_DIR / "resumes"
     
-    DEFAULT_DELAY = 10
+    DEFAULT_DELAY = 10  # minimum gap between applications on the same host
     MAX_APPLICATIONS_PER_SESSION = 20
     TIMEOUT = 15
+    MAX_CONCURRENT_RUNS = int(os.getenv('AGENT_MAX_CONCURRENT_RUNS', 2))  # background runs at once
+    APPLY_WORKERS = int(os.getenv('AGENT_APPLY_WORKERS', 3))  # browsers per run applying in parallel
+    MAX_PER_HOST = int(os.getenv('AGENT_MAX_PER_HOST', 1))  # concurrent applications per job site
+    
+    # Warm browser pool shared by the search/apply endpoints
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', MAX_CONCURRENT_RUNS * APPLY_WORKERS))
+    DRIVER_MAX_USES = int(os.getenv('DRIVER_MAX_USES', 20))  # recycle a browser after this many leases
+    DRIVER_PREWARM = int(os.getenv('DRIVER_PREWARM', 0))  # browsers to start when the app boots
+    
+    # Page readiness budgets (replace fixed sleeps)
+    READY_TIMEOUT = float(os.getenv('AGENT_READY_TIMEOUT', 10))  # seconds per wait
+    NETWORK_QUIET_MS = int(os.getenv('AGENT_NETWORK_QUIET_MS', 500))  # no new requests for this long = idle
+    NEW_WINDOW_TIMEOUT = float(os.getenv('AGENT_NEW_WINDOW_TIMEOUT', 5))
+    FORM_SELECTOR = "form, input, textarea, select"
+    
+    # Every application outcome is appended here as it happens
+    JOURNAL_PATH = LOGS_DIR / "journal.jsonl"
+    JOURNAL_SYNC_EVERY = int(os.getenv('AGENT_JOURNAL_SYNC_EVERY', 8))  # fsync after this many records
+    
+    # Postings already applied to, by canonical job id, across sessions
+    APPLIED_INDEX_PATH = LOGS_DIR / "applied_jobs.db"
     
     # Create directories
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     RESUME_STORAGE.mkdir(parents=True, exist_ok=True)
 
+# ===================== PARSE CACHE CONFIGURATION ==========================
+class ParseCacheConfig:
+    """Configuration for the parsed-resume cache"""
+    CACHE_DIR = Path(__file__).parent / "cache" / "parsed"
+    MAX_BYTES = int(os.getenv('PARSE_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+    MEMORY_ITEMS = int(os.getenv('PARSE_CACHE_MEMORY_ITEMS', 128))  # 0 disables the memory tier
+
+    # Bump whenever extraction logic changes so old cache entries are ignored
+    PARSER_VERSION = "2"
+
+# ===================== PARSE POOL CONFIGURATION ==========================
+class ParsePoolConfig:
+    """Configuration for the resume parsing worker pool"""
+    WORKERS = int(os.getenv('PARSE_WORKERS', os.cpu_count() or 1))
+    MAX_QUEUE = int(os.getenv('PARSE_MAX_QUEUE', 2 * WORKERS))  # jobs waiting beyond the busy workers
+    # Long PDFs are split by page range across a pool of their own, started
+    # on first use in each parse worker that meets one. Every parse worker
+    # gets its share of the cores, so by default (one parse worker per core)
+    # pages are extracted in-process and no second pool competes for them
+    PDF_WORKERS = int(os.getenv('PDF_WORKERS', max(1, (os.cpu_count() or 1) // max(1, WORKERS))))
+    PDF_MIN_PARALLEL_PAGES = int(os.getenv('PDF_MIN_PARALLEL_PAGES', 4))  # shorter ones stay in-process
+    PDF_PAGE_TIMEOUT = float(os.getenv('PDF_PAGE_TIMEOUT', 30))  # seconds before a page is skipped
+
+# ===================== MODEL CONFIGURATION ==========================
+class ModelConfig:
+    """Configuration for the categorization model registry"""
+    MODEL_DIR = Path(__file__).parent / "model"
+    VERSION = os.getenv('CATEGORIZATION_MODEL_VERSION') or None  # name under model/versions/; unset = model/
+    WARMUP = os.getenv('MODEL_WARMUP', '0') == '1'  # load at startup instead of on the first parse
+    BATCH_CHUNK = int(os.getenv('CATEGORIZE_BATCH_CHUNK', '256'))  # texts per transform/predict call
+    BATCH_MAX_TEXTS = int(os.getenv('CATEGORIZE_BATCH_MAX', '10000'))  # per /api/categorize-batch request
+
 # Setup logging for job agent
 job_agent_logger = logging.getLogger('job_agent')
 job_agent_logger.setLevel(logging.INFO)
@@ -72,11 +143,31 @@ if sys.platform == 'win32':
 
 app = FastAPI()
 
-templates = Jinja2Templates(directory="templates")
+templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+
+# ===================== MODEL REGISTRY ==========================
+# Loaded on first use (or at startup with MODEL_WARMUP=1) and hot-swappable
+# through /api/models/categorization/swap; see common/model_registry.py
+categorization_model = ModelRegistry(ModelConfig.MODEL_DIR, ModelConfig.VERSION)
+
+# The model version is part of each entry's key (see parse_resume_bytes)
+parse_cache = ParseCache(
+    ParseCacheConfig.CACHE_DIR,
+    version=ParseCacheConfig.PARSER_VERSION,
+    max_bytes=ParseCacheConfig.MAX_BYTES,
+    memory_items=ParseCacheConfig.MEMORY_ITEMS,
+)
+
+# Parsing runs in worker processes so a slow PDF never stalls the event loop
+parse_pool = BoundedProcessPool(workers=ParsePoolConfig.WORKERS, max_queue=ParsePoolConfig.MAX_QUEUE)
+pdf_extractor = PdfTextExtractor(
+    workers=ParsePoolConfig.PDF_WORKERS,
+    page_timeout=ParsePoolConfig.PDF_PAGE_TIMEOUT,
+    min_parallel_pages=ParsePoolConfig.PDF_MIN_PARALLEL_PAGES,
+)
 
-# ===================== MODEL LOAD ==========================
-rf_classifier_categorization = pickle.load(open('model/rf_classifier_categorization.pkl', 'rb'))
-tfidf_vectorizer_categorization = pickle.load(open('model/tfidf_vectorizer_categorization.pkl', 'rb'))
+# Search/apply runs execute in the background and report progress as events
+agent_runs = JobRunManager(max_workers=JobAgentConfig.MAX_CONCURRENT_RUNS)
 
 # ===================== FORM FILLER UTILITY ==========================
 class FormFiller:
@@ -110,36 +201,17 @@ class FormFiller:
     }
     
     @staticmethod
-    def find_field(driver, field_type, timeout=5):
-        """Find form field by multiple strategies"""
+    def snapshot(driver):
+        """Capture every form control on the page in one round-trip"""
+        return FormSnapshot.capture(driver)
+    
+    @staticmethod
+    def find_field(driver, field_type, timeout=5, snapshot=None):
+        """Find form field by multiple strategies (matched against a page snapshot)"""
         patterns = FormFiller.FIELD_PATTERNS.get(field_type, [])
-        
-        for pattern in patterns:
-            # Try by ID
-            try:
-                return driver.find_element(By.ID, pattern)
-            except NoSuchElementException:
-                pass
-            
-            # Try by name
-            try:
-                return driver.find_element(By.NAME, pattern)
-            except NoSuchElementException:
-                pass
-            
-            # Try by placeholder
-            try:
-                return driver.find_element(By.XPATH, f"//*[contains(@placeholder, '{pattern}')]")
-            except NoSuchElementException:
-                pass
-            
-            # Try partial match
-            try:
-                return driver.find_element(By.XPATH, f"//*[contains(@id, '{pattern}') or contains(@name, '{pattern}')]")
-            except NoSuchElementException:
-                pass
-        
-        return None
+        if snapshot is None:
+            snapshot = FormFiller.snapshot(driver)
+        return snapshot.find(patterns)
     
     @staticmethod
     def fill_field(element, value, clear_first=True):
@@ -167,38 +239,105 @@ class FormFiller:
             job_agent_logger.error(f"Could not upload file: {str(e)}")
             return False
 
+# ===================== WEBDRIVER FACTORY ==========================
+def create_chrome_driver(headless=False):
+    """Start a Chrome WebDriver with the agent's options"""
+    options = webdriver.ChromeOptions()
+    
+    if headless:
+        options.add_argument('--headless')
+    
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.maximize_window()
+    return driver
+
+# Readiness wait durations across all agents, for /api/readiness/stats
+readiness_timings = WaitTimings()
+
+# Durable record of application outcomes shared by all runs
+application_journal = ApplicationJournal(JobAgentConfig.JOURNAL_PATH, sync_every=JobAgentConfig.JOURNAL_SYNC_EVERY)
+
+# Jobs already applied to, checked before any job page is opened
+applied_index = AppliedJobIndex(JobAgentConfig.APPLIED_INDEX_PATH)
+
+# Browsers are reused across search/apply requests instead of launched per request
+driver_pool = DriverPool(
+    lambda: create_chrome_driver(headless=True),
+    size=JobAgentConfig.DRIVER_POOL_SIZE,
+    max_uses=JobAgentConfig.DRIVER_MAX_USES,
+)
+
 # ===================== JOB APPLICATION AGENT ==========================
 class JobApplicationAgent:
     """Main job application agent"""
     
-    def __init__(self, candidate_data, resume_path, config=None):
+    def __init__(self, candidate_data, resume_path, config=None, on_event=None, journal=None, applied=None,
+                 skip_applied=True):
         self.config = config or JobAgentConfig()
         self.candidate_data = candidate_data
+        self.candidate_key = candidate_data.get('email') or candidate_data.get('name')
+        self.journal = journal or application_journal
+        self.applied_index = applied or applied_index
+        self.skip_applied = skip_applied  # off to re-run or re-apply to jobs already in the index
+        self.session_id = uuid.uuid4().hex
+        self.skipped_jobs = []
         self.resume_path = Path(resume_path)
         self.driver = None
         self.applications_log = []
         self.form_filler = FormFiller()
+        self.on_event = on_event  # optional callback(event_type, data) for progress reporting
+        self.driver_pool = None
+        self.parse_stats = {}  # platform -> card count and parse time of the last search
+        self.ready = None
         
-    def setup_driver(self, headless=False):
-        """Setup Chrome WebDriver"""
-        options = webdriver.ChromeOptions()
-        
-        if headless:
-            options.add_argument('--headless')
+    def emit(self, event_type, data):
+        """Report progress to the on_event callback, if any"""
+        if self.on_event:
+            try:
+                self.on_event(event_type, data)
+            except Exception as e:
+                job_agent_logger.warning(f"Progress callback failed: {str(e)}")
         
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    def setup_driver(self, headless=False, pool=None, lease_timeout=None):
+        """Setup Chrome WebDriver, leasing a warm one from pool when given"""
+        self.driver_pool = pool
+        if pool is not None:
+            self.driver = pool.acquire(lease_timeout)
+            job_agent_logger.info("WebDriver leased from pool")
+        else:
+            self.driver = create_chrome_driver(headless)
+            job_agent_logger.info("WebDriver initialized")
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.maximize_window()
+        self.ready = PageReadiness(
+            self.driver, readiness_timings,
+            timeout=self.config.READY_TIMEOUT,
+            quiet_ms=self.config.NETWORK_QUIET_MS
+        )
         
-        job_agent_logger.info("WebDriver initialized")
+    def parse_result_cards(self, platform, spec, num_jobs, location):
+        """Extract all result cards on the page in one script call"""
+        job_listings, stats = scrape_cards(
+            self.driver, spec, num_jobs,
+            defaults={'company': 'Unknown', 'location': location},
+            platform=platform
+        )
+        self.parse_stats[platform] = stats
         
+        if self.skip_applied:
+            job_listings, applied = self.applied_index.filter_new(job_listings, self.candidate_key)
+            if applied:
+                job_agent_logger.info(f"Dropped {len(applied)} {platform} results already applied to or repeated")
+        job_agent_logger.info(f"Parsed {stats['parsed']}/{stats['cards']} {platform} cards in {stats['parse_ms']} ms")
+        return job_listings
+    
     def search_jobs_indeed(self, job_title=None, location=None, num_jobs=10):
         """Search for jobs on Indeed"""
         job_title = job_title or self.candidate_data.get('category', 'Teacher')
@@ -218,41 +357,12 @@ class JobApplicationAgent:
             
             job_agent_logger.info(f"Searching Indeed: {job_title} in {location}")
             self.driver.get(search_url)
-            time.sleep(3)
-            
-            wait = WebDriverWait(self.driver, self.config.TIMEOUT)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.job_seen_beacon")))
-            
-            job_listings = []
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon")
             
-            for card in job_cards[:num_jobs]:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, "h2.jobTitle a")
-                    job_url = title_elem.get_attribute('href')
-                    job_title_text = title_elem.text
-                    
-                    try:
-                        company = card.find_element(By.CSS_SELECTOR, "span[data-testid='company-name']").text
-                    except:
-                        company = "Unknown"
-                    
-                    try:
-                        loc = card.find_element(By.CSS_SELECTOR, "div[data-testid='text-location']").text
-                    except:
-                        loc = location
-                    
-                    job_listings.append({
-                        'title': job_title_text,
-                        'company': company,
-                        'location': loc,
-                        'url': job_url,
-                        'platform': 'indeed'
-                    })
-                    
-                except Exception as e:
-                    continue
+            if self.ready.selector("div.job_seen_beacon", timeout=self.config.TIMEOUT) is None:
+                job_agent_logger.error("Timeout waiting for Indeed results")
+                return []
             
+            job_listings = self.parse_result_cards('indeed', INDEED_CARDS, num_jobs, location)
             job_agent_logger.info(f"Found {len(job_listings)} jobs on Indeed")
             return job_listings
             
@@ -271,94 +381,14 @@ class JobApplicationAgent:
             
             job_agent_logger.info(f"Searching LinkedIn: {job_title} in {location}")
             self.driver.get(search_url)
-            time.sleep(4)
+            self.ready.selector("div.base-card", timeout=self.config.TIMEOUT)
             
+            # Each scroll lazy-loads more cards; wait for those requests to settle
             for _ in range(3):
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            
-            job_listings = []
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card")
-            
-            for card in job_cards[:num_jobs]:
-                try:
-                    title_elem = None
-                    title_selectors = [
-                        "h3.base-search-card__title",
-                        "h3.job-card-list__title",
-                        "a.job-card-container__link"
-                    ]
-                    
-                    for selector in title_selectors:
-                        try:
-                            title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if title_elem and title_elem.text.strip():
-                                break
-                        except:
-                            continue
-                    
-                    if not title_elem or not title_elem.text.strip():
-                        continue
-                    
-                    link_elem = None
-                    link_selectors = [
-                        "a.base-card__full-link",
-                        "a.job-card-container__link"
-                    ]
-                    
-                    for selector in link_selectors:
-                        try:
-                            link_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if link_elem:
-                                break
-                        except:
-                            continue
-                    
-                    if not link_elem:
-                        continue
-                    
-                    job_url = link_elem.get_attribute('href')
-                    job_title_text = title_elem.text
-                    
-                    company = "Unknown"
-                    company_selectors = [
-                        "h4.base-search-card__subtitle",
-                        "a.job-card-container__company-name"
-                    ]
-                    for selector in company_selectors:
-                        try:
-                            comp_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if comp_elem and comp_elem.text.strip():
-                                company = comp_elem.text.strip()
-                                break
-                        except:
-                            continue
-                    
-                    loc = location
-                    location_selectors = [
-                        "span.job-search-card__location",
-                        ".job-card-container__metadata-item"
-                    ]
-                    for selector in location_selectors:
-                        try:
-                            loc_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if loc_elem and loc_elem.text.strip():
-                                loc = loc_elem.text.strip()
-                                break
-                        except:
-                            continue
-                    
-                    job_listings.append({
-                        'title': job_title_text,
-                        'company': company,
-                        'location': loc,
-                        'url': job_url,
-                        'platform': 'linkedin'
-                    })
-                    
-                except Exception as e:
-                    continue
+                self.ready.network_idle(timeout=2)
             
+            job_listings = self.parse_result_cards('linkedin', LINKEDIN_CARDS, num_jobs, location)
             job_agent_logger.info(f"Found {len(job_listings)} jobs on LinkedIn")
             return job_listings
             
@@ -376,37 +406,40 @@ class JobApplicationAgent:
             
             filled_fields = []
             
+            # One snapshot of the page serves every field lookup below
+            snapshot = self.form_filler.snapshot(self.driver)
+            
             # Try full name
-            full_name_field = self.form_filler.find_field(self.driver, 'full_name')
+            full_name_field = self.form_filler.find_field(self.driver, 'full_name', snapshot=snapshot)
             if full_name_field:
                 if self.form_filler.fill_field(full_name_field, name):
                     filled_fields.append('full_name')
             else:
                 # Try first/last separately
-                first_name_field = self.form_filler.find_field(self.driver, 'first_name')
+                first_name_field = self.form_filler.find_field(self.driver, 'first_name', snapshot=snapshot)
                 if first_name_field and self.form_filler.fill_field(first_name_field, first_name):
                     filled_fields.append('first_name')
                 
-                last_name_field = self.form_filler.find_field(self.driver, 'last_name')
+                last_name_field = self.form_filler.find_field(self.driver, 'last_name', snapshot=snapshot)
                 if last_name_field and self.form_filler.fill_field(last_name_field, last_name):
                     filled_fields.append('last_name')
             
             # Fill email
-            email_field = self.form_filler.find_field(self.driver, 'email')
+            email_field = self.form_filler.find_field(self.driver, 'email', snapshot=snapshot)
             if email_field:
                 email = self.candidate_data.get('email', '')
                 if self.form_filler.fill_field(email_field, email):
                     filled_fields.append('email')
             
             # Fill phone
-            phone_field = self.form_filler.find_field(self.driver, 'phone')
+            phone_field = self.form_filler.find_field(self.driver, 'phone', snapshot=snapshot)
             if phone_field:
                 phone = self.candidate_data.get('phone', '')
                 if self.form_filler.fill_field(phone_field, phone):
                     filled_fields.append('phone')
             
             # Upload resume
-            resume_field = self.form_filler.find_field(self.driver, 'resume')
+            resume_field = self.form_filler.find_field(self.driver, 'resume', snapshot=snapshot)
             if resume_field:
                 if self.form_filler.upload_file(resume_field, str(self.resume_path)):
                     filled_fields.append('resume')
@@ -418,22 +451,21 @@ class JobApplicationAgent:
             job_agent_logger.error(f"Error filling form: {str(e)}")
             return False
     
-    def handle_external_application(self, job_info):
-        """Handle 'Apply on company site' redirects"""
+    def handle_external_application(self, job_info, job_page=None):
+        """Handle 'Apply on company site' redirects (job_page: URL the apply button was clicked on)"""
         try:
             job_agent_logger.info("Detected external application - following redirect...")
-            time.sleep(2)
             
             main_window = self.driver.current_window_handle
+            new_window = self.ready.new_window(
+                [main_window], timeout=self.config.NEW_WINDOW_TIMEOUT, from_url=job_page
+            )
             
-            if len(self.driver.window_handles) > 1:
-                for handle in self.driver.window_handles:
-                    if handle != main_window:
-                        self.driver.switch_to.window(handle)
-                        break
+            if new_window:
+                self.driver.switch_to.window(new_window)
                 
                 job_agent_logger.info(f"Redirected to: {self.driver.current_url}")
-                time.sleep(3)
+                self.ready.page_loaded(self.config.FORM_SELECTOR)
                 
                 form_filled = self.fill_application_form()
                 
@@ -469,7 +501,7 @@ class JobApplicationAgent:
                 return False
             else:
                 job_agent_logger.info(f"Redirected to: {self.driver.current_url}")
-                time.sleep(3)
+                self.ready.page_loaded(self.config.FORM_SELECTOR)
                 return self.fill_application_form()
                 
         except Exception as e:
@@ -488,7 +520,7 @@ class JobApplicationAgent:
             job_agent_logger.info(f"Applying to: {job_info['title']} at {job_info['company']}")
             
             self.driver.get(job_url)
-            time.sleep(3)
+            self.ready.page_loaded()
             
             # Look for apply button with comprehensive selectors
             apply_button = None
@@ -533,17 +565,17 @@ class JobApplicationAgent:
             is_external = 'company site' in button_text or 'employer site' in button_text
             
             # Click apply button
+            job_page = self.driver.current_url
             try:
                 apply_button.click()
             except ElementClickInterceptedException:
                 self.driver.execute_script("arguments[0].click();", apply_button)
             
-            time.sleep(2)
-            
-            # Handle external vs internal
+            # Handle external vs internal (external waits for its own new window)
             if is_external:
-                form_filled = self.handle_external_application(job_info)
+                form_filled = self.handle_external_application(job_info, job_page)
             else:
+                self.ready.page_loaded(self.config.FORM_SELECTOR)
                 form_filled = self.fill_application_form()
             
             if not form_filled:
@@ -585,46 +617,107 @@ class JobApplicationAgent:
             job_agent_logger.error(f"Error applying to job: {str(e)}")
             return False
     
-    def apply_to_jobs_batch(self, job_listings, delay=None):
-        """Apply to multiple jobs"""
+    def skip_completed(self, job_listings):
+        """Drop jobs the journal already has a terminal outcome for (resume mode)"""
+        completed = self.journal.completed(candidate=self.candidate_key)
+        pending = [job for job in job_listings if job_key(job) not in completed]
+        self.skipped_jobs = [job for job in job_listings if job_key(job) in completed]
+        if self.skipped_jobs:
+            job_agent_logger.info(f"Skipping {len(self.skipped_jobs)} jobs already completed in the journal")
+        return pending
+    
+    def open_apply_worker(self, worker_index):
+        """Scheduler worker: an agent with its own browser and log"""
+        worker = JobApplicationAgent(self.candidate_data, self.resume_path, self.config)
+        if worker_index == 0:
+            # The first worker reuses this agent's browser
+            worker.driver, worker.ready = self.driver, self.ready
+            return worker.apply_and_collect, None
+        
+        # Extra workers only start if a browser is free right now
+        worker.setup_driver(headless=True, pool=self.driver_pool, lease_timeout=0)
+        return worker.apply_and_collect, worker.close
+    
+    def apply_and_collect(self, job):
+        """Apply to one job; returns (success, log entries it produced)"""
+        start = len(self.applications_log)
+        started = time.perf_counter()
+        applied = self.apply_to_job(job)
+        readiness_timings.record('application', time.perf_counter() - started)
+        
+        entries = self.applications_log[start:]
+        del self.applications_log[start:]
+        return applied, entries
+    
+    def apply_to_jobs_batch(self, job_listings, delay=None, workers=None):
+        """Apply to multiple jobs, in parallel across different job sites"""
         delay = delay or self.config.DEFAULT_DELAY
         
-        successful = 0
-        failed = 0
+        # Never open a page for a posting this candidate already applied to
+        if self.skip_applied:
+            job_listings, applied = self.applied_index.filter_new(job_listings, self.candidate_key)
+            if applied:
+                job_agent_logger.info(f"Skipping {len(applied)} jobs already applied to")
+                self.skipped_jobs.extend(applied)
         
-        for i, job in enumerate(job_listings, 1):
-            job_agent_logger.info(f"Processing job {i}/{len(job_listings)}")
-            
-            if self.apply_to_job(job):
-                successful += 1
-            else:
-                failed += 1
-                self.applications_log.append({
+        scheduler = ApplyScheduler(
+            workers=workers or self.config.APPLY_WORKERS,
+            min_interval=delay,
+            max_per_host=self.config.MAX_PER_HOST
+        )
+        
+        progress = {'done': 0, 'successful': 0, 'failed': 0}
+        lock = threading.Lock()
+        
+        def on_result(index, job, result):
+            applied, entries = result or (False, [])
+            if not applied:
+                entries = entries + [{
                     **job,
                     'timestamp': datetime.now().isoformat(),
                     'status': 'failed',
                     'form_filled': False
-                })
+                }]
             
-            if i < len(job_listings):
-                time.sleep(delay)
+            with lock:
+                progress['done'] += 1
+                progress['successful' if applied else 'failed'] += 1
+                self.applications_log.extend(entries)
+                for entry in entries:
+                    self.journal.append(entry, candidate=self.candidate_key, session=self.session_id)
+                    if entry.get('status') in TERMINAL_STATUSES:
+                        self.applied_index.add(entry, candidate=self.candidate_key, status=entry['status'])
+                job_agent_logger.info(f"Processed job {progress['done']}/{len(job_listings)}: {job.get('title')}")
+                
+                self.emit('application', {
+                    'index': progress['done'],
+                    'total': len(job_listings),
+                    'successful': progress['successful'],
+                    'failed': progress['failed'],
+                    'application': entries[-1] if entries else job
+                })
         
+        scheduler.run(job_listings, self.open_apply_worker, on_result)
+        
+        successful, failed = progress['successful'], progress['failed']
         job_agent_logger.info(f"Batch complete: {successful} ready, {failed} failed")
         return successful, failed
     
     def save_log(self):
-        """Save application log"""
+        """Save application summary, compacted from this session's journal records"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = self.config.LOGS_DIR / f"applications_{timestamp}.json"
+        applications = self.journal.compact(session=self.session_id)
         
         with open(log_file, 'w') as f:
             json.dump({
                 'candidate': self.candidate_data,
-                'applications': self.applications_log,
+                'applications': applications,
                 'summary': {
-                    'total': len(self.applications_log),
-                    'ready': sum(1 for a in self.applications_log if a.get('status') == 'ready_to_submit'),
-                    'failed': sum(1 for a in self.applications_log if a.get('status') == 'failed')
+                    'total': len(applications),
+                    'ready': sum(1 for a in applications if a.get('status') == 'ready_to_submit'),
+                    'failed': sum(1 for a in applications if a.get('status') == 'failed'),
+                    'skipped': len(self.skipped_jobs)
                 }
             }, f, indent=2)
         
@@ -632,39 +725,68 @@ class JobApplicationAgent:
         return str(log_file)
     
     def close(self):
-        """Cleanup"""
-        if self.driver:
+        """Cleanup (pooled drivers go back to the pool instead of quitting)"""
+        self.journal.sync()
+        if not self.driver:
+            return
+        if self.driver_pool is not None:
+            self.driver_pool.release(self.driver)
+            job_agent_logger.info("WebDriver returned to pool")
+        else:
             self.driver.quit()
             job_agent_logger.info("WebDriver closed")
+        self.driver = None
 
 # ===================== UTILITIES ===========================
 def cleanResume(txt):
-    cleanText = re.sub(r'http\S+\s', ' ', txt)
+    cleanText = sub_before_last_word(r'http\S+\s', ' ', txt)
     cleanText = re.sub(r'RT|cc', ' ', cleanText)
-    cleanText = re.sub(r'#\S+\s', ' ', cleanText)
+    cleanText = sub_before_last_word(r'#\S+\s', ' ', cleanText)
     cleanText = re.sub(r'@\S+', ' ', cleanText)
     cleanText = re.sub(r'[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), ' ', cleanText)
     cleanText = re.sub(r'[^\x00-\x7f]', ' ', cleanText)
     cleanText = re.sub(r'\s+', ' ', cleanText)
     return cleanText.strip()
 
+# Sections are located once per resume (see common/section_segmenter.py);
+# extractors slice the text with the spans instead of searching it again
+SECTION_SEGMENTER = SectionSegmenter()
+
+# Extraction regexes, compiled once with hit/time counters (see common/pattern_bank.py)
+PATTERNS = PatternBank()
+
+def document(text):
+    """Resume text as a ParsedDocument: extractors share its cached views
+    (lines, sections, cleanResume output...) instead of re-deriving them"""
+    return as_document(text, SECTION_SEGMENTER)
 
 
 def pdf_to_text(file):
-    reader = PdfReader(file)
-    text = ''
-    for page in range(len(reader.pages)):
-        content = reader.pages[page].extract_text()
-        if content:
-            text += content + '\n'
-    return text
+    """Text of a PDF (path, bytes or file object), page-parallel when long (see common/pdf_text.py)"""
+    return pdf_extractor.extract(file)
 
 
 # ===================== MODEL PREDICTIONS ===========================
-def predict_category(resume_text):
-    resume_text = cleanResume(resume_text)
-    resume_tfidf = tfidf_vectorizer_categorization.transform([resume_text])
-    return rf_classifier_categorization.predict(resume_tfidf)[0]
+def predict_category(resume_text, model=None):
+    model = model or categorization_model.get()
+    return model.predict(document(resume_text).view(cleanResume))
+
+def categorize_batch(texts, top=3, model=None):
+    """Categories with probabilities for many resume or job texts at once.
+
+    Same cleaning and model as predict_category, but vectorized and predicted
+    ModelConfig.BATCH_CHUNK texts per call instead of one at a time.
+    """
+    model = model or categorization_model.get()
+    return model.categorize([document(text).view(cleanResume) for text in texts], top, ModelConfig.BATCH_CHUNK)
+
+
+def categorize_batch_payload(texts, top, model_name=None):
+    """categorize_batch for one chunk of an /api/categorize-batch request (runs in a parse worker).
+
+    Like parse_resume_payload, also returns the worker's pattern counters.
+    """
+    return categorize_batch(texts, top, categorization_model.get(model_name)), PATTERNS.drain()
 
 
 # ===================== PARSING HELPERS ===========================
@@ -677,11 +799,12 @@ def extract_name_from_resume(text):
     - resumes where the name line contains noise
     """
 
-    # Normalize lines
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
+    # Normalized lines
+    doc = document(text)
+    lines = doc.lines
 
     # Only look at first ~8 lines (where names usually are)
-    top = lines[:8]
+    top = doc.header
 
     # Remove lines that contain non-name stuff
     filtered = []
@@ -723,8 +846,21 @@ def extract_name_from_resume(text):
     # Strategy 4 — As last fallback, return first non-empty line
     return lines[0]
 
+EMAIL_PATTERN = PATTERNS.pattern(
+    'contact.email', r'\b[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b'
+)  # local part capped at its RFC limit: a long run without '@' was rescanned from each position
+PHONE_LABEL_PATTERN = PATTERNS.pattern('contact.phone_label', r'(phone|tel|mobile|contact)[:\s]*([+\d\(\)\-\s\.]{7,})', re.I)
+PHONE_PATTERNS = [
+    PATTERNS.pattern(f'contact.phone[{i}]', pat) for i, pat in enumerate([
+        r'(\+?\d{1,3}[-\s\.]?\(?\d{2,4}\)?[-\s\.]?\d{3,4}[-\s\.]?\d{3,4})',  # flexible groups
+        r'(\(?\d{3}\)?[-\s\.]?\d{3}[-\s\.]?\d{4})',  # (555) 345-6789 etc
+        r'(\b\d{10}\b)',  # 10-digit
+    ])
+]
+
 def extract_email_from_resume(text):
-    match = re.search(r'\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b', text)
+    text = document(text).text
+    match = EMAIL_PATTERN.search(text)
     return match.group().strip() if match else None
 
 def extract_contact_number_from_resume(text):
@@ -732,8 +868,9 @@ def extract_contact_number_from_resume(text):
        - Looks for lines with 'phone', 'tel', or common number formats
        - Returns cleaned version preserving country code if present
     """
+    text = document(text).text
     # Search for label-based phone first
-    phone_label = re.search(r'(phone|tel|mobile|contact)[:\s]*([+\d\(\)\-\s\.]{7,})', text, re.I)
+    phone_label = PHONE_LABEL_PATTERN.search(text)
     if phone_label:
         candidate = phone_label.group(2)
         digits = re.sub(r'\D', '', candidate)
@@ -742,13 +879,8 @@ def extract_contact_number_from_resume(text):
             return candidate.strip()
 
     # Generic patterns
-    patterns = [
-        r'(\+?\d{1,3}[-\s\.]?\(?\d{2,4}\)?[-\s\.]?\d{3,4}[-\s\.]?\d{3,4})',  # flexible groups
-        r'(\(?\d{3}\)?[-\s\.]?\d{3}[-\s\.]?\d{4})',  # (555) 345-6789 etc
-        r'(\b\d{10}\b)',  # 10-digit
-    ]
-    for pat in patterns:
-        m = re.search(pat, text)
+    for pat in PHONE_PATTERNS:
+        m = pat.search(text)
         if m:
             candidate = m.group(1)
             digits = re.sub(r'\D', '', candidate)
@@ -756,29 +888,6 @@ def extract_contact_number_from_resume(text):
                 return candidate.strip()
     return None
 
-def get_section_text(text, header_names, stop_headers=None, window_chars=1500):
-    if stop_headers is None:
-        stop_headers = ['experience','work experience','skills','projects','certifications','publications']
-
-    text_lower = text.lower()
-
-    for header in header_names:
-        idx = text_lower.find(header.lower())
-        if idx != -1:
-            start = idx + len(header)
-
-            # Find nearest stop header
-            stop_idx = len(text)
-            for sh in stop_headers:
-                sidx = text_lower.find(sh.lower(), start)
-                if sidx != -1 and sidx < stop_idx:
-                    stop_idx = sidx
-
-            return text[start:stop_idx].strip()
-
-    return None
-
-
 # Full skill list (kept intact/expanded). If you want to keep the original huge list, paste it here.
 FULL_SKILLS_LIST = [
         'Python', 'Data Analysis', 'Machine Learning', 'Communication', 'Project Management', 'Deep Learning', 'SQL',
@@ -888,32 +997,27 @@ FULL_SKILLS_LIST = [
     "Teamwork", "Clinical Procedures"
 ]
 
+SKILL_MATCHER = SkillMatcher(FULL_SKILLS_LIST)
+
 def extract_skills_from_resume(text, name=None):
     """
     Extract skills but ignore the top header where name/contact typically appears,
     and also remove any skills that accidentally match the candidate's name.
     """
-    lines = text.strip().split('\n')
-    # ignore top lines (first 6) to avoid name leaking in skills
-    body = '\n'.join(lines[6:]) if len(lines) > 6 else text
+    # the body skips the name/contact block: everything after the text above the
+    # first section heading, or all but the first 6 lines when there is no heading
+    # (see ParsedDocument.body); matched in a single pass (common/skill_matcher.py)
+    found = SKILL_MATCHER.find(document(text).body)
 
-    found = []
-    for skill in FULL_SKILLS_LIST:
-        # use word boundary match to reduce partial matches
-        if re.search(r'\b' + re.escape(skill) + r'\b', body, re.IGNORECASE):
-            found.append(skill)
+    # Final cleaning: unique, preserve original casing from list
+    return remove_name_skills([s for s in SKILL_MATCHER.skills if s in found], name)
 
-    # Remove any found that are part of the candidate name
+def remove_name_skills(skills, name):
+    """Remove any skills that are part of the candidate name"""
     if name:
         for token in name.split():
-            found = [s for s in found if token.lower() not in s.lower()]
-
-    # Final cleaning: unique, preserve original casing from list
-    unique_found = []
-    for s in FULL_SKILLS_LIST:
-        if s in found and s not in unique_found:
-            unique_found.append(s)
-    return unique_found
+            skills = [s for s in skills if token.lower() not in s.lower()]
+    return skills
 
 # ===================== EDUCATION EXTRACTION ===========================
 # Degree normalization map (regex pattern -> normalized label)
@@ -1045,57 +1149,53 @@ FIELD_KEYWORDS = [
 
 INSTITUTION_PATTERNS = [r'\bUniversity\b', r'\bInstitute\b', r'\bCollege\b', r'\bSchool\b', r'\bInstitute of\b', r'\bUniversity of\b']
 
-def clean_pdf_text(text):
-    text = unicodedata.normalize("NFKC", text)
-    text = text.replace("\xa0", " ").replace("\u200b", "")
-    text = re.sub(r"[ ]{2,}", " ", text)
-    return text.strip()
-# ----------------------------
-# Fuzzy header detection
-# ----------------------------
-def fuzzy_header_regex(header):
-    return r"\s*".join(list(header.strip()))
-
-def get_section_text(text, header_names, stop_headers=None, window_chars=900):
-    if stop_headers is None:
-        stop_headers = [
-            'experience', 'work experience', 'professional experience',
-            'skills', 'projects', 'certifications', 'achievements',
-            'publications', 'internships'
-        ]
-
-    text_clean = clean_pdf_text(text.lower())
-
-    # Try to locate header using fuzzy search
-    for header in header_names:
-        pattern = r"\b" + fuzzy_header_regex(header.lower()) + r"\b"
-        match = re.search(pattern, text_clean, re.I)
-        if match:
-            start = match.end()
-
-            stop_pos = len(text_clean)
-            for sh in stop_headers:
-                sh_pat = r"\b" + fuzzy_header_regex(sh.lower()) + r"\b"
-                m2 = re.search(sh_pat, text_clean[start:], re.I)
-                if m2:
-                    pos = start + m2.start()
-                    if pos < stop_pos:
-                        stop_pos = pos
-
-            slice_end = min(stop_pos, start + window_chars)
-            return text[start:slice_end]
+# Full institution names, most specific first. A name is group 1: each
+# pattern starts where a run of name characters does and skips its leading
+# digits and punctuation, since the leftmost "[A-Z]<name chars>{4,}College..."
+# always begins at the run's first letter. Tried from every letter instead, a
+# long run without the keyword took time quadratic in its length.
+_NAME_RUN_START = r"(?<![A-Za-z0-9&.,\-\s])[0-9&.,\-\s]*"
+INSTITUTION_NAME_PATTERNS = [
+    _NAME_RUN_START + r"([A-Z][A-Za-z0-9&\.,\-\s]{4,}College of [A-Za-z\s]+)",
+    _NAME_RUN_START + r"([A-Z][A-Za-z0-9&\.,\-\s]{4,}Institute of [A-Za-z\s]+)",
+    _NAME_RUN_START + r"([A-Z][A-Za-z0-9&\.,\-\s]{4,}University of [A-Za-z\s]+)",
+    _NAME_RUN_START + r"([A-Z][A-Za-z0-9&\.,\-\s]{4,}University\b)",
+    _NAME_RUN_START + r"([A-Z][A-Za-z0-9&\.,\-\s]{4,}College\b)",
+    _NAME_RUN_START + r"([A-Z][A-Za-z0-9&\.,\-\s]{4,}Institute\b)",
+    r"(IIT [A-Za-z]+)",
+    r"(NIT [A-Za-z]+)",
+    r"(BITS [A-Za-z]+)",
+]
 
-    return None
+# avoid picking "Technology" from "Bachelor of Technology"
+INVALID_FIELD_WORDS = ["technology"]
+
+# One scan per entry: the first listed degree/institution pattern found wins,
+# and the earliest listed field keyword present (see common/pattern_bank.py)
+DEGREE_MATCHER = PATTERNS.first_of(
+    'education.degree', DEGREE_PATTERNS.items(), re.I, guard=r'\b(?=[bmpd])'  # first letter of every degree
+)
+INSTITUTION_MATCHER = PATTERNS.first_of(
+    'education.institution', [(pat, None) for pat in INSTITUTION_NAME_PATTERNS], re.I,
+    guard=r'(?:(?<![a-z0-9&.,\-\s])|(?=(?:iit|nit|bits) ))'  # where a name run or an IIT/NIT/BITS starts
+)
+FIELD_MATCHER = PATTERNS.keywords(
+    'education.field', [fk for fk in FIELD_KEYWORDS if fk.lower() not in INVALID_FIELD_WORDS]
+)
+DEGREE_SPLIT_PATTERN = PATTERNS.pattern('education.degree_split', r'(?<!\w)(Bachelor|Master|B\.|M\.)', re.I)
+BROKEN_ML_PATTERN = PATTERNS.pattern('education.broken_ml', r"Machine\s+Le(?!arning)", re.I)
+BROKEN_AI_ML_PATTERN = PATTERNS.pattern(
+    'education.broken_ai_ml', r"Artificial\s+Intelligence\s*(?:(?:&|and)\s*)?Machine", re.I
+)
+FIELD_PATTERN = PATTERNS.pattern('education.field_phrase', r'\b(?:in|of)\s+([A-Za-z &\.\-\/]{2,60})', re.I)
+YEAR_PATTERN = PATTERNS.pattern('education.year', r'(19|20)\d{2}')
 
 # ----------------------------
 # Normalize Degree
 # ----------------------------
 def normalize_degree_from_text(s):
-    s_lower = s.lower()
-    for pat, label in DEGREE_PATTERNS.items():
-        if re.search(pat, s_lower, re.I):
-            return label
-    return None
+    hit = DEGREE_MATCHER.search(s)
+    return hit[0] if hit else None
 
 # ----------------------------
 # Extract Institution
@@ -1106,23 +1206,10 @@ def extract_institution(entry_clean):
     Works for long names, multi-word names, and names before OR after degree.
     """
 
-    patterns = [
-        r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}College of [A-Za-z\s]+",
-        r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}Institute of [A-Za-z\s]+",
-        r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}University of [A-Za-z\s]+",
-        r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}University\b",
-        r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}College\b",
-        r"[A-Z][A-Za-z0-9&\.,\-\s]{4,}Institute\b",
-        r"IIT [A-Za-z]+",
-        r"NIT [A-Za-z]+",
-        r"BITS [A-Za-z]+",
-    ]
-
     # First, search for full institution name patterns
-    for pat in patterns:
-        m = re.search(pat, entry_clean, re.I)
-        if m:
-            return m.group(0).strip(" ,.-")
+    hit = INSTITUTION_MATCHER.search(entry_clean)
+    if hit:
+        return hit[2][0].strip(" ,.-")
 
     # SECOND PASS → handle cases where the institution is BEFORE the degree block
     words = entry_clean.split()
@@ -1166,15 +1253,16 @@ def fix_broken_pdf_lines(text):
 # MAIN FUNCTION: extract_education_from_resume()
 # ----------------------------
 def extract_education_from_resume(text):
+    doc = document(text)
 
     # Get education section
-    section = get_section_text(text, ['education', 'educational qualification', 'academic qualification'])
+    section = doc.section('education', limit=900)
 
     if not section:
-        section = text
+        section = doc.text
 
     # Split into degree-based chunks
-    chunks = re.split(r'(?<!\w)(Bachelor|Master|B\.|M\.)', section, flags=re.I)
+    chunks = DEGREE_SPLIT_PATTERN.split(section)
     merged = []
     for i in range(1, len(chunks), 2):
         merged.append(chunks[i] + chunks[i+1])
@@ -1191,13 +1279,8 @@ def extract_education_from_resume(text):
         entry_clean = " ".join(entry.split())
 
         # -------- Fix broken PDF words --------
-        entry_clean = re.sub(r"Machine\s+Le(?!arning)", "Machine Learning", entry_clean, flags=re.I)
-        entry_clean = re.sub(
-            r"Artificial\s+Intelligence\s*(?:&|and)?\s*Machine",
-            "Artificial Intelligence and Machine",
-            entry_clean,
-            flags=re.I
-        )
+        entry_clean = BROKEN_ML_PATTERN.sub("Machine Learning", entry_clean)
+        entry_clean = BROKEN_AI_ML_PATTERN.sub("Artificial Intelligence and Machine", entry_clean)
 
         # -------- Detect degree --------
         degree = normalize_degree_from_text(entry_clean)
@@ -1205,22 +1288,19 @@ def extract_education_from_resume(text):
             continue
 
         # -------- Detect field --------
-        invalid_field_words = ["technology"]   # avoid picking "Technology" from "Bachelor of Technology"
         field = None
 
         # CASE 1 — explicit "in field"
-        m_field = re.search(r'\b(?:in|of)\s+([A-Za-z &\.\-\/]{2,60})', entry_clean, re.I)
+        m_field = FIELD_PATTERN.search(entry_clean)
         if m_field:
             field_candidate = m_field.group(1).strip(" ,.")
             field = field_candidate
 
         else:
-            # CASE 2 — match keywords
-            for fk in FIELD_KEYWORDS:
-                fk_low = fk.lower()
-                if fk_low in entry_clean.lower() and fk_low not in invalid_field_words:
-                    field = fk.title()
-                    break
+            # CASE 2 — match keywords (first listed one present, in one pass)
+            fk = FIELD_MATCHER.first(entry_clean)
+            if fk:
+                field = fk.title()
 
         # -------- Detect institution --------
         inst = extract_institution(entry_clean)
@@ -1235,7 +1315,7 @@ def extract_education_from_resume(text):
 
         # -------- Detect year --------
         year = None
-        y = re.search(r'(19|20)\d{2}', entry_clean)
+        y = YEAR_PATTERN.search(entry_clean)
         if y:
             year = y.group()
 
@@ -1256,8 +1336,82 @@ def extract_education_from_resume(text):
 
     return results if results else None
 
+# ===================== CACHED RESUME PARSING ===========================
+def parse_resume_payload(kind, data, model_name=None):
+    """Extract text and candidate data from resume bytes (runs in a parse worker).
+
+    model_name is the model version the server had active at submission, so a
+    worker that has not seen a hot swap yet switches before predicting.
+    Also returns the worker's pattern counters since its last job, for the
+    server to merge into its own (see /api/patterns/stats).
+    """
+    model = categorization_model.get(model_name)
+    if kind == 'pdf':
+        text = pdf_to_text(data)
+    else:
+        text = data.decode('utf-8')
+
+    doc = document(text)  # one set of derived views for every extractor
+    candidate_data = {
+        'name': extract_name_from_resume(doc),
+        'email': extract_email_from_resume(doc),
+        'phone': extract_contact_number_from_resume(doc),
+        'category': predict_category(doc, model),
+        'skills': extract_skills_from_resume(doc),
+        'education': extract_education_from_resume(doc)
+    }
+    return text, candidate_data, PATTERNS.drain()
+
+async def parse_resume_bytes(filename, data):
+    """
+    Extract text and candidate data from an uploaded resume.
+    Results are cached by content hash, so repeat uploads skip all parsing;
+    misses are parsed in the worker pool (raises PoolFullError when saturated).
+    Returns (text, candidate_data), or None for unsupported file types.
+    """
+    kind = filename.lower().rsplit('.', 1)[-1]
+    if kind not in ('pdf', 'txt'):
+        return None
+
+    model_name = categorization_model.active
+    key = parse_cache.key(data, f"{kind}:{categorization_model.version_of(model_name)}")
+    cached = parse_cache.get(key)
+    if cached is not None:
+        return cached['text'], cached['candidate']
+
+    text, candidate_data, pattern_counters = await parse_pool.run(parse_resume_payload, kind, data, model_name)
+    PATTERNS.merge(pattern_counters)
+    parse_cache.put(key, {'text': text, 'candidate': candidate_data})
+    return text, candidate_data
+
 # ===================== FASTAPI ROUTES ===========================
 
+@app.exception_handler(PoolFullError)
+async def parse_pool_full_handler(request: Request, exc: PoolFullError):
+    return JSONResponse(
+        {"error": "Server is busy parsing other resumes, please retry shortly"},
+        status_code=503,
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+@app.exception_handler(ModelLoadError)
+async def model_load_error_handler(request: Request, exc: ModelLoadError):
+    job_agent_logger.error(f"Categorization model unavailable: {exc}")
+    return JSONResponse({"error": "Categorization model is unavailable"}, status_code=503)
+
+@app.on_event("startup")
+async def warmup_model():
+    if ModelConfig.WARMUP:
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, categorization_model.warmup)
+        except ModelLoadError as e:
+            job_agent_logger.error(f"Model warmup failed: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_parse_pool():
+    parse_pool.shutdown()
+    pdf_extractor.shutdown()
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     return templates.TemplateResponse("resumes.html", {"request": request})
@@ -1265,65 +1419,208 @@ async def home(request: Request):
 
 @app.post("/pred", response_class=HTMLResponse)
 async def pred(request: Request, resume: UploadFile = File(...)):
-    filename = resume.filename
-
-    if filename.lower().endswith(".pdf"):
-        text = pdf_to_text(resume.file)
-    elif filename.lower().endswith(".txt"):
-        text = (await resume.read()).decode("utf-8")
-    else:
+    parsed = await parse_resume_bytes(resume.filename, await resume.read())
+    if parsed is None:
         return templates.TemplateResponse("resumes.html", {
             "request": request,
             "message": "Invalid file format. Please upload PDF or TXT."
         })
-
-    predicted_category = predict_category(text)
-
-    name = extract_name_from_resume(text)
-    email = extract_email_from_resume(text)
-    phone = extract_contact_number_from_resume(text)
-    extracted_education = extract_education_from_resume(text)
-    extracted_skills = extract_skills_from_resume(text, name=name)
+    text, candidate_data = parsed
 
     return templates.TemplateResponse("resumes.html", {
         "request": request,
-        "predicted_category": predicted_category,
-        "name": name,
-        "email": email,
-        "phone": phone,
-        "extracted_skills": extracted_skills,
-        "extracted_education": extracted_education
+        "predicted_category": candidate_data['category'],
+        "name": candidate_data['name'],
+        "email": candidate_data['email'],
+        "phone": candidate_data['phone'],
+        "extracted_skills": remove_name_skills(candidate_data['skills'], candidate_data['name']),
+        "extracted_education": candidate_data['education']
     })
 
 
 @app.post("/api/parse")
 async def api_parse(resume: UploadFile = File(...)):
-    filename = resume.filename
-
-    if filename.lower().endswith(".pdf"):
-        text = pdf_to_text(resume.file)
-    elif filename.lower().endswith(".txt"):
-        text = (await resume.read()).decode("utf-8")
-    else:
+    parsed = await parse_resume_bytes(resume.filename, await resume.read())
+    if parsed is None:
         return JSONResponse({"error": "Invalid file format. Upload PDF or TXT."})
+    text, candidate_data = parsed
 
-    predicted_category = predict_category(text)
-
-    name = extract_name_from_resume(text)
-    email = extract_email_from_resume(text)
-    phone = extract_contact_number_from_resume(text)
-    extracted_education = extract_education_from_resume(text)
-    extracted_skills = extract_skills_from_resume(text, name=name)
+    return {
+        "name": candidate_data['name'],
+        "email": candidate_data['email'],
+        "phone": candidate_data['phone'],
+        "category": candidate_data['category'],
+        "skills": remove_name_skills(candidate_data['skills'], candidate_data['name']),
+        "education": candidate_data['education']
+    }
 
+@app.post("/api/categorize-batch")
+async def api_categorize_batch(request: Request):
+    """Body: {"texts": [...], "top": 3}. Returns one category per text, in order."""
+    try:
+        payload = await request.json()
+    except ValueError:
+        return JSONResponse({"error": "Expected a JSON body"}, status_code=400)
+    texts = payload.get('texts') if isinstance(payload, dict) else None
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return JSONResponse({"error": "'texts' must be a list of strings"}, status_code=400)
+    if len(texts) > ModelConfig.BATCH_MAX_TEXTS:
+        return JSONResponse(
+            {"error": f"At most {ModelConfig.BATCH_MAX_TEXTS} texts per request"}, status_code=413
+        )
+    try:
+        top = int(payload.get('top', 3))
+    except (TypeError, ValueError):
+        return JSONResponse({"error": "'top' must be an integer"}, status_code=400)
+
+    started = time.perf_counter()
+    model_name = categorization_model.active
+    # Chunks go through the parse pool like uploads do, so a saturated pool
+    # answers 503 and the model stays out of the server process; big batches
+    # are split across the workers
+    size = max(ModelConfig.BATCH_CHUNK, math.ceil(len(texts) / parse_pool.workers))
+    chunks = [
+        asyncio.ensure_future(parse_pool.run(categorize_batch_payload, texts[start:start + size], top, model_name))
+        for start in range(0, len(texts), size)
+    ]
+    try:
+        done = await asyncio.gather(*chunks)
+    except BaseException:
+        for chunk in chunks:  # one chunk was turned away: don't leave the rest queued
+            chunk.cancel()
+        raise
+    results = []
+    for chunk_results, pattern_counters in done:
+        results.extend(chunk_results)
+        PATTERNS.merge(pattern_counters)
+    took = time.perf_counter() - started
     return {
-        "name": name,
-        "email": email,
-        "phone": phone,
-        "category": predicted_category,
-        "skills": extracted_skills,
-        "education": extracted_education
+        "model": categorization_model.version_of(model_name),
+        "count": len(results),
+        "results": results,
+        "took_ms": round(took * 1000, 1),
+        "docs_per_sec": round(len(results) / took) if took and results else None,
     }
 
+
+# ===================== JOB AGENT RUNS ==========================
+# Search/apply sessions run here, off the event loop, so requests return immediately
+
+def search_platforms(agent, job_title, location, num_jobs, platforms):
+    """Search every requested platform with an already set-up agent"""
+    all_jobs = []
+    platform_list = [p.strip().lower() for p in platforms.split(',')]
+    
+    if 'indeed' in platform_list:
+        indeed_jobs = agent.search_jobs_indeed(job_title, location, num_jobs)
+        all_jobs.extend(indeed_jobs)
+    
+    if 'linkedin' in platform_list:
+        linkedin_jobs = agent.search_jobs_linkedin(job_title, location, num_jobs)
+        all_jobs.extend(linkedin_jobs)
+    
+    return all_jobs
+
+def run_search_jobs(candidate_data, resume_path, job_title, location, num_jobs, platforms):
+    """Search for jobs in a fresh browser session"""
+    agent = JobApplicationAgent(candidate_data, resume_path)
+    agent.setup_driver(headless=True, pool=driver_pool)
+    try:
+        jobs = search_platforms(agent, job_title or candidate_data.get('category'), location, num_jobs, platforms)
+        return jobs, agent.parse_stats
+    finally:
+        agent.close()
+
+def run_apply_jobs(run, candidate_data, resume_path, job_listings, delay, skip_completed=True):
+    """Background run: apply to the given job listings"""
+    agent = JobApplicationAgent(candidate_data, resume_path, on_event=run.emit, skip_applied=skip_completed)
+    agent.setup_driver(headless=True, pool=driver_pool)
+    
+    try:
+        if skip_completed:
+            job_listings = agent.skip_completed(job_listings)
+        successful, failed = agent.apply_to_jobs_batch(job_listings, delay)
+        log_file = agent.save_log()
+        
+        return {
+            "candidate": candidate_data,
+            "total_applications": len(job_listings),
+            "successful": successful,
+            "failed": failed,
+            "skipped": len(agent.skipped_jobs),
+            "log_file": log_file,
+            "applications": agent.applications_log
+        }
+    
+    finally:
+        agent.close()
+
+def run_auto_apply(run, candidate_data, resume_path, job_title, location, num_jobs, platforms, delay,
+                   skip_completed=True):
+    """Background run: search for jobs, then apply to the first num_jobs"""
+    agent = JobApplicationAgent(candidate_data, resume_path, on_event=run.emit, skip_applied=skip_completed)
+    agent.setup_driver(headless=True, pool=driver_pool)
+    
+    try:
+        job_title_search = job_title or candidate_data.get('category')
+        all_jobs = search_platforms(agent, job_title_search, location, num_jobs, platforms)
+        run.emit('search', {'jobs_found': len(all_jobs), 'jobs': all_jobs, 'parse_stats': agent.parse_stats})
+        
+        if not all_jobs:
+            raise ValueError("No jobs found")
+        
+        # Apply to jobs (skipping ones a previous run already finished)
+        pending = agent.skip_completed(all_jobs) if skip_completed else all_jobs
+        successful, failed = agent.apply_to_jobs_batch(pending[:num_jobs], delay)
+        log_file = agent.save_log()
+        
+        return {
+            "candidate": candidate_data,
+            "jobs_found": len(all_jobs),
+            "total_applications": len(pending[:num_jobs]),
+            "successful": successful,
+            "failed": failed,
+            "skipped": len(agent.skipped_jobs),
+            "log_file": log_file,
+            "applications": agent.applications_log
+        }
+    
+    finally:
+        agent.close()
+
+def save_uploaded_resume(resume_bytes):
+    """Store the uploaded resume where the agent can attach it to applications"""
+    resume_filename = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    resume_path = JobAgentConfig.RESUME_STORAGE / resume_filename
+    
+    with open(resume_path, 'wb') as f:
+        f.write(resume_bytes)
+    
+    return resume_filename, resume_path
+
+def accepted_run(run, candidate_data):
+    """202 response pointing the client at the run's status and event stream"""
+    return JSONResponse({
+        "job_id": run.id,
+        "status": run.status,
+        "status_url": f"/api/agent-jobs/{run.id}",
+        "events_url": f"/api/agent-jobs/{run.id}/events",
+        "candidate": candidate_data
+    }, status_code=202)
+
+@app.on_event("startup")
+async def prewarm_driver_pool():
+    if JobAgentConfig.DRIVER_PREWARM > 0:
+        # Chrome startup is slow and blocking; warm up in the background
+        asyncio.get_running_loop().run_in_executor(None, driver_pool.prewarm, JobAgentConfig.DRIVER_PREWARM)
+
+@app.on_event("shutdown")
+async def shutdown_agent_runs():
+    agent_runs.shutdown()
+    driver_pool.close()
+    application_journal.close()
+    applied_index.close()
+
 # ===================== JOB AGENT API ENDPOINTS ==========================
 
 @app.post("/api/search-jobs")
@@ -1336,61 +1633,31 @@ async def search_jobs(
 ):
     """Search for jobs based on resume"""
     try:
-        # Parse resume
-        filename = resume.filename
-        if filename.lower().endswith(".pdf"):
-            text = pdf_to_text(resume.file)
-        elif filename.lower().endswith(".txt"):
-            text = (await resume.read()).decode("utf-8")
-        else:
+        # Parse resume (cached by content hash)
+        resume_bytes = await resume.read()
+        parsed = await parse_resume_bytes(resume.filename, resume_bytes)
+        if parsed is None:
             return JSONResponse({"error": "Invalid file format"}, status_code=400)
-        
-        # Extract candidate data
-        candidate_data = {
-            'name': extract_name_from_resume(text),
-            'email': extract_email_from_resume(text),
-            'phone': extract_contact_number_from_resume(text),
-            'category': predict_category(text),
-            'skills': extract_skills_from_resume(text),
-            'education': extract_education_from_resume(text)
-        }
+        text, candidate_data = parsed
         
         # Save resume temporarily
-        resume_filename = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        resume_path = JobAgentConfig.RESUME_STORAGE / resume_filename
-        
-        with open(resume_path, 'wb') as f:
-            await resume.seek(0)
-            f.write(await resume.read())
+        resume_filename, resume_path = save_uploaded_resume(resume_bytes)
         
-        # Initialize agent
-        agent = JobApplicationAgent(candidate_data, resume_path)
-        agent.setup_driver(headless=True)
+        # Browser work is blocking; keep it off the event loop
+        all_jobs, parse_stats = await asyncio.to_thread(
+            run_search_jobs, candidate_data, resume_path, job_title, location, num_jobs, platforms
+        )
         
-        try:
-            job_title_search = job_title or candidate_data.get('category')
-            all_jobs = []
-            
-            platform_list = [p.strip().lower() for p in platforms.split(',')]
-            
-            if 'indeed' in platform_list:
-                indeed_jobs = agent.search_jobs_indeed(job_title_search, location, num_jobs)
-                all_jobs.extend(indeed_jobs)
-            
-            if 'linkedin' in platform_list:
-                linkedin_jobs = agent.search_jobs_linkedin(job_title_search, location, num_jobs)
-                all_jobs.extend(linkedin_jobs)
-            
-            return {
-                "candidate": candidate_data,
-                "jobs_found": len(all_jobs),
-                "jobs": all_jobs,
-                "resume_id": resume_filename
-            }
-            
-        finally:
-            agent.close()
+        return {
+            "candidate": candidate_data,
+            "jobs_found": len(all_jobs),
+            "jobs": all_jobs,
+            "parse_stats": parse_stats,
+            "resume_id": resume_filename
+        }
             
+    except PoolFullError:
+        raise
     except Exception as e:
         job_agent_logger.error(f"Error searching jobs: {str(e)}")
         return JSONResponse({"error": str(e)}, status_code=500)
@@ -1398,41 +1665,21 @@ async def search_jobs(
 
 @app.post("/api/apply-jobs")
 async def apply_jobs(
-    background_tasks: BackgroundTasks,
     resume: UploadFile = File(...),
     job_urls: str = Form(...),  # Comma-separated URLs
     job_title: Optional[str] = Form(None),
     location: Optional[str] = Form("United States"),
-    delay: int = Form(10)
+    delay: int = Form(10),
+    skip_completed: bool = Form(True)  # resume: skip jobs already finished in the journal
 ):
-    """Apply to specific jobs"""
+    """Start applying to specific jobs; returns a job ID to follow progress"""
     try:
-        # Parse resume
-        filename = resume.filename
-        if filename.lower().endswith(".pdf"):
-            text = pdf_to_text(resume.file)
-        elif filename.lower().endswith(".txt"):
-            text = (await resume.read()).decode("utf-8")
-        else:
+        # Parse resume (cached by content hash)
+        resume_bytes = await resume.read()
+        parsed = await parse_resume_bytes(resume.filename, resume_bytes)
+        if parsed is None:
             return JSONResponse({"error": "Invalid file format"}, status_code=400)
-        
-        # Extract candidate data
-        candidate_data = {
-            'name': extract_name_from_resume(text),
-            'email': extract_email_from_resume(text),
-            'phone': extract_contact_number_from_resume(text),
-            'category': predict_category(text),
-            'skills': extract_skills_from_resume(text),
-            'education': extract_education_from_resume(text)
-        }
-        
-        # Save resume
-        resume_filename = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        resume_path = JobAgentConfig.RESUME_STORAGE / resume_filename
-        
-        with open(resume_path, 'wb') as f:
-            await resume.seek(0)
-            f.write(await resume.read())
+        text, candidate_data = parsed
         
         # Parse job URLs
         urls = [url.strip() for url in job_urls.split(',') if url.strip()]
@@ -1440,6 +1687,9 @@ async def apply_jobs(
         if not urls:
             return JSONResponse({"error": "No job URLs provided"}, status_code=400)
         
+        # Save resume
+        resume_filename, resume_path = save_uploaded_resume(resume_bytes)
+        
         # Create job listings
         job_listings = []
         for url in urls:
@@ -1451,26 +1701,14 @@ async def apply_jobs(
                 'platform': 'custom'
             })
         
-        # Initialize agent
-        agent = JobApplicationAgent(candidate_data, resume_path)
-        agent.setup_driver(headless=True)
-        
-        try:
-            successful, failed = agent.apply_to_jobs_batch(job_listings, delay)
-            log_file = agent.save_log()
-            
-            return {
-                "candidate": candidate_data,
-                "total_applications": len(job_listings),
-                "successful": successful,
-                "failed": failed,
-                "log_file": log_file,
-                "applications": agent.applications_log
-            }
-            
-        finally:
-            agent.close()
+        run = agent_runs.submit(
+            'apply-jobs', run_apply_jobs, candidate_data, resume_path, job_listings, delay, skip_completed,
+            meta={'total_applications': len(job_listings), 'resume_id': resume_filename}
+        )
+        return accepted_run(run, candidate_data)
             
+    except PoolFullError:
+        raise
     except Exception as e:
         job_agent_logger.error(f"Error applying to jobs: {str(e)}")
         return JSONResponse({"error": str(e)}, status_code=500)
@@ -1478,85 +1716,65 @@ async def apply_jobs(
 
 @app.post("/api/auto-apply")
 async def auto_apply(
-    background_tasks: BackgroundTasks,
     resume: UploadFile = File(...),
     job_title: Optional[str] = Form(None),
     location: Optional[str] = Form("United States"),
     num_jobs: int = Form(5),
     platforms: str = Form("indeed"),
-    delay: int = Form(10)
+    delay: int = Form(10),
+    skip_completed: bool = Form(True)  # resume: skip jobs already finished in the journal
 ):
-    """Search and apply to jobs automatically"""
+    """Start searching and applying to jobs automatically; returns a job ID to follow progress"""
     try:
-        # Parse resume
-        filename = resume.filename
-        if filename.lower().endswith(".pdf"):
-            text = pdf_to_text(resume.file)
-        elif filename.lower().endswith(".txt"):
-            text = (await resume.read()).decode("utf-8")
-        else:
+        # Parse resume (cached by content hash)
+        resume_bytes = await resume.read()
+        parsed = await parse_resume_bytes(resume.filename, resume_bytes)
+        if parsed is None:
             return JSONResponse({"error": "Invalid file format"}, status_code=400)
-        
-        # Extract candidate data
-        candidate_data = {
-            'name': extract_name_from_resume(text),
-            'email': extract_email_from_resume(text),
-            'phone': extract_contact_number_from_resume(text),
-            'category': predict_category(text),
-            'skills': extract_skills_from_resume(text),
-            'education': extract_education_from_resume(text)
-        }
+        text, candidate_data = parsed
 
-        resume_filename = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        resume_path = JobAgentConfig.RESUME_STORAGE / resume_filename
-        
-        with open(resume_path, 'wb') as f:
-            await resume.seek(0)
-            f.write(await resume.read())
-        
-        # Initialize agent
-        agent = JobApplicationAgent(candidate_data, resume_path)
-        agent.setup_driver(headless=True)
+        resume_filename, resume_path = save_uploaded_resume(resume_bytes)
         
-        try:
-            job_title_search = job_title or candidate_data.get('category')
-            all_jobs = []
-            
-            platform_list = [p.strip().lower() for p in platforms.split(',')]
-            
-            if 'indeed' in platform_list:
-                indeed_jobs = agent.search_jobs_indeed(job_title_search, location, num_jobs)
-                all_jobs.extend(indeed_jobs)
-            
-            if 'linkedin' in platform_list:
-                linkedin_jobs = agent.search_jobs_linkedin(job_title_search, location, num_jobs)
-                all_jobs.extend(linkedin_jobs)
-            
-            if not all_jobs:
-                return JSONResponse({"error": "No jobs found"}, status_code=404)
-            
-            # Apply to jobs
-            successful, failed = agent.apply_to_jobs_batch(all_jobs[:num_jobs], delay)
-            log_file = agent.save_log()
-            
-            return {
-                "candidate": candidate_data,
-                "jobs_found": len(all_jobs),
-                "total_applications": len(all_jobs[:num_jobs]),
-                "successful": successful,
-                "failed": failed,
-                "log_file": log_file,
-                "applications": agent.applications_log
-            }
-            
-        finally:
-            agent.close()
+        run = agent_runs.submit(
+            'auto-apply', run_auto_apply, candidate_data, resume_path,
+            job_title, location, num_jobs, platforms, delay, skip_completed,
+            meta={'num_jobs': num_jobs, 'platforms': platforms, 'resume_id': resume_filename}
+        )
+        return accepted_run(run, candidate_data)
             
+    except PoolFullError:
+        raise
     except Exception as e:
         job_agent_logger.error(f"Error in auto-apply: {str(e)}")
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
+@app.get("/api/agent-jobs/{job_id}")
+async def get_agent_job(job_id: str, events: bool = True):
+    """Status, result and event history of a background run"""
+    run = agent_runs.get(job_id)
+    if run is None:
+        return JSONResponse({"error": "Job not found"}, status_code=404)
+    return run.snapshot(include_events=events)
+
+
+@app.get("/api/agent-jobs/{job_id}/events")
+async def stream_agent_job_events(request: Request, job_id: str):
+    """Server-Sent Events stream of a run's progress (honours Last-Event-ID)"""
+    run = agent_runs.get(job_id)
+    if run is None:
+        return JSONResponse({"error": "Job not found"}, status_code=404)
+    
+    last_event_id = request.headers.get('last-event-id', '0')
+    after = int(last_event_id) if last_event_id.isdigit() else 0
+    
+    return StreamingResponse(
+        agent_runs.stream(run, after=after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/api/application-logs")
 async def get_application_logs():
     """Get list of all application logs"""
@@ -1598,6 +1816,51 @@ async def get_application_log_detail(log_filename: str):
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
     
+@app.get("/api/parse-cache/stats")
+async def get_parse_cache_stats():
+    """Parse cache size and hit/miss counters"""
+    return parse_cache.stats()
+
+@app.get("/api/parse-pool/stats")
+async def get_parse_pool_stats():
+    """Parse pool queue depth, wait time and service time"""
+    return parse_pool.stats()
+
+@app.get("/api/applied-index/stats")
+async def get_applied_index_stats():
+    """Size and Bloom filter effectiveness of the applied-job index"""
+    return applied_index.stats()
+
+@app.get("/api/readiness/stats")
+async def get_readiness_stats():
+    """Time spent in each page readiness wait and per application"""
+    return readiness_timings.summary()
+
+@app.get("/api/models/categorization")
+async def get_categorization_model():
+    """Active categorization model, its load time and the versions available"""
+    return categorization_model.stats()
+
+@app.post("/api/models/categorization/swap")
+async def swap_categorization_model(version: str = Form("")):
+    """Load and validate model/versions/<version> (empty = model/) and make it active"""
+    try:
+        # Unpickling is slow and blocking; requests keep using the live model meanwhile
+        model = await asyncio.get_running_loop().run_in_executor(None, categorization_model.swap, version or None)
+    except ModelLoadError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return {"active": model.describe(), "swaps": categorization_model.swaps}
+
+@app.get("/api/patterns/stats")
+async def get_pattern_stats():
+    """Calls, hits and time spent per extraction pattern, slowest first"""
+    return PATTERNS.stats()
+
+@app.get("/api/driver-pool/stats")
+async def get_driver_pool_stats():
+    """WebDriver pool hit rate and lease latency"""
+    return driver_pool.stats()
+
 @app.get("/job-agent", response_class=HTMLResponse)
 async def job_agent_interface(request: Request):
     """Job agent web interface"""
@@ -1,12 +1,23 @@
 from flask import Flask, request, render_template
-from PyPDF2 import PdfReader
+import os
+import time
 import re
-import pickle
 import nltk
 from nltk import word_tokenize, pos_tag, ne_chunk
 from nltk.tree import Tree
 
 from flask import jsonify
+import sys
+from pathlib import Path
+
+# Shared engines live in the repository-level `common` package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.skill_matcher import SkillMatcher
+from common.model_registry import ModelRegistry, ModelLoadError
+from common.section_segmenter import SectionSegmenter
+from common.parsed_document import as_document
+from common.pattern_bank import PatternBank, sub_before_last_word
+from common.pdf_text import PdfTextExtractor
 
 # If running first time, uncomment and run these once:
 # nltk.download('punkt')
@@ -16,43 +27,61 @@ from flask import jsonify
 
 app = Flask(__name__)
 
-# ===================== MODEL LOAD ==========================
-rf_classifier_categorization = pickle.load(open('model/rf_classifier_categorization.pkl', 'rb'))
-tfidf_vectorizer_categorization = pickle.load(open('model/tfidf_vectorizer_categorization.pkl', 'rb'))
+# ===================== MODEL REGISTRY ==========================
+# Loaded on first prediction and hot-swappable; see common/model_registry.py
+categorization_model = ModelRegistry(
+    Path(__file__).parent / "model", os.getenv('CATEGORIZATION_MODEL_VERSION') or None
+)
+BATCH_CHUNK = int(os.getenv('CATEGORIZE_BATCH_CHUNK', '256'))
+BATCH_MAX_TEXTS = int(os.getenv('CATEGORIZE_BATCH_MAX', '10000'))
+
+# ===================== PDF TEXT ==========================
+# Long PDFs are split by page range across worker processes; see common/pdf_text.py
+pdf_extractor = PdfTextExtractor(
+    workers=int(os.getenv('PDF_WORKERS', min(4, os.cpu_count() or 1))),
+    page_timeout=float(os.getenv('PDF_PAGE_TIMEOUT', '30')),
+    min_parallel_pages=int(os.getenv('PDF_MIN_PARALLEL_PAGES', '4')),
+)
 
 # ===================== UTILITIES ===========================
 def cleanResume(txt):
     """Clean resume text for model and parsing"""
-    cleanText = re.sub('http\S+\s', ' ', txt)
+    cleanText = sub_before_last_word(r'http\S+\s', ' ', txt)
     cleanText = re.sub('RT|cc', ' ', cleanText)
-    cleanText = re.sub('#\S+\s', ' ', cleanText)
+    cleanText = sub_before_last_word(r'#\S+\s', ' ', cleanText)
     cleanText = re.sub('@\S+', ' ', cleanText)
     cleanText = re.sub('[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), ' ', cleanText)
     cleanText = re.sub(r'[^\x00-\x7f]', ' ', cleanText)
     cleanText = re.sub('\s+', ' ', cleanText)
     return cleanText.strip()
 
+# Sections are located once per resume (see common/section_segmenter.py)
+SECTION_SEGMENTER = SectionSegmenter()
+
+# Extraction regexes, compiled once with hit/time counters (see common/pattern_bank.py)
+PATTERNS = PatternBank()
+
+def document(text):
+    """Resume text as a ParsedDocument whose derived views extractors share"""
+    return as_document(text, SECTION_SEGMENTER)
+
 def pdf_to_text(file):
     """Extract text from PDF (preserves line breaks where possible)"""
-    reader = PdfReader(file)
-    text = ''
-    for page in range(len(reader.pages)):
-        content = reader.pages[page].extract_text()
-        if content:
-            text += content + '\n'
-    return text
+    return pdf_extractor.extract(file)
 
 # ===================== MODEL PREDICTIONS ===========================
 def predict_category(resume_text):
-    resume_text = cleanResume(resume_text)
-    resume_tfidf = tfidf_vectorizer_categorization.transform([resume_text])
-    return rf_classifier_categorization.predict(resume_tfidf)[0]
+    return categorization_model.get().predict(document(resume_text).view(cleanResume))
+
+def categorize_batch(texts, top=3):
+    """Categories with probabilities for many texts, predicted in chunks"""
+    model = categorization_model.get()
+    return model.categorize([document(text).view(cleanResume) for text in texts], top, BATCH_CHUNK)
 
 # ===================== PARSING HELPERS ===========================
 def extract_name_from_resume(text):
     """Extract candidate name using NER and regex fallback"""
-    lines = text.strip().split('\n')
-    lines = [l.strip() for l in lines if l.strip()]
+    lines = document(text).lines
     top_section = ' '.join(lines[:6])
     try:
         tokens = word_tokenize(top_section)
@@ -82,8 +111,21 @@ def extract_name_from_resume(text):
             return match.group().strip()
     return None
 
+EMAIL_PATTERN = PATTERNS.pattern(
+    'contact.email', r'\b[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b'
+)  # local part capped at its RFC limit: a long run without '@' was rescanned from each position
+PHONE_LABEL_PATTERN = PATTERNS.pattern('contact.phone_label', r'(phone|tel|mobile|contact)[:\s]*([+\d\(\)\-\s\.]{7,})', re.I)
+PHONE_PATTERNS = [
+    PATTERNS.pattern(f'contact.phone[{i}]', pat) for i, pat in enumerate([
+        r'(\+?\d{1,3}[-\s\.]?\(?\d{2,4}\)?[-\s\.]?\d{3,4}[-\s\.]?\d{3,4})',  # flexible groups
+        r'(\(?\d{3}\)?[-\s\.]?\d{3}[-\s\.]?\d{4})',  # (555) 345-6789 etc
+        r'(\b\d{10}\b)',  # 10-digit
+    ])
+]
+
 def extract_email_from_resume(text):
-    match = re.search(r'\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b', text)
+    text = document(text).text
+    match = EMAIL_PATTERN.search(text)
     return match.group().strip() if match else None
 
 def extract_contact_number_from_resume(text):
@@ -91,8 +133,9 @@ def extract_contact_number_from_resume(text):
        - Looks for lines with 'phone', 'tel', or common number formats
        - Returns cleaned version preserving country code if present
     """
+    text = document(text).text
     # Search for label-based phone first
-    phone_label = re.search(r'(phone|tel|mobile|contact)[:\s]*([+\d\(\)\-\s\.]{7,})', text, re.I)
+    phone_label = PHONE_LABEL_PATTERN.search(text)
     if phone_label:
         candidate = phone_label.group(2)
         digits = re.sub(r'\D', '', candidate)
@@ -101,13 +144,8 @@ def extract_contact_number_from_resume(text):
             return candidate.strip()
 
     # Generic patterns
-    patterns = [
-        r'(\+?\d{1,3}[-\s\.]?\(?\d{2,4}\)?[-\s\.]?\d{3,4}[-\s\.]?\d{3,4})',  # flexible groups
-        r'(\(?\d{3}\)?[-\s\.]?\d{3}[-\s\.]?\d{4})',  # (555) 345-6789 etc
-        r'(\b\d{10}\b)',  # 10-digit
-    ]
-    for pat in patterns:
-        m = re.search(pat, text)
+    for pat in PHONE_PATTERNS:
+        m = pat.search(text)
         if m:
             candidate = m.group(1)
             digits = re.sub(r'\D', '', candidate)
@@ -115,31 +153,6 @@ def extract_contact_number_from_resume(text):
                 return candidate.strip()
     return None
 
-def get_section_text(text, header_names, stop_headers=None, window_chars=800):
-    """
-    Return text following the first occurrence of any header_name (case-insensitive),
-    up to a stop header or a maximum window.
-    """
-    if stop_headers is None:
-        stop_headers = ['experience', 'professional experience', 'work experience', 'skills', 'certifications', 'projects', 'objective', 'summary']
-
-    lower = text.lower()
-    for header in header_names:
-        idx = lower.find(header.lower())
-        if idx != -1:
-            # start after the header word
-            start = idx + len(header)
-            # find nearest stop header after start
-            stop_idx = len(text)
-            for s in stop_headers:
-                sidx = lower.find(s.lower(), start)
-                if sidx != -1 and sidx < stop_idx:
-                    stop_idx = sidx
-            # slice a safe window
-            slice_end = min(stop_idx, start + window_chars)
-            return text[start:slice_end].strip()
-    return None
-
 # Full skill list (kept intact/expanded). If you want to keep the original huge list, paste it here.
 FULL_SKILLS_LIST = [
         'Python', 'Data Analysis', 'Machine Learning', 'Communication', 'Project Management', 'Deep Learning', 'SQL',
@@ -249,32 +262,24 @@ FULL_SKILLS_LIST = [
     "Teamwork", "Clinical Procedures"
 ]
 
+SKILL_MATCHER = SkillMatcher(FULL_SKILLS_LIST)
+
 def extract_skills_from_resume(text, name=None):
     """
     Extract skills but ignore the top header where name/contact typically appears,
     and also remove any skills that accidentally match the candidate's name.
     """
-    lines = text.strip().split('\n')
-    # ignore top lines (first 6) to avoid name leaking in skills
-    body = '\n'.join(lines[6:]) if len(lines) > 6 else text
-
-    found = []
-    for skill in FULL_SKILLS_LIST:
-        # use word boundary match to reduce partial matches
-        if re.search(r'\b' + re.escape(skill) + r'\b', body, re.IGNORECASE):
-            found.append(skill)
+    # the body skips the name/contact block (see ParsedDocument.body);
+    # single pass over it with word-boundary matching (see common/skill_matcher.py)
+    found = SKILL_MATCHER.find(document(text).body)
 
     # Remove any found that are part of the candidate name
     if name:
         for token in name.split():
-            found = [s for s in found if token.lower() not in s.lower()]
+            found = {s for s in found if token.lower() not in s.lower()}
 
     # Final cleaning: unique, preserve original casing from list
-    unique_found = []
-    for s in FULL_SKILLS_LIST:
-        if s in found and s not in unique_found:
-            unique_found.append(s)
-    return unique_found
+    return [s for s in SKILL_MATCHER.skills if s in found]
 
 # ===================== EDUCATION EXTRACTION ===========================
 # Degree normalization map (regex pattern -> normalized label)
@@ -382,14 +387,35 @@ FIELD_KEYWORDS = [
 
 INSTITUTION_PATTERNS = [r'\bUniversity\b', r'\bInstitute\b', r'\bCollege\b', r'\bSchool\b', r'\bInstitute of\b', r'\bUniversity of\b']
 
+# One scan per entry: the first listed degree/institution pattern found wins,
+# and the earliest listed field keyword present (see common/pattern_bank.py)
+DEGREE_MATCHER = PATTERNS.first_of(
+    'education.degree', DEGREE_PATTERNS.items(), re.I, guard=r'\b(?=[bmpdchs1])'  # first character of every degree
+)
+MS_PATTERN = PATTERNS.pattern('education.ms', r'\bms\b', re.I)
+# The name is group 1. The leftmost match always starts at the first capital
+# of a run of name characters, so each pattern starts at a run and skips to
+# that capital: tried from every capital, a long run without the keyword took
+# time quadratic in its length.
+INSTITUTION_MATCHER = PATTERNS.first_of('education.institution', [
+    (r'(?<![A-Za-z&.\s\-,])[a-z&.\s\-,]*([A-Z][A-Za-z&\.\s\-\,]{3,}' + pat.replace(r'\b', '') + ')', None)
+    for pat in INSTITUTION_PATTERNS
+], guard=r'(?<![A-Za-z&.\s\-,])')  # where a run of name characters starts
+FIELD_MATCHER = PATTERNS.keywords('education.field', FIELD_KEYWORDS)
+ENTRY_SPLIT_PATTERN = PATTERNS.pattern('education.entry_split', r'\n|\r|;|·|•|\|| -{2,} | – | — |, (?=[A-Z])')
+NOT_EDUCATION_PATTERN = PATTERNS.pattern(
+    'education.not_education', r'project|internship|certificat|responsibilit|experience|objective|summary|skills', re.I
+)
+FIELD_PATTERN = PATTERNS.pattern('education.field_phrase', r'\b(?:in|of)\s+([A-Za-z &\.\-\/]{2,40})', re.I)
+YEAR_PATTERN = PATTERNS.pattern('education.year', r'\b(19|20)\d{2}\b')
+
 def normalize_degree_from_text(s):
     """Try to find a normalized degree label from text snippet s"""
-    s_lower = s.lower()
-    for pat, label in DEGREE_PATTERNS.items():
-        if re.search(pat, s_lower, re.I):
-            return label
+    hit = DEGREE_MATCHER.search(s)
+    if hit:
+        return hit[0]
     # Additionally detect short forms like 'ms in finance' -> 'M.Sc./M.S.'
-    if re.search(r'\bms\b', s_lower) and 'finance' in s_lower:
+    if MS_PATTERN.search(s) and 'finance' in s.lower():
         return 'M.Sc./M.S.'
     return None
 
@@ -397,11 +423,10 @@ def extract_institution(candidate):
     """Try to extract institution name from candidate string if present"""
     # Look for " | University..." or "University of X" or ", Northwestern University"
     # Return the institution substring cleaned
-    for pat in INSTITUTION_PATTERNS:
-        m = re.search(r'([A-Z][A-Za-z&\.\s\-\,]{3,}'+pat.replace(r'\b','')+')', candidate)
-        if m:
-            inst = m.group(0).strip(' ,|')
-            return re.sub(r'\s{2,}',' ', inst)
+    hit = INSTITUTION_MATCHER.search(candidate)
+    if hit:
+        inst = hit[2][0].strip(' ,|')
+        return re.sub(r'\s{2,}',' ', inst)
     # fallback: look for capitalized phrase after '|' or after degree
     if '|' in candidate:
         parts = [p.strip() for p in candidate.split('|') if p.strip()]
@@ -417,20 +442,23 @@ def extract_education_from_resume(text):
     2) scanning the whole text with stricter patterns if section not found.
     Returns a list of friendly strings like "M.S. in Finance | Northwestern University (2017)"
     """
-    raw_section = get_section_text(text, header_names=['education', 'academic qualifications', 'educational qualifications'], stop_headers=['professional experience','work experience','skills','certifications','projects','publications'])
+    doc = document(text)
+    text = doc.text
+    raw_section = doc.section('education', limit=800)
+    raw_section = raw_section.strip() if raw_section else None
 
     candidates = []
     if raw_section:
         # split candidate entries by separators frequently used in resumes
-        pieces = re.split(r'\n|\r|;|·|•|\|| -{2,} | – | — |, (?=[A-Z])', raw_section)
+        pieces = ENTRY_SPLIT_PATTERN.split(raw_section)
         for p in pieces:
             p = p.strip()
             if len(p) >= 4:
                 candidates.append(p)
     else:
         # fallback: search the whole text for degree patterns and capture surrounding words (up to 80 chars)
-        for pat in DEGREE_PATTERNS.keys():
-            for m in re.finditer(pat, text, re.I):
+        for pat in DEGREE_MATCHER.members:
+            for m in pat.finditer(text):
                 start = max(0, m.start()-50)
                 end = min(len(text), m.end()+100)
                 snippet = text[start:end].strip()
@@ -441,34 +469,32 @@ def extract_education_from_resume(text):
     for cand in candidates:
         cand_clean = re.sub(r'\s+', ' ', cand).strip()
         # Avoid generic lines that are obviously not education
-        if len(cand_clean) < 4 or re.search(r'project|internship|certificat|responsibilit|experience|objective|summary|skills', cand_clean, re.I):
+        if len(cand_clean) < 4 or NOT_EDUCATION_PATTERN.search(cand_clean):
             continue
 
         degree_label = normalize_degree_from_text(cand_clean)
         # Try to extract field (explicit 'in <field>' or known field keywords)
         field = None
-        m_field = re.search(r'\b(?:in|of)\s+([A-Za-z &\.\-\/]{2,40})', cand_clean, re.I)
+        m_field = FIELD_PATTERN.search(cand_clean)
         if m_field:
             candidate_field = m_field.group(1).strip(' ,.')
             # check if candidate_field contains one of the known fields
-            for fk in FIELD_KEYWORDS:
-                if fk in candidate_field.lower() or fk in cand_clean.lower():
-                    field = candidate_field.title()
-                    break
+            # (candidate_field is part of cand_clean, so checking cand_clean covers both)
+            if FIELD_MATCHER.first(cand_clean):
+                field = candidate_field.title()
             if not field:
                 # still accept it if it's reasonably short and alphabetic
                 if 2 <= len(candidate_field) <= 30 and re.search(r'[A-Za-z]', candidate_field):
                     field = candidate_field.title()
         else:
             # search known field keywords
-            for fk in FIELD_KEYWORDS:
-                if fk in cand_clean.lower():
-                    field = fk.title()
-                    break
+            fk = FIELD_MATCHER.first(cand_clean)
+            if fk:
+                field = fk.title()
 
         institution = extract_institution(cand_clean)
         # Extract year if present
-        year_match = re.search(r'\b(19|20)\d{2}\b', cand_clean)
+        year_match = YEAR_PATTERN.search(cand_clean)
         year = year_match.group(0) if year_match else None
 
         # Build normalized entry
@@ -517,15 +543,17 @@ def pred():
         else:
             return render_template('resumes.html', message="Invalid file format. Please upload PDF or TXT.")
 
+        doc = document(text)  # one set of derived views for every extractor
+
         # predictions (unchanged)
-        predicted_category = predict_category(text)
+        predicted_category = predict_category(doc)
 
         # parsing
-        name = extract_name_from_resume(text)
-        email = extract_email_from_resume(text)
-        phone = extract_contact_number_from_resume(text)
-        extracted_education = extract_education_from_resume(text)
-        extracted_skills = extract_skills_from_resume(text, name=name)
+        name = extract_name_from_resume(doc)
+        email = extract_email_from_resume(doc)
+        phone = extract_contact_number_from_resume(doc)
+        extracted_education = extract_education_from_resume(doc)
+        extracted_skills = extract_skills_from_resume(doc, name=name)
 
         return render_template(
             'resumes.html',
@@ -552,15 +580,17 @@ def api_parse():
         else:
             return render_template('resumes.html', message="Invalid file format. Please upload PDF or TXT.")
 
+        doc = document(text)  # one set of derived views for every extractor
+
         # predictions (unchanged)
-        predicted_category = predict_category(text)
+        predicted_category = predict_category(doc)
 
         # parsing
-        name = extract_name_from_resume(text)
-        email = extract_email_from_resume(text)
-        phone = extract_contact_number_from_resume(text)
-        extracted_education = extract_education_from_resume(text)
-        extracted_skills = extract_skills_from_resume(text, name=name)
+        name = extract_name_from_resume(doc)
+        email = extract_email_from_resume(doc)
+        phone = extract_contact_number_from_resume(doc)
+        extracted_education = extract_education_from_resume(doc)
+        extracted_skills = extract_skills_from_resume(doc, name=name)
     
     return jsonify({
         'name': name,
@@ -571,5 +601,51 @@ def api_parse():
         'education': extracted_education
     })
 
+@app.route('/api/categorize-batch', methods=['POST'])
+def api_categorize_batch():
+    payload = request.get_json(silent=True)
+    texts = payload.get('texts') if isinstance(payload, dict) else None
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return jsonify({'error': "'texts' must be a list of strings"}), 400
+    if len(texts) > BATCH_MAX_TEXTS:
+        return jsonify({'error': f"At most {BATCH_MAX_TEXTS} texts per request"}), 413
+    try:
+        top = int(payload.get('top', 3))
+    except (TypeError, ValueError):
+        return jsonify({'error': "'top' must be an integer"}), 400
+
+    started = time.perf_counter()
+    results = categorize_batch(texts, top)
+    took = time.perf_counter() - started
+    return jsonify({
+        'model': categorization_model.current_version(),
+        'count': len(results),
+        'results': results,
+        'took_ms': round(took * 1000, 1),
+        'docs_per_sec': round(len(results) / took) if took and results else None,
+    })
+
+@app.errorhandler(ModelLoadError)
+def model_load_error(e):
+    app.logger.error(f"Categorization model unavailable: {e}")
+    return jsonify({'error': 'Categorization model is unavailable'}), 503
+
+@app.route('/api/models/categorization')
+def categorization_model_stats():
+    return jsonify(categorization_model.stats())
+
+@app.route('/api/models/categorization/swap', methods=['POST'])
+def swap_categorization_model():
+    # Requests keep using the live model while the new one loads and validates
+    try:
+        model = categorization_model.swap(request.form.get('version') or None)
+    except ModelLoadError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'active': model.describe(), 'swaps': categorization_model.swaps})
+
+@app.route('/api/patterns/stats')
+def pattern_stats():
+    return jsonify(PATTERNS.stats())
+
 if __name__ == '__main__':
     app.run(debug=True)